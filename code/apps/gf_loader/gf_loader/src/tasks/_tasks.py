@@ -186,15 +186,23 @@ class PopulateMasterTask(luigi.Task):
         # Write recotds
         rec_count = 0
         err_count = 0
-        for _, record in records.items():
+        pending = list(records.values())
+        for start in range(0, len(pending), ds.BULK_BATCH_SIZE):
+            batch = pending[start:start + ds.BULK_BATCH_SIZE]
             try:
-                record.metadata.init_for_insert()
-                store.insert(record)
-                rec_count += 1
+                for record in batch:
+                    record.metadata.init_for_insert()
+                result = store.insert_many(batch)
             except Exception as e:
-                logger.error(f"Failed to write master record {record.ticker} - {e}")
-                err_count += 1
+                logger.error(f"Failed to write master records {batch[0].ticker} to {batch[-1].ticker} - {e}")
+                err_count += len(batch)
                 continue
+
+            for ticker, error in result.errors().items():
+                logger.error(f"Failed to write master record {ticker} - {error}")
+
+            rec_count += len(result.inserted)
+            err_count += len(result.duplicates) + len(result.failures)
         log_activity(f"Master records written: {rec_count}, errors: {err_count}")
         self.set_status_message(f"Master records written: {rec_count}, errors: {err_count}")
 
@@ -289,17 +297,19 @@ class LoadCikCodesTask(luigi.Task):
         ctrl_store = ds.TaskTrackingDatastore(database)
 
         tickers = store.get_tickers()
-        sec_map = svc.get_sec_map(self.sec_url)
+        cache_folder = utils.find_data_folder(__file__).joinpath('cache')
+        sec_index = svc.get_sec_index(self.sec_url, cache_folder)
 
         rec_count = 0
         err_count = 0
         total_count = len(tickers)
         processed_count = 0
 
-        for item in sec_map:
-            self.set_status_message("Processing CIK codes...")
+        self.set_status_message("Processing CIK codes...")
+        for ticker in tickers:
+            item = sec_index.get(ticker)
 
-            if item.ticker in tickers:
+            if item:
                 try:
                     store.update_cik(item.ticker, item.cik_str)
                     rec_count += 1
@@ -307,11 +317,8 @@ class LoadCikCodesTask(luigi.Task):
                     logger.error(f"Failed to update CIK for ticker: {item.ticker} - {e}")
                     err_count += 1
 
-                processed_count += 1
-                self.set_progress_percentage(min(math.floor(100 * (processed_count / total_count)), 100))
-
-                if processed_count == total_count:
-                    break
+            processed_count += 1
+            self.set_progress_percentage(min(math.floor(100 * (processed_count / total_count)), 100))
 
         if rec_count > 0:
             ctrl_store.update_cik_flag(True)
@@ -312,19 +312,19 @@ function create_income_statement(db) {
                     bsonType: 'string'
                   },
                   value_1: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_2: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_3: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_4: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_5: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   }
                 }
               }
@@ -382,19 +382,19 @@ function create_cash_flow_statement(db) {
                     bsonType: 'string'
                   },
                   value_1: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_2: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_3: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_4: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_5: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   }
                 }
               }
@@ -452,19 +452,19 @@ function create_balance_sheet_statement(db) {
                     bsonType: 'string'
                   },
                   value_1: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_2: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_3: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_4: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_5: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   }
                 }
               }
@@ -522,19 +522,19 @@ function create_earnings_statement(db) {
                     bsonType: 'string'
                   },
                   value_1: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_2: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_3: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_4: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   },
                   value_5: {
-                    bsonType: 'string'
+                    bsonType: ['string', 'int', 'long', 'decimal', 'null']
                   }
                 }
               }
@@ -0,0 +1,107 @@
+# *******************************************************************************************
+#  File:  load_benchmark.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+# Compares building the models from database documents with Model(**document), which runs the validators
+# and converters, against the trusted Model.from_document path used by the datastores.
+# Run from code/libs/gf_lib: python -m benchmarks.load_benchmark
+
+from datetime import datetime
+from enum import Enum
+from typing import Callable
+import timeit
+import attrs
+import gf_lib.model as model
+
+_ROUNDS: int = 5
+
+
+def _to_document(value) -> dict:
+    """
+    This function returns the document the datastore would read back for the record, enums are stored
+    as their values
+    """
+    return attrs.asdict(value, value_serializer=lambda _, __, item: item.value if isinstance(item, Enum) else item)
+
+
+def _statement() -> model.IncomeStatement:
+    items = [model.AccountingEntry(f"tag{index}", *[str(index * 1_000 + period) for period in range(5)])
+             for index in range(60)]
+    return model.IncomeStatement('IBM', model.PeriodType.Annual, items)
+
+
+def _sector() -> model.GICSSector:
+    sub_industries = [model.GICSSubIndustry(10_101_010 + index, f"Sub Industry {index}") for index in range(4)]
+    industries = [model.GICSIndustry(101_010 + index, f"Industry {index}", list(sub_industries)) for index in range(3)]
+    return model.GICSSector(10, 'Energy', [model.GICSGroupIndustry(1_010, 'Energy', industries)])
+
+
+def _validated_statement(document: dict) -> model.IncomeStatement:
+    return model.IncomeStatement(**{**document, 'items': [model.AccountingEntry(**item) for item in document['items']]})
+
+
+def _validated_sector(document: dict) -> model.GICSSector:
+    groups = list()
+    for group in document['group_industries']:
+        industries = [model.GICSIndustry(industry['id'], industry['name'],
+                                         [model.GICSSubIndustry(**item) for item in industry['sub_industries']])
+                      for industry in group['industries']]
+        groups.append(model.GICSGroupIndustry(group['id'], group['name'], industries))
+
+    return model.GICSSector(**{**document, 'group_industries': groups})
+
+
+def _samples() -> dict[str, tuple[Callable[[dict], object], Callable[[dict], object], dict]]:
+    """
+    This function returns, per model, the validated constructor, the trusted constructor and a document
+    """
+    master = model.Master('IBM', 'International Business Machines', '51143', 'BBG000BLNNH6', 'IT Consulting',
+                          [model.IndexType.SP500, model.IndexType.SP100])
+    company = model.Company('IBM', 'International Business Machines', 'Description', '0000051143', '000000051143',
+                            'NYSE', 'USD', 'USA', 'IT Consulting', '1 New Orchard Road', 'December', '2022-03-31')
+    earnings = model.Earnings('IBM', 'International Business Machines', datetime(2022, 7, 18), datetime(2022, 6, 30),
+                              '2.27')
+
+    return {
+        'Master': (lambda document: model.Master(**document), model.Master.from_document, _to_document(master)),
+        'Company': (lambda document: model.Company(**document), model.Company.from_document, _to_document(company)),
+        'IncomeStatement (60 lines)': (_validated_statement, model.IncomeStatement.from_document,
+                                       _to_document(_statement())),
+        'GICSSector (12 sub industries)': (_validated_sector, model.GICSSector.from_document,
+                                           _to_document(_sector())),
+        'Earnings': (lambda document: model.Earnings(**document), model.Earnings.from_document,
+                     _to_document(earnings)),
+    }
+
+
+def _best(function: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=_ROUNDS)) / number
+
+
+def main(number: int = 2_000) -> None:
+    print(f"{'model':32} {'validated':>12} {'trusted':>12} {'speed up':>10}")
+
+    for name, (validate, trust, document) in _samples().items():
+        assert validate(document) == trust(document)
+
+        validated = _best(lambda: validate(document), number)
+        trusted = _best(lambda: trust(document), number)
+        print(f"{name:32} {validated * 1e6:10.1f}us {trusted * 1e6:10.1f}us {validated / trusted:9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -19,7 +19,10 @@ __all__ = ['MasterDatastore', 'GicsSectorDatastore', 'CompanyDatastore', 'CashFl
            'IncomeDatastore', 'EarningsDatastore', 'TaskTrackingDatastore', 'database_exists', 'create_database',
            'drop_database', 'collection_exists', 'drop_collection', 'get_master_list_validator',
            'get_task_control_validator', 'create_master_list', 'create_task_control', 'create_gics',
-           'EarningsFileDatastore']
+           'EarningsFileDatastore', 'BsonPolicy', 'get_serializer', 'to_document', 'from_bson', 'decode_entry',
+           'decode_statement',
+           'DocumentView', 'StatementView', 'BulkInsertResult', 'BulkInsertMixin', 'insert_bulk',
+           'BULK_BATCH_SIZE', 'DUPLICATE_KEY_CODE']
 
 from ._master import *
 from ._gics_sector import *
@@ -28,3 +31,6 @@ from ._statement import *
 from ._task_control import *
 from ._datastore_utils import *
 from ._earnings import *
+from ._serializers import *
+from ._views import *
+from ._bulk import *
@@ -0,0 +1,135 @@
+# *******************************************************************************************
+#  File:  _bulk.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['BulkInsertResult', 'BulkInsertMixin', 'insert_bulk', 'BULK_BATCH_SIZE', 'DUPLICATE_KEY_CODE']
+
+from itertools import islice
+from typing import Any, Callable, Iterable
+import attrs
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
+from gf_lib.errors import DatastoreError, DuplicateRecordError
+from ._serializers import to_document
+
+DUPLICATE_KEY_CODE: int = 11000
+BULK_BATCH_SIZE: int = 500
+
+
+@attrs.define
+class BulkInsertResult:
+    """
+    Holds the outcome of a bulk insert per record key, the keys inserted, those already in the collection,
+    those the database rejected and those skipped before the write because they failed validation, the
+    last two with their error message
+    """
+    inserted: list[str] = attrs.Factory(list)
+    duplicates: list[str] = attrs.Factory(list)
+    failures: dict[str, str] = attrs.Factory(dict)
+    skipped: dict[str, str] = attrs.Factory(dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.duplicates and not self.failures and not self.skipped
+
+    def error(self, key: str) -> DatastoreError | None:
+        """
+        This function returns the error insert would have raised for the record, a DuplicateRecordError for
+        a duplicate key
+        """
+        if key in self.failures:
+            return DatastoreError(self.failures[key])
+
+        if key in self.skipped:
+            return DatastoreError(self.skipped[key])
+
+        if key in self.duplicates:
+            return DuplicateRecordError(key)
+
+    def errors(self) -> dict[str, DatastoreError]:
+        errors = {key: DuplicateRecordError(key) for key in self.duplicates}
+        errors.update({key: DatastoreError(message) for key, message in self.skipped.items()})
+        errors.update({key: DatastoreError(message) for key, message in self.failures.items()})
+        return errors
+
+
+def _insert_batch(collection: Collection, keys: list[str], documents: list[dict], result: BulkInsertResult) -> None:
+    """
+    This function writes one batch unordered, so a rejected document does not stop the rest, and records
+    the outcome of each key
+    """
+    try:
+        collection.insert_many(documents, ordered=False)
+    except BulkWriteError as e:
+        rejected = set()
+        for error in e.details.get('writeErrors', []):
+            key = keys[error['index']]
+            rejected.add(error['index'])
+
+            if error['code'] == DUPLICATE_KEY_CODE:
+                result.duplicates.append(key)
+            else:
+                result.failures[key] = error['errmsg']
+
+        # A write concern error applies to the whole batch, the documents were written but not confirmed
+        concern_errors = e.details.get('writeConcernErrors', [])
+        accepted = [key for index, key in enumerate(keys) if index not in rejected]
+        if concern_errors:
+            message = f"Write concern not satisfied: {concern_errors[0]['errmsg']}"
+            result.failures.update({key: message for key in accepted})
+        else:
+            result.inserted.extend(accepted)
+    else:
+        result.inserted.extend(keys)
+
+
+def insert_bulk(collection: Collection, values: Iterable[Any], key: Callable[[Any], str],
+                serialize: Callable[[Any], dict], batch_size: int = BULK_BATCH_SIZE) -> BulkInsertResult:
+    """
+    This function inserts the records in batches of batch_size, one round trip per batch, and reports the
+    outcome per key. Errors other than rejected documents, e.g. a lost connection, are raised
+    """
+    if batch_size < 1:
+        raise ValueError(f"The batch size must be at least 1: {batch_size}")
+
+    result = BulkInsertResult()
+    values = iter(values)
+
+    while batch := list(islice(values, batch_size)):
+        _insert_batch(collection, [key(value) for value in batch], [serialize(value) for value in batch], result)
+
+    return result
+
+
+class BulkInsertMixin:
+    """
+    Adds insert_many to a datastore, the datastore names the key reported for each record and may override
+    how records are serialized
+    """
+    _collection: Collection
+
+    def _bulk_key(self, value: Any) -> str:
+        return value.ticker
+
+    def _bulk_document(self, value: Any) -> dict:
+        return to_document(value)
+
+    def insert_many(self, values: Iterable[Any], batch_size: int = BULK_BATCH_SIZE) -> BulkInsertResult:
+        """
+        This function inserts the records with unordered bulk writes of batch_size, reporting the outcome per
+        key instead of raising DuplicateRecordError, the error insert would raise is available from the result
+        """
+        return insert_bulk(self._collection, values, self._bulk_key, self._bulk_document, batch_size)
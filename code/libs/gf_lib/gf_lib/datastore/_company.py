@@ -17,16 +17,19 @@ __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['CompanyDatastore']
 
-from attrs import asdict
+from typing import Iterable, Iterator
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.results import InsertManyResult
 from pymongo.errors import DuplicateKeyError
 from gf_lib.model import Company
 from gf_lib.errors import DuplicateRecordError
+from ._serializers import to_document
+from ._bulk import BulkInsertMixin
+from ._views import DocumentView, find_view, find_views
 
 
-class CompanyDatastore:
+class CompanyDatastore(BulkInsertMixin):
     _collection: Collection
 
     def __init__(self, database: Database) -> None:
@@ -34,7 +37,7 @@ class CompanyDatastore:
 
     def insert(self, value: Company) -> bool:
         try:
-            results: InsertManyResult = self._collection.insert_one(asdict(value))
+            results: InsertManyResult = self._collection.insert_one(to_document(value))
         except DuplicateKeyError:
             raise DuplicateRecordError(value.ticker)
         else:
@@ -44,7 +47,19 @@ class CompanyDatastore:
         raw_data = self._collection.find_one({'ticker': ticker}, {'_id': 0})
 
         if raw_data:
-            return Company(**raw_data)
+            return Company.from_document(raw_data)
+
+    def get_view(self, ticker: str) -> DocumentView | None:
+        """
+        This function returns a lazy view of the record, the fields are decoded when read
+        """
+        return find_view(self._collection, Company, {'ticker': ticker})
+
+    def scan(self, fields: Iterable[str] | None = None) -> Iterator[DocumentView]:
+        """
+        This function yields a lazy view of every record, limited to the given fields if any
+        """
+        return find_views(self._collection, Company, None, fields)
 
     def clear(self) -> None:
         self._collection.delete_many({})
@@ -17,16 +17,17 @@ __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['EarningsFileDatastore']
 
-from attrs import asdict
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.results import InsertManyResult, DeleteResult
 from pymongo.errors import DuplicateKeyError
-from gf_lib.model import Earnings
+from gf_lib.model import Earnings, EarningsBatch
 from gf_lib.errors import DuplicateRecordError
+from ._serializers import to_document
+from ._bulk import BulkInsertMixin, BulkInsertResult
 
 
-class EarningsFileDatastore:
+class EarningsFileDatastore(BulkInsertMixin):
     _collection: Collection
 
     def __init__(self, database: Database) -> None:
@@ -34,17 +35,41 @@ class EarningsFileDatastore:
 
     def insert(self, value: Earnings) -> bool:
         try:
-            results: InsertManyResult = self._collection.insert_one(asdict(value))
+            results: InsertManyResult = self._collection.insert_one(to_document(value))
         except DuplicateKeyError:
             raise DuplicateRecordError(value.ticker)
         else:
             return results.acknowledged
 
+    def insert_batch(self, batch: EarningsBatch) -> BulkInsertResult:
+        """
+        This function inserts a chunk of the earnings calendar in one unordered round trip. Each row goes
+        through the Earnings validators, rows without dates or failing validation are reported as skipped
+        and tickers already in the collection as duplicates
+        """
+        records = list()
+        skipped = dict()
+        for ticker, name, report_date, fiscal_year, estimate, currency in zip(
+                batch.tickers, batch.names, batch.report_dates, batch.fiscal_years, batch.estimates,
+                batch.currencies):
+            if not report_date or not fiscal_year:
+                skipped[ticker] = 'The report date or fiscal year is missing'
+                continue
+
+            try:
+                records.append(Earnings(ticker, name, report_date, fiscal_year, estimate, currency))
+            except (TypeError, ValueError) as e:
+                skipped[ticker] = str(e.args[0] if e.args else e)
+
+        result = self.insert_many(records, max(len(records), 1))
+        result.skipped.update(skipped)
+        return result
+
     def get(self, ticker: str) -> Earnings | None:
         raw_data = self._collection.find_one({'ticker': ticker}, {'_id': 0})
 
         if raw_data:
-            return Earnings(**raw_data)
+            return Earnings.from_document(raw_data)
 
     def clear(self) -> bool:
         result: DeleteResult = self._collection.delete_many({})
@@ -17,16 +17,17 @@ __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['GicsSectorDatastore']
 
-from attrs import asdict
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.results import InsertManyResult
 from pymongo.errors import DuplicateKeyError
-from gf_lib.model import GICSSector
+from gf_lib.model import GICSSector, GicsIndex
 from gf_lib.errors import DuplicateRecordError
+from ._serializers import to_document
+from ._bulk import BulkInsertMixin
 
 
-class GicsSectorDatastore:
+class GicsSectorDatastore(BulkInsertMixin):
     _collection: Collection
 
     def __init__(self, database: Database) -> None:
@@ -34,23 +35,32 @@ class GicsSectorDatastore:
 
     def insert(self, value: GICSSector) -> bool:
         try:
-            results: InsertManyResult = self._collection.insert_one(asdict(value))
+            results: InsertManyResult = self._collection.insert_one(to_document(value))
         except DuplicateKeyError:
             raise DuplicateRecordError(value.name)
         else:
             return results.acknowledged
 
+    def _bulk_key(self, value: GICSSector) -> str:
+        return value.name
+
     def get(self, sector: str) -> GICSSector | None:
         raw_data = self._collection.find_one({'name': sector}, {'_id': 0})
 
         if raw_data:
-            return GICSSector(**raw_data)
+            return GICSSector.from_document(raw_data)
 
     def get_all(self) -> list[GICSSector] | None:
         raw_data = self._collection.find({}, {'_id': 0})
 
         if raw_data:
-            return [GICSSector(**row) for row in raw_data]
+            return [GICSSector.from_document(row) for row in raw_data]
+
+    def get_index(self) -> GicsIndex:
+        """
+        This function loads the whole classification into an index for lookups by id or name
+        """
+        return GicsIndex.from_sectors(GICSSector.from_document(row) for row in self._collection.find({}, {'_id': 0}))
 
     def clear(self) -> None:
         self._collection.delete_many({})
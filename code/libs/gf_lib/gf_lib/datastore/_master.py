@@ -17,17 +17,20 @@ __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['MasterDatastore']
 
-from attrs import asdict
+from typing import Iterable, Iterator
 from pymongo.collection import Collection
 from pymongo.cursor import Cursor
 from pymongo.database import Database
 from pymongo.results import InsertManyResult, DeleteResult, UpdateResult
 from pymongo.errors import DuplicateKeyError
-from gf_lib.model import Master
+from gf_lib.model import Master, GicsIndex, UniverseIndex
 from gf_lib.errors import DuplicateRecordError
+from ._serializers import to_document
+from ._bulk import BulkInsertMixin
+from ._views import DocumentView, find_view, find_views
 
 
-class MasterDatastore:
+class MasterDatastore(BulkInsertMixin):
     _collection: Collection
 
     def __init__(self, database: Database) -> None:
@@ -35,7 +38,7 @@ class MasterDatastore:
 
     def insert(self, value: Master) -> bool:
         try:
-            results: InsertManyResult = self._collection.insert_one(asdict(value))
+            results: InsertManyResult = self._collection.insert_one(to_document(value))
         except DuplicateKeyError:
             raise DuplicateRecordError(value.ticker)
         else:
@@ -45,7 +48,19 @@ class MasterDatastore:
         raw_data = self._collection.find_one({'ticker': ticker}, {'_id': 0})
 
         if raw_data:
-            return Master(**raw_data)
+            return Master.from_document(raw_data)
+
+    def get_view(self, ticker: str) -> DocumentView | None:
+        """
+        This function returns a lazy view of the record, the fields are decoded when read
+        """
+        return find_view(self._collection, Master, {'ticker': ticker})
+
+    def scan(self, fields: Iterable[str] | None = None) -> Iterator[DocumentView]:
+        """
+        This function yields a lazy view of every record, limited to the given fields if any
+        """
+        return find_views(self._collection, Master, None, fields)
 
     def get_tickers(self) -> list[str] | None:
         cursor: Cursor = self._collection.find({},{'ticker': 1})
@@ -53,6 +68,17 @@ class MasterDatastore:
         if cursor:
             return [row['ticker'] for row in cursor]
 
+    def get_universe(self, gics: GicsIndex | None = None) -> UniverseIndex:
+        """
+        This function loads the index membership of every record into a universe index, only the ticker,
+        indexes and sub industry are read
+        """
+        universe = UniverseIndex(gics)
+        for row in self._collection.find({}, {'_id': 0, 'ticker': 1, 'indexes': 1, 'sub_industry': 1}):
+            universe.add_member(row['ticker'], row.get('indexes', []), row.get('sub_industry'))
+
+        return universe
+
     def update_cik(self, ticker: str, value: str) -> bool:
         record = self.get(ticker)
 
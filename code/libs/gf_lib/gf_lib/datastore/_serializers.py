@@ -0,0 +1,160 @@
+# *******************************************************************************************
+#  File:  _serializers.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['BsonPolicy', 'get_serializer', 'to_document', 'from_bson', 'decode_entry', 'decode_statement']
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from types import UnionType
+from typing import Any, Callable, Union, get_args, get_origin
+import threading
+import attrs
+from bson.decimal128 import Decimal128
+from bson.int64 import Int64
+
+
+def _enum_value(value: Enum) -> Any:
+    return value.value
+
+
+def _date_to_datetime(value: date) -> datetime:
+    """
+    This function converts a date to midnight of that day, BSON only has a datetime type
+    """
+    if isinstance(value, datetime) or value is None:
+        return value
+
+    return datetime.combine(value, time())
+
+
+def _to_decimal128(value: Any) -> Any:
+    """
+    This function converts a Decimal to its BSON type, fields declared as a union with Decimal may also
+    hold other values, which are returned as they are
+    """
+    return Decimal128(value) if type(value) is Decimal else value
+
+
+@attrs.frozen
+class BsonPolicy:
+    """
+    Holds how the serializers write the values BSON has no type for, by default enums are stored as their
+    value, dates as a datetime at midnight and decimals as Decimal128
+    """
+    enum: Callable[[Enum], Any] = _enum_value
+    date: Callable[[date], Any] = _date_to_datetime
+    decimal: Callable[[Decimal], Any] = _to_decimal128
+
+
+_DEFAULT_POLICY: BsonPolicy = BsonPolicy()
+_lock = threading.RLock()
+_serializers: dict[tuple[type, BsonPolicy], Callable[[Any], dict]] = dict()
+
+
+def _is_class(value: Any, base: type) -> bool:
+    return isinstance(value, type) and issubclass(value, base)
+
+
+def _expression(kind: Any, source: str, namespace: dict, policy: BsonPolicy) -> str:
+    """
+    This function returns the code that serializes the value held in source, given its declared type
+    """
+    if attrs.has(kind):
+        name = f"serialize_{kind.__name__}"
+        namespace[name] = get_serializer(kind, policy)
+        return f"{name}({source})"
+
+    if get_origin(kind) is list:
+        item_type = (get_args(kind) or (Any,))[0]
+        item = _expression(item_type, 'item', namespace, policy)
+        return source if item == 'item' else f"[{item} for item in {source}]"
+
+    if _is_class(kind, Enum):
+        return f"enum({source})"
+
+    if _is_class(kind, date) and not _is_class(kind, datetime):
+        return f"date({source})"
+
+    if kind is Decimal or (get_origin(kind) in (Union, UnionType) and Decimal in get_args(kind)):
+        return f"decimal({source})"
+
+    return source
+
+
+def _compile(cls: type, policy: BsonPolicy) -> Callable[[Any], dict]:
+    """
+    This function generates a function that returns the document for an instance of the class as a
+    single dict literal, nested records are serialized by their own generated functions
+    """
+    fields = attrs.fields(attrs.resolve_types(cls))
+    namespace: dict[str, Any] = {'enum': policy.enum, 'date': policy.date, 'decimal': policy.decimal}
+
+    entries = [f"'{field.name}': {_expression(field.type, f'value.{field.name}', namespace, policy)}"
+               for field in fields if field.init]
+    source = "def serialize(value):\n    return {" + ", ".join(entries) + "}\n"
+
+    exec(source, namespace)
+    return namespace['serialize']
+
+
+def get_serializer(cls: type, policy: BsonPolicy | None = None) -> Callable[[Any], dict]:
+    """
+    This function returns the serializer of the attrs class, generating it on first use
+    """
+    key = (cls, policy or _DEFAULT_POLICY)
+
+    serializer = _serializers.get(key)
+    if serializer is None:
+        with _lock:
+            serializer = _serializers.get(key)
+            if serializer is None:
+                serializer = _serializers[key] = _compile(cls, key[1])
+
+    return serializer
+
+
+def to_document(value: Any, policy: BsonPolicy | None = None) -> dict:
+    """
+    This function returns the BSON ready document for the record, the replacement for attrs.asdict
+    """
+    return get_serializer(type(value), policy)(value)
+
+
+def from_bson(value: Any) -> Any:
+    """
+    This function returns a value read from the database as a plain Python value, Decimal128 becomes Decimal
+    and Int64, which pymongo returns for numbers above the int32 range, becomes int
+    """
+    if isinstance(value, Decimal128):
+        return value.to_decimal()
+
+    return int(value) if type(value) is Int64 else value
+
+
+def decode_entry(document: dict) -> dict:
+    """
+    This function decodes the values of a stored statement line, ready for AccountingEntry.from_document
+    """
+    return {key: from_bson(value) for key, value in document.items()}
+
+
+def decode_statement(document: dict) -> dict:
+    """
+    This function decodes the values of every line of a stored statement, ready for its from_document
+    """
+    return {**document, 'items': [decode_entry(item) for item in document.get('items', ())]}
@@ -17,60 +17,159 @@ __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['CashFlowDatastore', 'BalanceSheetDatastore', 'IncomeDatastore', 'EarningsDatastore']
 
-from typing import TypeVar
-from attrs import asdict
+from typing import Any, Iterable, Iterator, TypeVar
+import attrs
+from pymongo import ReplaceOne
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.results import InsertManyResult
 from pymongo.errors import DuplicateKeyError
-from gf_lib.model import PeriodType, CashFlowStatement, BalanceSheetStatement, IncomeStatement, EarningsStatement
+from gf_lib.model import PeriodType, CashFlowStatement, BalanceSheetStatement, IncomeStatement, EarningsStatement, \
+    ValueStorage
 from gf_lib.errors import DuplicateRecordError
+from ._serializers import to_document, from_bson, decode_statement
+from ._bulk import BulkInsertMixin, BULK_BATCH_SIZE
+from ._views import StatementView, find_view, find_views
 
 
 T = TypeVar("T")
 
-class _StatemetDatastore:
+_VALUE_COLUMNS: tuple[str, ...] = ('value_1', 'value_2', 'value_3', 'value_4', 'value_5')
+
+
+class _StatemetDatastore(BulkInsertMixin):
+    """
+    Stores one type of statement. With ValueStorage.Numeric the values are written as int64, Decimal128 or
+    null, and with the default ValueStorage.Text as the text received. Switching a datastore to numeric
+    storage does not change the statements already in the collection, aggregate only includes values stored
+    as numbers, so a collection holding both forms is only partly aggregated until convert_to_numeric is run
+    """
     _collection: Collection
     _statement_class: T
+    _storage: ValueStorage
 
-    def __init__(self, database: Database, collection: str, statement_class: T) -> None:
+    def __init__(self, database: Database, collection: str, statement_class: T,
+                 storage: ValueStorage = ValueStorage.Text) -> None:
         self._collection = database[collection]
         self._statement_class = statement_class
+        self._storage = storage
+
+    @property
+    def storage(self) -> ValueStorage:
+        return self._storage
+
+    def _prepare(self, value: T) -> T:
+        """
+        This function converts the lines of the statement to numbers when the datastore stores numeric values
+        """
+        if self._storage == ValueStorage.Numeric:
+            return attrs.evolve(value, items=[item.numeric() for item in value.items])
+
+        return value
 
     def insert(self, value: T) -> bool:
         try:
-            data = asdict(value)
+            data = to_document(self._prepare(value))
             results: InsertManyResult = self._collection.insert_one(data)
         except DuplicateKeyError:
             raise DuplicateRecordError(value.ticker)
         else:
             return results.acknowledged
 
+    def _bulk_key(self, value: T) -> str:
+        return f"{value.ticker}:{value.period_type.value}"
+
+    def _bulk_document(self, value: T) -> dict:
+        return to_document(self._prepare(value))
+
     def get(self, ticker: str, period: PeriodType) -> T | None:
         raw_data = self._collection.find_one({'ticker': ticker, 'period_type': period.value}, {'_id': 0})
 
         if raw_data:
-            return self._statement_class(**raw_data)
+            return self._statement_class.from_document(decode_statement(raw_data))
+
+    def get_view(self, ticker: str, period: PeriodType) -> StatementView | None:
+        """
+        This function returns a lazy view of the statement, the fields are decoded when read
+        """
+        return find_view(self._collection, self._statement_class, {'ticker': ticker, 'period_type': period.value},
+                         StatementView)
+
+    def scan(self, period: PeriodType | None = None, fields: Iterable[str] | None = None) -> Iterator[StatementView]:
+        """
+        This function yields a lazy view of every statement, optionally of one period type and limited to the
+        given fields, e.g. scan(PeriodType.Annual, ['ticker', 'items'])
+        """
+        query = {'period_type': period.value} if period else None
+        return find_views(self._collection, self._statement_class, query, fields, StatementView)
+
+    def aggregate(self, tag: str, period: PeriodType, column: str = 'value_1') -> dict[str, Any] | None:
+        """
+        This function computes, in the database, the count, total, average, minimum and maximum of a line
+        across the stored statements of the period type. Only values stored as numbers are included
+        """
+        if column not in _VALUE_COLUMNS:
+            raise ValueError(f"Unknown value column: {column}")
+
+        field = f"$items.{column}"
+        pipeline = [
+            {'$match': {'period_type': period.value, 'items.tag': tag}},
+            {'$unwind': '$items'},
+            {'$match': {'items.tag': tag, f"items.{column}": {'$type': 'number'}}},
+            {'$group': {'_id': None, 'count': {'$sum': 1}, 'total': {'$sum': field}, 'average': {'$avg': field},
+                        'minimum': {'$min': field}, 'maximum': {'$max': field}}},
+            {'$project': {'_id': 0}}
+        ]
+
+        result = next(iter(self._collection.aggregate(pipeline)), None)
+        if result is None:
+            return None
+
+        return {key: from_bson(value) for key, value in result.items()}
+
+    def convert_to_numeric(self, batch_size: int = BULK_BATCH_SIZE) -> int:
+        """
+        This function rewrites the statements stored as text with their values as numbers, the migration for
+        collections written before numeric storage was used. It returns the number of statements rewritten
+        """
+        requests = list()
+        count = 0
+
+        for document in self._collection.find({}):
+            statement = self._statement_class.from_document(decode_statement(document))
+            items = [item.numeric() for item in statement.items]
+            if items == statement.items:
+                continue
+
+            requests.append(ReplaceOne({'_id': document['_id']}, to_document(attrs.evolve(statement, items=items))))
+            if len(requests) >= batch_size:
+                count += self._collection.bulk_write(requests, ordered=False).modified_count
+                requests = list()
+
+        if requests:
+            count += self._collection.bulk_write(requests, ordered=False).modified_count
+
+        return count
 
     def clear(self) -> None:
         self._collection.delete_many({})
 
 
 class CashFlowDatastore(_StatemetDatastore):
-    def __init__(self, database: Database):
-        super().__init__(database, 'cash_flow_statement', CashFlowStatement)
+    def __init__(self, database: Database, storage: ValueStorage = ValueStorage.Text):
+        super().__init__(database, 'cash_flow_statement', CashFlowStatement, storage)
 
 
 class BalanceSheetDatastore(_StatemetDatastore):
-    def __init__(self, database: Database):
-        super().__init__(database, 'balance_sheet_statement', BalanceSheetStatement)
+    def __init__(self, database: Database, storage: ValueStorage = ValueStorage.Text):
+        super().__init__(database, 'balance_sheet_statement', BalanceSheetStatement, storage)
 
 
 class IncomeDatastore(_StatemetDatastore):
-    def __init__(self, database: Database):
-        super().__init__(database, 'income_statement', IncomeStatement)
+    def __init__(self, database: Database, storage: ValueStorage = ValueStorage.Text):
+        super().__init__(database, 'income_statement', IncomeStatement, storage)
 
 
 class EarningsDatastore(_StatemetDatastore):
-    def __init__(self, database: Database):
-        super().__init__(database, 'earnings_statement', EarningsStatement)
+    def __init__(self, database: Database, storage: ValueStorage = ValueStorage.Text):
+        super().__init__(database, 'earnings_statement', EarningsStatement, storage)
@@ -17,13 +17,13 @@ __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['TaskTrackingDatastore']
 
-from attrs import asdict
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.results import InsertManyResult, UpdateResult, DeleteResult
 from pymongo.errors import DuplicateKeyError
 from gf_lib.model import TaskTracking
 from gf_lib.errors import DuplicateRecordError
+from ._serializers import to_document
 
 
 class TaskTrackingDatastore:
@@ -34,7 +34,7 @@ class TaskTrackingDatastore:
 
     def insert(self, value: TaskTracking) -> bool:
         try:
-            results: InsertManyResult = self._collection.insert_one(asdict(value))
+            results: InsertManyResult = self._collection.insert_one(to_document(value))
         except DuplicateKeyError:
             raise DuplicateRecordError(value.sector)
         else:
@@ -0,0 +1,123 @@
+# *******************************************************************************************
+#  File:  _views.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['DocumentView', 'StatementView']
+
+from typing import Any, Iterable, Iterator
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo.collection import Collection
+from ._serializers import decode_statement
+
+_RAW_OPTIONS: CodecOptions = CodecOptions(document_class=RawBSONDocument)
+
+
+class DocumentView:
+    """
+    Holds a document read from the database as raw BSON, fields are decoded when they are accessed and
+    embedded documents stay raw until they are read. Values are returned as stored, e.g. enums as their
+    value. Call to_model for the full record
+    """
+    __slots__ = ('_raw', '_model_class', '_complete')
+
+    def __init__(self, raw: RawBSONDocument, model_class: type, complete: bool = True) -> None:
+        self._raw = raw
+        self._model_class = model_class
+        self._complete = complete
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._raw[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, name: str) -> Any:
+        return self._raw[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._raw
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._model_class.__name__}, {len(self._raw.raw)} bytes)"
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self._raw.get(name, default)
+
+    @property
+    def raw(self) -> RawBSONDocument:
+        return self._raw
+
+    def to_model(self):
+        """
+        This function converts the view to its model, only views read without a projection can be converted
+        """
+        if not self._complete:
+            raise ValueError(f"A projected view cannot be converted to {self._model_class.__name__}")
+
+        return self._model_class.from_document(self._raw)
+
+
+class StatementView(DocumentView):
+    """
+    Holds a statement read from the database as raw BSON, with lookup of single lines by tag
+    """
+    __slots__ = ()
+
+    def entry(self, tag: str) -> RawBSONDocument | None:
+        """
+        This function returns the stored line with the tag, only the tag of each line is decoded
+        """
+        for item in self._raw.get('items', ()):
+            if item['tag'] == tag:
+                return item
+
+    def values(self, tag: str) -> list | None:
+        item = self.entry(tag)
+        if item is not None:
+            return [item['value_1'], item['value_2'], item['value_3'], item['value_4'], item['value_5']]
+
+    def to_model(self):
+        if not self._complete:
+            raise ValueError(f"A projected view cannot be converted to {self._model_class.__name__}")
+
+        return self._model_class.from_document(decode_statement(self._raw))
+
+
+def raw_collection(collection: Collection) -> Collection:
+    return collection.with_options(codec_options=_RAW_OPTIONS)
+
+
+def find_views(collection: Collection, model_class: type, query: dict | None = None,
+               fields: Iterable[str] | None = None, view_class: type = DocumentView) -> Iterator[DocumentView]:
+    """
+    This function yields a view per matching document. With fields, only those fields are sent by the
+    server and the views cannot be converted to models
+    """
+    projection = {'_id': 0}
+    if fields is not None:
+        projection.update({field: 1 for field in fields})
+
+    for raw in raw_collection(collection).find(query or {}, projection):
+        yield view_class(raw, model_class, fields is None)
+
+
+def find_view(collection: Collection, model_class: type, query: dict,
+              view_class: type = DocumentView) -> DocumentView | None:
+    raw = raw_collection(collection).find_one(query, {'_id': 0})
+
+    if raw is not None:
+        return view_class(raw, model_class)
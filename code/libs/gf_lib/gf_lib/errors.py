@@ -15,8 +15,9 @@ __license__ = "MIT"
 __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
-__all__ = ['ApplicationError', 'DuplicateRecordError', 'RequestFailedError', 'RequestMaxFailedError',
-           'RequestResponseError', 'ApiFailedError']
+__all__ = ['ApplicationError', 'DatastoreError', 'DuplicateRecordError', 'RequestFailedError', 'RequestMaxFailedError',
+           'RequestResponseError', 'ApiFailedError', 'ApiThrottledError',
+           'ArchiveMissError']
 
 
 class ApplicationError(Exception):
@@ -52,3 +53,11 @@ class RequestResponseError(HttpError):
 
 class ApiFailedError(HttpError):
     pass
+
+
+class ApiThrottledError(ApiFailedError):
+    pass
+
+
+class ArchiveMissError(ApplicationError):
+    pass
@@ -17,7 +17,19 @@ __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['PeriodType', 'Months', 'Master', 'Company', 'FinancialItemAlphavantage',
            'FinancialStatementsAlphavantage', 'CompanyAlphavantage', 'AlphavantageData', 'EarningsAlphavantage',
-           'IncomeStatement', 'CashFlowStatement', 'BalanceSheetStatement', 'EarningsStatement', 'TaskTracking']
+           'IncomeStatement', 'CashFlowStatement', 'BalanceSheetStatement', 'EarningsStatement', 'TaskTracking',
+           'StatementMatrix', 'NumericBlock', 'convert_values',
+           'StatementBatch', 'convert_company_data', 'EarningsBatch',
+           'TagRegistry', 'get_tag_registry', 'intern_tag', 'build_trusted',
+           'parse_alphavantage_date', 'parse_date_value', 'parse_date_text', 'ValueStorage', 'parse_amount',
+           'GicsLevel', 'GicsNode', 'GicsIndex', 'UniverseIndex']
 
+from ._tags import *
+from ._trusted import *
+from ._dates import *
 from ._database import *
 from ._alphavantage import *
+from ._numeric import *
+from ._convert import *
+from ._gics import *
+from ._universe import *
@@ -10,25 +10,56 @@
 #
 # *******************************************************************************************
 
+from __future__ import annotations
+
 __author__ = "James Dooley"
 __license__ = "MIT"
 __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['FinancialItemAlphavantage', 'FinancialStatementsAlphavantage', 'CompanyAlphavantage', 'AlphavantageData',
-           'EarningsAlphavantage']
+           'EarningsAlphavantage', 'StatementMatrix', 'EarningsBatch']
 
+from array import array
+from datetime import datetime
+from typing import Iterator
+import math
 import attrs
+from ._tags import get_tag_registry, intern_tag
+
+# Shared by the numeric forms of the statements, Alpha Vantage sends "None" for a missing value and the
+# label lines hold text such as the fiscal date rather than amounts
+MISSING_VALUE: str = 'None'
+MISSING_VALUES: frozenset[str] = frozenset([MISSING_VALUE, '', '-'])
+LABEL_TAGS: frozenset[str] = frozenset(['fiscalDateEnding', 'reportedCurrency', 'reportedDate'])
 
 
 @attrs.define
 class FinancialItemAlphavantage:
+    """
+    Holds the values of one statement line, newest period first. The column_n properties give the
+    first five periods
+    """
     tag: str
-    column_1: str | None = attrs.field(default=None)
-    column_2: str | None = attrs.field(default=None)
-    column_3: str | None = attrs.field(default=None)
-    column_4: str | None = attrs.field(default=None)
-    column_5: str | None = attrs.field(default=None)
+    columns: list[str | None] = attrs.Factory(list)
+
+    @property
+    def tag_id(self) -> int:
+        return get_tag_registry().id_of(self.tag)
+
+    def get_column(self, index: int) -> str | None:
+        return self.columns[index] if index < len(self.columns) else None
+
+    def set_column(self, index: int, value: str | None) -> None:
+        if index >= len(self.columns):
+            self.columns.extend([None] * (index + 1 - len(self.columns)))
+        self.columns[index] = value
+
+    column_1 = property(lambda self: self.get_column(0), lambda self, value: self.set_column(0, value))
+    column_2 = property(lambda self: self.get_column(1), lambda self, value: self.set_column(1, value))
+    column_3 = property(lambda self: self.get_column(2), lambda self, value: self.set_column(2, value))
+    column_4 = property(lambda self: self.get_column(3), lambda self, value: self.set_column(3, value))
+    column_5 = property(lambda self: self.get_column(4), lambda self, value: self.set_column(4, value))
 
 
 @attrs.frozen
@@ -37,6 +68,102 @@ class FinancialStatementsAlphavantage:
     items: dict[str, FinancialItemAlphavantage] = attrs.Factory(dict)
 
 
+def _format_number(value: float) -> str:
+    if math.isnan(value):
+        return MISSING_VALUE
+
+    if value.is_integer() and abs(value) < 2 ** 53:
+        return str(int(value))
+
+    return repr(value)
+
+
+@attrs.frozen
+class StatementMatrix:
+    """
+    Holds the numeric lines of a set of statements as one float64 block, a row per tag and a column per
+    period with NaN where Alpha Vantage reports "None". Text lines such as the fiscal date are held in labels
+    """
+    ticker: str
+    tags: tuple[str, ...]
+    periods: int
+    values: array = attrs.field(repr=False)
+    labels: dict[str, tuple[str | None, ...]] = attrs.Factory(dict)
+    _rows: dict[str, int] = attrs.field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        object.__setattr__(self, '_rows', {tag: index for index, tag in enumerate(self.tags)})
+
+    @classmethod
+    def from_reports(cls, ticker: str, reports: list[dict]) -> StatementMatrix:
+        """
+        This function builds the matrix from the report objects of a statement payload, newest first,
+        in a single pass over the values
+        """
+        periods = len(reports)
+        rows: dict[str, array] = dict()
+        labels: dict[str, list[str | None]] = dict()
+
+        for period, report in enumerate(reports):
+            for tag, value in report.items():
+                label = labels.get(tag)
+                if label is not None:
+                    label[period] = value
+                    continue
+
+                if tag not in LABEL_TAGS:
+                    row = rows.get(tag)
+                    if row is None:
+                        tag = intern_tag(tag)
+                        row = rows[tag] = array('d', [math.nan]) * periods
+
+                    if value is None or value in MISSING_VALUES:
+                        continue
+
+                    try:
+                        row[period] = float(value)
+                        continue
+                    except (TypeError, ValueError):
+                        del rows[tag]
+                        label = [None if math.isnan(item) else _format_number(item) for item in row]
+                else:
+                    label = [None] * periods
+
+                label[period] = value
+                labels[intern_tag(tag)] = label
+
+        tags = tuple(rows)
+        values = array('d')
+        for tag in tags:
+            values.extend(rows[tag])
+
+        return cls(ticker, tags, periods, values, {tag: tuple(label) for tag, label in labels.items()})
+
+    def has_tag(self, tag: str) -> bool:
+        return tag in self._rows or tag in self.labels
+
+    def value(self, tag: str, period: int) -> float:
+        return self.values[self._rows[tag] * self.periods + period]
+
+    def row(self, tag: str) -> array:
+        start = self._rows[tag] * self.periods
+        return self.values[start:start + self.periods]
+
+    def to_statements(self) -> FinancialStatementsAlphavantage:
+        """
+        This function converts the matrix to the text based statements
+        """
+        statements = FinancialStatementsAlphavantage(self.ticker)
+
+        for tag, label in self.labels.items():
+            statements.items[tag] = FinancialItemAlphavantage(tag, list(label))
+
+        for tag in self.tags:
+            statements.items[tag] = FinancialItemAlphavantage(tag, [_format_number(value) for value in self.row(tag)])
+
+        return statements
+
+
 @attrs.define
 class CompanyAlphavantage:
     ticker: str
@@ -60,6 +187,33 @@ class EarningsAlphavantage:
     currency: str
 
 
+@attrs.frozen
+class EarningsBatch:
+    """
+    Holds a chunk of the earnings calendar column by column. The dates are converted to datetime, None
+    when blank, and the estimates are kept as text with their float values alongside, NaN when blank
+    """
+    tickers: list[str]
+    names: list[str]
+    report_dates: list[datetime | None]
+    fiscal_years: list[datetime | None]
+    estimates: list[str]
+    estimate_values: array = attrs.field(repr=False)
+    currencies: list[str]
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def rows(self) -> Iterator[EarningsAlphavantage]:
+        """
+        This function yields the rows of the chunk in the text form of the non-streaming parser
+        """
+        for ticker, name, report_date, fiscal_year, estimate, currency in zip(
+                self.tickers, self.names, self.report_dates, self.fiscal_years, self.estimates, self.currencies):
+            yield EarningsAlphavantage(ticker, name, report_date.date().isoformat() if report_date else '',
+                                       fiscal_year.date().isoformat() if fiscal_year else '', estimate, currency)
+
+
 @attrs.frozen
 class AlphavantageData:
     company: CompanyAlphavantage
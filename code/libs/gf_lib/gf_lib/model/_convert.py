@@ -0,0 +1,103 @@
+# *******************************************************************************************
+#  File:  _convert.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['StatementBatch', 'convert_company_data']
+
+from datetime import datetime
+from typing import Iterable
+import attrs
+from ._alphavantage import AlphavantageData, CompanyAlphavantage, FinancialStatementsAlphavantage
+from ._database import AccountingEntry, BalanceSheetStatement, CashFlowStatement, Company, DocumentMetadata, \
+    EarningsStatement, IncomeStatement, Master, PeriodType
+from ._tags import intern_tag
+from ._trusted import build_trusted
+
+_ENTRY_VALUES: int = 5
+
+
+@attrs.define
+class StatementBatch:
+    """
+    Holds the documents converted from the Alpha Vantage data of many tickers, a list per collection
+    ready for bulk insert, and the reason for each ticker whose company record failed validation. The
+    statements of such a ticker are still converted, they do not depend on the company record
+    """
+    companies: list[Company] = attrs.Factory(list)
+    income_statements: list[IncomeStatement] = attrs.Factory(list)
+    balance_sheets: list[BalanceSheetStatement] = attrs.Factory(list)
+    cash_flows: list[CashFlowStatement] = attrs.Factory(list)
+    earnings: list[EarningsStatement] = attrs.Factory(list)
+    errors: dict[str, str] = attrs.Factory(dict)
+
+
+def _metadata(now: datetime) -> DocumentMetadata:
+    return build_trusted(DocumentMetadata, 1, now, now)
+
+
+def _entries(statements: FinancialStatementsAlphavantage) -> list[AccountingEntry]:
+    """
+    This function converts the statement lines to accounting entries, keeping the first five periods
+    """
+    entries = list()
+    padding = [''] * _ENTRY_VALUES
+
+    for tag, item in statements.items.items():
+        values = [value if value is not None else '' for value in item.columns[:_ENTRY_VALUES]]
+        if len(values) < _ENTRY_VALUES:
+            values.extend(padding[len(values):])
+        entries.append(build_trusted(AccountingEntry, intern_tag(tag), *values))
+
+    return entries
+
+
+def _company(master: Master, value: CompanyAlphavantage, now: datetime) -> Company:
+    """
+    This function builds the company document, the text from Alpha Vantage goes through the usual validation
+    """
+    return Company(ticker=master.ticker, name=value.name, description=value.description, cik=master.cik,
+                   figi=master.figi, exchange=value.exchange, currency=value.currency, country=value.country,
+                   sub_industry=master.sub_industry, address=value.address, fiscal_year_end=value.fiscal_year_end,
+                   last_quarter=value.last_quarter, metadata=_metadata(now))
+
+
+def convert_company_data(values: Iterable[tuple[Master, AlphavantageData]]) -> StatementBatch:
+    """
+    This function converts the downloaded data of many tickers in one pass. The statement documents are
+    built from the validated master ticker and the parsed lines without re-running the attrs validators,
+    independently of whether the company record passes validation
+    """
+    batch = StatementBatch()
+    now = datetime.now()
+
+    for master, data in values:
+        ticker = master.ticker
+        try:
+            batch.companies.append(_company(master, data.company, now))
+        except (TypeError, ValueError) as e:
+            batch.errors[ticker] = str(e.args[0] if e.args else e)
+
+        for documents, statement_class, annual, quarter in (
+                (batch.income_statements, IncomeStatement, data.income_annual, data.income_quarter),
+                (batch.balance_sheets, BalanceSheetStatement, data.balance_sheet_annual, data.balance_sheet_quarter),
+                (batch.cash_flows, CashFlowStatement, data.cashflow_annual, data.cashflow_quarter),
+                (batch.earnings, EarningsStatement, data.earnings_annual, data.earnings_quarter)):
+            documents.append(build_trusted(statement_class, ticker, PeriodType.Annual, _entries(annual),
+                                           _metadata(now)))
+            documents.append(build_trusted(statement_class, ticker, PeriodType.Quarter, _entries(quarter),
+                                           _metadata(now)))
+
+    return batch
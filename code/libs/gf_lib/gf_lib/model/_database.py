@@ -19,19 +19,19 @@ __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['PeriodType', 'IndexType', 'Months', 'DocumentMetadata', 'Master', 'Company', 'AccountingEntry',
            'IncomeStatement', 'CashFlowStatement', 'BalanceSheetStatement', 'EarningsStatement',
-           'GICSSubIndustry', 'GICSIndustry', 'GICSGroupIndustry', 'GICSSector', 'TaskTracking', 'Earnings']
+           'GICSSubIndustry', 'GICSIndustry', 'GICSGroupIndustry', 'GICSSector', 'TaskTracking', 'Earnings',
+           'ValueStorage', 'parse_amount']
 
 from enum import Enum
 from datetime import datetime, date
-import pendulum
+from decimal import Decimal, InvalidOperation
 import attrs
 import attrs.validators as validators
-
-
-def parse_alphavantage_date(value: str | datetime) -> datetime:
-    if isinstance(value, datetime):
-        return value
-    return pendulum.parse(value, strict=False)
+from gf_lib.utils import intern_text
+from ._tags import get_tag_registry, intern_tag
+from ._trusted import build_trusted
+from ._dates import parse_alphavantage_date, parse_date_value
+from ._alphavantage import MISSING_VALUES
 
 
 class Months(str, Enum):
@@ -88,8 +88,10 @@ class DocumentMetadata:
     Holds metadata about a document stored in the database
     """
     lock_version: int = attrs.field(default=1, validator=[validators.instance_of(int), validators.gt(0)])
-    created_at: datetime = attrs.field(factory=datetime.now, validator=[validators.instance_of(datetime)])
-    updated_at: datetime = attrs.field(factory=datetime.now, validator=[validators.instance_of(datetime)])
+    created_at: datetime = attrs.field(factory=datetime.now, validator=[validators.instance_of(datetime)],
+                                       converter=parse_alphavantage_date)
+    updated_at: datetime = attrs.field(factory=datetime.now, validator=[validators.instance_of(datetime)],
+                                       converter=parse_alphavantage_date)
 
     def prep_for_update(self) -> None:
         self.lock_version += 1
@@ -110,15 +112,92 @@ class DocumentMetadata:
 
         return DocumentMetadata(**value)
 
+    @classmethod
+    def from_document(cls, document: dict) -> DocumentMetadata:
+        """
+        This function builds the metadata from a document read from the database, without validation
+        """
+        return build_trusted(cls, document['lock_version'], document['created_at'], document['updated_at'])
+
+
+class ValueStorage(str, Enum):
+    """
+    How the statement values are stored, as the text Alpha Vantage sends or as numbers (int64 or Decimal128
+    with explicit nulls) that the database can aggregate
+    """
+    Text = 'text'
+    Numeric = 'numeric'
+
+
+_INT64_MIN: int = -2 ** 63
+_INT64_MAX: int = 2 ** 63 - 1
+
+
+def parse_amount(value: str | int | Decimal | None) -> int | Decimal | None:
+    """
+    This function converts a statement value to an int when it is whole and fits in int64, to a Decimal
+    otherwise, and to None when it is missing. It raises a ValueError for text that is not a number
+    """
+    if value is None or type(value) is Decimal:
+        return value
+
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value if _INT64_MIN <= value <= _INT64_MAX else Decimal(value)
+
+    if not isinstance(value, str):
+        raise ValueError(f"Not an amount: {value!r}")
+
+    value = value.strip()
+    if value in MISSING_VALUES:
+        return None
+
+    try:
+        number = int(value)
+    except ValueError:
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            raise ValueError(f"Not an amount: {value}") from None
+
+    return number if _INT64_MIN <= number <= _INT64_MAX else Decimal(number)
+
+
+_ENTRY_VALUE_VALIDATOR = validators.instance_of((str, int, Decimal, type(None)))
+
 
 @attrs.frozen
 class AccountingEntry:
-    tag: str
-    value_1: str = attrs.field(default='', validator=[attrs.validators.instance_of(str)])
-    value_2: str = attrs.field(default='', validator=[attrs.validators.instance_of(str)])
-    value_3: str = attrs.field(default='', validator=[attrs.validators.instance_of(str)])
-    value_4: str = attrs.field(default='', validator=[attrs.validators.instance_of(str)])
-    value_5: str = attrs.field(default='', validator=[attrs.validators.instance_of(str)])
+    """
+    Holds a statement line, the values are text as received or, once converted by numeric, numbers
+    """
+    tag: str = attrs.field(converter=intern_tag)
+    value_1: str | int | Decimal | None = attrs.field(default='', validator=[_ENTRY_VALUE_VALIDATOR])
+    value_2: str | int | Decimal | None = attrs.field(default='', validator=[_ENTRY_VALUE_VALIDATOR])
+    value_3: str | int | Decimal | None = attrs.field(default='', validator=[_ENTRY_VALUE_VALIDATOR])
+    value_4: str | int | Decimal | None = attrs.field(default='', validator=[_ENTRY_VALUE_VALIDATOR])
+    value_5: str | int | Decimal | None = attrs.field(default='', validator=[_ENTRY_VALUE_VALIDATOR])
+
+    @property
+    def tag_id(self) -> int:
+        return get_tag_registry().id_of(self.tag)
+
+    def numeric(self) -> AccountingEntry:
+        """
+        This function returns the line with its values as numbers, lines holding text such as the
+        reported currency or a date are returned unchanged
+        """
+        try:
+            values = [parse_amount(value) for value in
+                      (self.value_1, self.value_2, self.value_3, self.value_4, self.value_5)]
+        except ValueError:
+            return self
+
+        return build_trusted(AccountingEntry, self.tag, *values)
+
+    @classmethod
+    def from_document(cls, document: dict) -> AccountingEntry:
+        return build_trusted(cls, intern_tag(document['tag']), document['value_1'], document['value_2'],
+                             document['value_3'], document['value_4'], document['value_5'])
 
 
 @attrs.frozen
@@ -137,6 +216,23 @@ class Master:
                                              validator=[validators.instance_of(DocumentMetadata)],
                                              converter=DocumentMetadata.parse)
 
+    @classmethod
+    def from_document(cls, document: dict) -> Master:
+        """
+        This function builds the record from a document read from the database, skipping the validators and
+        converters as the values were checked when the document was written
+        """
+        return build_trusted(cls, document['ticker'], document['name'], document['cik'], document['figi'],
+                             intern_text(document['sub_industry']),
+                             [IndexType(value) for value in document.get('indexes', [])],
+                             DocumentMetadata.from_document(document['metadata']))
+
+
+def _statement_from_document(cls: type, document: dict):
+    return build_trusted(cls, document['ticker'], PeriodType(document['period_type']),
+                         [AccountingEntry.from_document(item) for item in document.get('items', [])],
+                         DocumentMetadata.from_document(document['metadata']))
+
 
 @attrs.frozen
 class IncomeStatement:
@@ -148,6 +244,13 @@ class IncomeStatement:
                                              validator=[validators.instance_of(DocumentMetadata)],
                                              converter=DocumentMetadata.parse)
 
+    @classmethod
+    def from_document(cls, document: dict) -> IncomeStatement:
+        """
+        This function builds the statement from a document read from the database, without validation
+        """
+        return _statement_from_document(cls, document)
+
 
 @attrs.frozen
 class CashFlowStatement:
@@ -159,6 +262,13 @@ class CashFlowStatement:
                                              validator=[validators.instance_of(DocumentMetadata)],
                                              converter=DocumentMetadata.parse)
 
+    @classmethod
+    def from_document(cls, document: dict) -> CashFlowStatement:
+        """
+        This function builds the statement from a document read from the database, without validation
+        """
+        return _statement_from_document(cls, document)
+
 
 @attrs.frozen
 class BalanceSheetStatement:
@@ -170,6 +280,13 @@ class BalanceSheetStatement:
                                              validator=[validators.instance_of(DocumentMetadata)],
                                              converter=DocumentMetadata.parse)
 
+    @classmethod
+    def from_document(cls, document: dict) -> BalanceSheetStatement:
+        """
+        This function builds the statement from a document read from the database, without validation
+        """
+        return _statement_from_document(cls, document)
+
 
 @attrs.frozen
 class EarningsStatement:
@@ -181,6 +298,13 @@ class EarningsStatement:
                                              validator=[validators.instance_of(DocumentMetadata)],
                                              converter=DocumentMetadata.parse)
 
+    @classmethod
+    def from_document(cls, document: dict) -> EarningsStatement:
+        """
+        This function builds the statement from a document read from the database, without validation
+        """
+        return _statement_from_document(cls, document)
+
 
 @attrs.define
 class TaskTracking:
@@ -199,6 +323,10 @@ class GICSSubIndustry:
                                                 attrs.validators.lt(61_000_000)], converter=int)
     name: str = attrs.field(default='Unknown', validator=[attrs.validators.instance_of(str)])
 
+    @classmethod
+    def from_document(cls, document: dict) -> GICSSubIndustry:
+        return build_trusted(cls, document['id'], document['name'])
+
 
 @attrs.frozen
 class GICSIndustry:
@@ -207,6 +335,11 @@ class GICSIndustry:
     name: str = attrs.field(default='Unknown', validator=[attrs.validators.instance_of(str)])
     sub_industries: list[GICSSubIndustry] = attrs.Factory(list)
 
+    @classmethod
+    def from_document(cls, document: dict) -> GICSIndustry:
+        return build_trusted(cls, document['id'], document['name'],
+                             [GICSSubIndustry.from_document(item) for item in document.get('sub_industries', [])])
+
 
 @attrs.frozen
 class GICSGroupIndustry:
@@ -215,6 +348,11 @@ class GICSGroupIndustry:
     name: str = attrs.field(default='Unknown', validator=[attrs.validators.instance_of(str)])
     industries: list[GICSIndustry] = attrs.Factory(list)
 
+    @classmethod
+    def from_document(cls, document: dict) -> GICSGroupIndustry:
+        return build_trusted(cls, document['id'], document['name'],
+                             [GICSIndustry.from_document(item) for item in document.get('industries', [])])
+
 
 @attrs.frozen
 class GICSSector:
@@ -226,20 +364,39 @@ class GICSSector:
                                              validator=[validators.instance_of(DocumentMetadata)],
                                              converter=DocumentMetadata.parse)
 
+    @classmethod
+    def from_document(cls, document: dict) -> GICSSector:
+        """
+        This function builds the sector and its nested levels from a document read from the database,
+        without validation
+        """
+        return build_trusted(cls, document['id'], document['name'],
+                             [GICSGroupIndustry.from_document(item) for item in document.get('group_industries', [])],
+                             DocumentMetadata.from_document(document['metadata']))
+
 
 @attrs.define
 class Earnings:
     ticker: str = attrs.field(eq=True, validator=[validators.instance_of(str), validators.matches_re('^[A-Z.-]{1,5}$')],
                               converter=lambda value: value.upper())
     name: str = attrs.field(default='', eq=False, validator=[attrs.validators.instance_of(str)])
-    report_date: date = attrs.field(eq=False, factory=datetime.now)
-    fiscal_year: date = attrs.field(eq=False, factory=datetime.now)
+    report_date: date = attrs.field(eq=False, factory=datetime.now, converter=parse_date_value)
+    fiscal_year: date = attrs.field(eq=False, factory=datetime.now, converter=parse_date_value)
     estimate: str = attrs.field(default='', eq=False)
     currency: str = attrs.field(default='USD')
     metadata: DocumentMetadata = attrs.field(eq=False, factory=DocumentMetadata,
                                              validator=[validators.instance_of(DocumentMetadata)],
                                              converter=DocumentMetadata.parse)
 
+    @classmethod
+    def from_document(cls, document: dict) -> Earnings:
+        """
+        This function builds the record from a document read from the database, without validation
+        """
+        return build_trusted(cls, document['ticker'], document['name'], document['report_date'],
+                             document['fiscal_year'], document['estimate'], intern_text(document['currency']),
+                             DocumentMetadata.from_document(document['metadata']))
+
 
 @attrs.define
 class Company:
@@ -255,10 +412,22 @@ class Company:
     country: str = attrs.field(eq=False, validator=[validators.instance_of(str)])
     sub_industry: str = attrs.field(eq=False, validator=[validators.instance_of(str)])
     address: str = attrs.field(eq=False, validator=[validators.instance_of(str)])
-    fiscal_year_end: str = attrs.field(eq=False, validator=[validators.instance_of(str), validators.in_(Months)],
-                                       converter=Months.parse)
+    fiscal_year_end: Months = attrs.field(eq=False, validator=[validators.instance_of(str), validators.in_(Months)],
+                                          converter=Months.parse)
     last_quarter: datetime = attrs.field(eq=False, factory=datetime.now, validator=[validators.instance_of(datetime)],
                                          converter=parse_alphavantage_date)
     metadata: DocumentMetadata = attrs.field(eq=False, factory=DocumentMetadata,
                                              validator=[validators.instance_of(DocumentMetadata)],
                                              converter=DocumentMetadata.parse)
+
+    @classmethod
+    def from_document(cls, document: dict) -> Company:
+        """
+        This function builds the record from a document read from the database, skipping the validators and
+        converters as the values were checked when the document was written
+        """
+        return build_trusted(cls, document['ticker'], document['name'], document['description'], document['cik'],
+                             document['figi'], intern_text(document['exchange']), intern_text(document['currency']),
+                             intern_text(document['country']), intern_text(document['sub_industry']),
+                             document['address'], Months(document['fiscal_year_end']),
+                             document['last_quarter'], DocumentMetadata.from_document(document['metadata']))
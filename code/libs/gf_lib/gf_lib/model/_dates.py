@@ -0,0 +1,73 @@
+# *******************************************************************************************
+#  File:  _dates.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['parse_alphavantage_date', 'parse_date_value', 'parse_date_text']
+
+from datetime import date, datetime, time, timezone
+from functools import lru_cache
+import pendulum
+
+_CACHE_SIZE: int = 4_096
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_date_text(value: str) -> datetime:
+    """
+    This function converts date text to a naive UTC datetime, the form pymongo returns. ISO dates such as
+    2022-03-31 take the fast path and other formats fall back to pendulum. Results are cached, as the same
+    period end dates repeat for every ticker
+    """
+    try:
+        result = datetime.fromisoformat(value)
+    except ValueError:
+        result = pendulum.parse(value, strict=False)
+
+    if not isinstance(result, date):
+        raise ValueError(f"Not a date: {value}")
+
+    if not isinstance(result, datetime):
+        return datetime.combine(result, time())
+
+    if result.tzinfo is not None:
+        result = result.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return datetime(result.year, result.month, result.day, result.hour, result.minute, result.second,
+                    result.microsecond)
+
+
+def parse_alphavantage_date(value: str | date | datetime) -> datetime:
+    """
+    This function is the converter for the date fields of the models, it accepts text, a date or a datetime
+    """
+    if isinstance(value, datetime):
+        return value
+
+    if isinstance(value, date):
+        return datetime.combine(value, time())
+
+    return parse_date_text(value)
+
+
+def parse_date_value(value: str | date) -> date:
+    """
+    This function is the converter for the fields declared as date, a date or datetime is kept as it is and
+    text is parsed to a datetime
+    """
+    if isinstance(value, date):
+        return value
+
+    return parse_date_text(value)
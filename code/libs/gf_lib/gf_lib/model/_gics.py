@@ -0,0 +1,182 @@
+# *******************************************************************************************
+#  File:  _gics.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+from __future__ import annotations
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['GicsLevel', 'GicsNode', 'GicsIndex']
+
+from enum import IntEnum
+from pathlib import Path
+from typing import Iterable, Iterator
+import attrs
+import orjson
+from ._database import GICSSector
+
+
+class GicsLevel(IntEnum):
+    Sector = 1
+    GroupIndustry = 2
+    Industry = 3
+    SubIndustry = 4
+
+
+@attrs.frozen
+class GicsNode:
+    """
+    Holds one entry of the GICS classification, the children are the ids of the level below
+    """
+    id: int
+    name: str
+    level: GicsLevel
+    parent_id: int | None
+    children: tuple[int, ...] = ()
+
+
+def _name_key(name: str) -> str:
+    return ' '.join(name.split()).casefold()
+
+
+class GicsIndex:
+    """
+    Holds the GICS classification flattened into dictionaries, giving constant time lookup by id or by name
+    at every level and the ancestry of any entry, without walking the nested sectors. The index does not
+    change once built
+    """
+    __slots__ = ('_nodes', '_names')
+
+    def __init__(self, nodes: Iterable[GicsNode]) -> None:
+        self._nodes: dict[int, GicsNode] = dict()
+        self._names: dict[str, dict[GicsLevel, GicsNode]] = dict()
+
+        for node in nodes:
+            self._nodes[node.id] = node
+            self._names.setdefault(_name_key(node.name), dict())[node.level] = node
+
+    @classmethod
+    def _from_tree(cls, sectors: Iterable, children_of) -> GicsIndex:
+        """
+        This function flattens a tree of sectors, parents first. children_of returns the id, the name and
+        the entries below an entry of the given level
+        """
+        nodes = list()
+
+        def visit(entry, level: GicsLevel, parent_id: int | None) -> int:
+            entry_id, name, items = children_of(entry, level)
+            position = len(nodes)
+            nodes.append(None)
+
+            children = tuple(visit(item, GicsLevel(level + 1), int(entry_id)) for item in items)
+            nodes[position] = GicsNode(int(entry_id), name, level, parent_id, children)
+            return int(entry_id)
+
+        for sector in sectors:
+            visit(sector, GicsLevel.Sector, None)
+
+        return cls(nodes)
+
+    @classmethod
+    def from_sectors(cls, sectors: Iterable[GICSSector]) -> GicsIndex:
+        """
+        This function builds the index from the sectors held in the database
+        """
+        levels = {GicsLevel.Sector: 'group_industries', GicsLevel.GroupIndustry: 'industries',
+                  GicsLevel.Industry: 'sub_industries'}
+
+        def children_of(entry, level: GicsLevel):
+            return entry.id, entry.name, getattr(entry, levels[level]) if level in levels else ()
+
+        return cls._from_tree(sectors, children_of)
+
+    @classmethod
+    def from_data(cls, data: list[dict]) -> GicsIndex:
+        """
+        This function builds the index from the contents of gics.json, where each level holds the level below
+        in items
+        """
+        return cls._from_tree(data, lambda entry, _: (entry['id'], entry['name'], entry.get('items', ())))
+
+    @classmethod
+    def from_file(cls, file: Path | str) -> GicsIndex:
+        return cls.from_data(orjson.loads(Path(file).read_bytes()))
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, value: int) -> bool:
+        return value in self._nodes
+
+    def __iter__(self) -> Iterator[GicsNode]:
+        return iter(self._nodes.values())
+
+    def __getitem__(self, value: int) -> GicsNode:
+        return self._nodes[value]
+
+    def get(self, value: int) -> GicsNode | None:
+        return self._nodes.get(value)
+
+    def find(self, name: str, level: GicsLevel | None = None) -> GicsNode | None:
+        """
+        This function returns the entry with the name, ignoring case and spacing. The same name can be used at
+        several levels, e.g. Energy, so without a level the most specific entry is returned
+        """
+        matches = self._names.get(_name_key(name))
+        if not matches:
+            return None
+
+        if level is not None:
+            return matches.get(level)
+
+        return matches[max(matches)]
+
+    def parent(self, value: int) -> GicsNode | None:
+        parent_id = self._nodes[value].parent_id
+        return None if parent_id is None else self._nodes[parent_id]
+
+    def children(self, value: int) -> list[GicsNode]:
+        return [self._nodes[child] for child in self._nodes[value].children]
+
+    def ancestry(self, value: int) -> list[GicsNode]:
+        """
+        This function returns the path from the sector down to the entry, e.g. sector, group industry,
+        industry and sub industry for a sub industry id
+        """
+        path = list()
+        node = self._nodes[value]
+        while node is not None:
+            path.append(node)
+            node = None if node.parent_id is None else self._nodes[node.parent_id]
+
+        path.reverse()
+        return path
+
+    def sectors(self) -> list[GicsNode]:
+        return [node for node in self._nodes.values() if node.level == GicsLevel.Sector]
+
+    def sub_industries(self) -> list[GicsNode]:
+        return [node for node in self._nodes.values() if node.level == GicsLevel.SubIndustry]
+
+    def resolve(self, names: Iterable[str], level: GicsLevel = GicsLevel.SubIndustry) -> list[int | None]:
+        """
+        This function converts names to ids in one pass, e.g. the sub_industry of every master record, with
+        None for names that are not classified
+        """
+        ids = list()
+        for name in names:
+            node = self.find(name, level)
+            ids.append(None if node is None else node.id)
+
+        return ids
@@ -0,0 +1,181 @@
+# *******************************************************************************************
+#  File:  _numeric.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+from __future__ import annotations
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['NumericBlock', 'convert_values']
+
+from array import array
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Iterable
+import math
+import attrs
+from ._database import AccountingEntry
+from ._alphavantage import MISSING_VALUES, LABEL_TAGS
+
+_ENTRY_COLUMNS: tuple[str, ...] = ('value_1', 'value_2', 'value_3', 'value_4', 'value_5')
+
+
+def _scale_value(value: str | int | Decimal, scale: int) -> int:
+    """
+    This function converts the value to an integer holding value * 10 ** scale, rounding half to even
+    when the value has more decimals than the scale. Numbers come from lines stored in numeric form
+    """
+    if isinstance(value, int):
+        return value * 10 ** scale
+
+    if isinstance(value, Decimal):
+        return int(value.scaleb(scale).to_integral_value(ROUND_HALF_EVEN))
+
+    whole, _, fraction = value.partition('.')
+    if len(fraction) <= scale:
+        try:
+            return int(whole + fraction.ljust(scale, '0'))
+        except ValueError:
+            pass
+
+    return int(Decimal(value).scaleb(scale).to_integral_value(ROUND_HALF_EVEN))
+
+
+def convert_values(values: Iterable[str | int | Decimal | None], scale: int = 0) -> (array, bytearray):
+    """
+    This function converts the text or numeric values to int64 numbers scaled by 10 ** scale, returning the
+    numbers and a mask holding 1 where a value is present. Missing or unreadable values are 0 with a mask
+    of 0. A value that does not fit in int64 once scaled raises an OverflowError rather than being dropped,
+    use a smaller scale for such figures
+    """
+    values = values if isinstance(values, list) else list(values)
+    count = len(values)
+
+    # Whole integer columns with no gaps, the common case, convert in one pass at C speed. int() would
+    # truncate a Decimal, so columns holding one take the exact path below
+    if scale == 0 and Decimal not in set(map(type, values)):
+        try:
+            return array('q', map(int, values)), bytearray(b'\x01') * count
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+    numbers = array('q', bytes(8 * count))
+    mask = bytearray(count)
+    for index, value in enumerate(values):
+        if value is None or value in MISSING_VALUES:
+            continue
+
+        try:
+            number = _scale_value(value, scale)
+        except (ValueError, ArithmeticError):
+            continue
+
+        try:
+            numbers[index] = number
+        except OverflowError:
+            raise OverflowError(f"The value {value} does not fit in int64 at scale {scale}") from None
+
+        mask[index] = 1
+
+    return numbers, mask
+
+
+@attrs.frozen
+class NumericBlock:
+    """
+    Holds statement values as scaled int64 numbers, a row per key and a column per period, with a mask
+    of 1 where a value is present. A number n stands for n / 10 ** scale. The values and mask support the
+    buffer protocol, e.g. numpy.frombuffer(values, dtype=numpy.int64).reshape(len(keys), periods)
+    """
+    keys: tuple[str, ...]
+    periods: int
+    scale: int
+    values: array = attrs.field(repr=False)
+    mask: bytearray = attrs.field(repr=False)
+    _rows: dict[str, int] = attrs.field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        object.__setattr__(self, '_rows', {key: index for index, key in enumerate(self.keys)})
+
+    @classmethod
+    def from_rows(cls, rows: dict[str, list[str | None]], periods: int | None = None, scale: int = 0) -> NumericBlock:
+        """
+        This function converts the text rows in a single pass, rows shorter than the period count are
+        padded as missing and longer ones are cut
+        """
+        if periods is None:
+            periods = max((len(row) for row in rows.values()), default=0)
+
+        cells = list()
+        for row in rows.values():
+            if len(row) == periods:
+                cells.extend(row)
+            else:
+                cells.extend(row[:periods])
+                cells.extend([None] * (periods - len(row)))
+
+        values, mask = convert_values(cells, scale)
+        return cls(tuple(rows), periods, scale, values, mask)
+
+    @classmethod
+    def from_statements(cls, statements, periods: int | None = None, scale: int = 0) -> NumericBlock:
+        """
+        This function converts the lines of a FinancialStatementsAlphavantage, leaving out the date and
+        currency labels
+        """
+        return cls.from_rows({tag: item.columns for tag, item in statements.items.items() if tag not in LABEL_TAGS},
+                             periods, scale)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[AccountingEntry], scale: int = 0) -> NumericBlock:
+        """
+        This function converts the accounting entries of a stored statement
+        """
+        return cls.from_rows({entry.tag: [getattr(entry, column) for column in _ENTRY_COLUMNS] for entry in entries},
+                             len(_ENTRY_COLUMNS), scale)
+
+    @classmethod
+    def from_universe(cls, statements: Iterable, tag: str, periods: int = 1, scale: int = 0) -> NumericBlock:
+        """
+        This function converts one line across many FinancialStatementsAlphavantage, a row per ticker,
+        so a metric can be computed for the whole universe at once
+        """
+        rows = dict()
+        for statement in statements:
+            item = statement.items.get(tag)
+            rows[statement.ticker] = item.columns if item is not None else []
+
+        return cls.from_rows(rows, periods, scale)
+
+    def has_key(self, key: str) -> bool:
+        return key in self._rows
+
+    def value(self, key: str, period: int) -> int | None:
+        index = self._rows[key] * self.periods + period
+        return self.values[index] if self.mask[index] else None
+
+    def row(self, key: str) -> array:
+        start = self._rows[key] * self.periods
+        return self.values[start:start + self.periods]
+
+    def row_mask(self, key: str) -> bytearray:
+        start = self._rows[key] * self.periods
+        return self.mask[start:start + self.periods]
+
+    def to_floats(self) -> array:
+        """
+        This function returns the values as float64 in the same layout, unscaled and with NaN where missing
+        """
+        factor = 10 ** self.scale
+        return array('d', [value / factor if present else math.nan
+                           for value, present in zip(self.values, self.mask)])
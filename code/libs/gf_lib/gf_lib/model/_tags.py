@@ -0,0 +1,103 @@
+# *******************************************************************************************
+#  File:  _tags.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['TagRegistry', 'get_tag_registry', 'intern_tag']
+
+from array import array
+from typing import Iterable
+import sys
+import threading
+
+
+class TagRegistry:
+    """
+    Maps the statement line tags, e.g. totalRevenue, to small integer ids and back. Each tag is held once
+    as an interned string, so every statement of every ticker shares the same key objects and equality
+    checks on them reduce to an identity check
+    """
+    _lock: threading.Lock
+    _ids: dict[str, int]
+    _tags: list[str]
+
+    def __init__(self, tags: Iterable[str] = ()) -> None:
+        self._lock = threading.Lock()
+        self._ids = dict()
+        self._tags = list()
+
+        for tag in tags:
+            self.id_of(tag)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._ids
+
+    def _register(self, tag: str) -> int:
+        with self._lock:
+            tag_id = self._ids.get(tag)
+            if tag_id is None:
+                tag_id = len(self._tags)
+                tag = sys.intern(str(tag))
+                self._tags.append(tag)
+                self._ids[tag] = tag_id
+
+        return tag_id
+
+    def id_of(self, tag: str) -> int:
+        """
+        This function returns the id of the tag, registering it on first use
+        """
+        tag_id = self._ids.get(tag)
+        return tag_id if tag_id is not None else self._register(tag)
+
+    def tag_of(self, tag_id: int) -> str:
+        return self._tags[tag_id]
+
+    def intern(self, tag: str) -> str:
+        """
+        This function returns the shared instance of the tag, registering it on first use
+        """
+        tag_id = self._ids.get(tag)
+        if tag_id is None:
+            tag_id = self._register(tag)
+
+        return self._tags[tag_id]
+
+    def encode(self, tags: Iterable[str]) -> array:
+        """
+        This function converts the tags to an array of ids
+        """
+        return array('I', map(self.id_of, tags))
+
+    def decode(self, tag_ids: Iterable[int]) -> list[str]:
+        tags = self._tags
+        return [tags[tag_id] for tag_id in tag_ids]
+
+
+_registry: TagRegistry = TagRegistry()
+
+
+def get_tag_registry() -> TagRegistry:
+    return _registry
+
+
+def intern_tag(tag: str) -> str:
+    """
+    This function returns the shared instance of the tag from the process wide registry
+    """
+    return _registry.intern(tag)
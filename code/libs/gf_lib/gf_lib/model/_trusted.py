@@ -0,0 +1,60 @@
+# *******************************************************************************************
+#  File:  _trusted.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['build_trusted']
+
+from functools import lru_cache
+from typing import Callable
+import attrs
+
+
+def _setter(cls: type, name: str) -> Callable[[object, object], None]:
+    """
+    This function returns the slot descriptor's setter for the field, which bypasses the frozen check
+    """
+    for klass in cls.__mro__:
+        descriptor = klass.__dict__.get(name)
+        if descriptor is not None and hasattr(descriptor, '__set__'):
+            return descriptor.__set__
+
+    return lambda instance, value: object.__setattr__(instance, name, value)
+
+
+@lru_cache(maxsize=None)
+def _builder(cls: type) -> Callable:
+    """
+    This function generates a constructor for the class that takes the values in field order and sets
+    them without running the converters and validators
+    """
+    names = [field.name for field in attrs.fields(cls)]
+    arguments = ', '.join(f"value_{index}" for index in range(len(names)))
+    lines = [f"def build({arguments}):", "    instance = new(cls)"]
+    lines.extend(f"    set_{index}(instance, value_{index})" for index in range(len(names)))
+    lines.append("    return instance")
+
+    namespace = {'new': object.__new__, 'cls': cls}
+    namespace.update({f"set_{index}": _setter(cls, name) for index, name in enumerate(names)})
+    exec('\n'.join(lines), namespace)
+    return namespace['build']
+
+
+def build_trusted(cls: type, *values):
+    """
+    This function creates an attrs instance from values that are already valid and converted, in field
+    order, skipping the converters and validators. Only use it for data the library produced itself
+    """
+    return _builder(cls)(*values)
@@ -0,0 +1,145 @@
+# *******************************************************************************************
+#  File:  _universe.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+from __future__ import annotations
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['UniverseIndex']
+
+from typing import Iterable
+from ._database import IndexType, Master
+from ._gics import GicsIndex, GicsLevel
+
+
+class UniverseIndex:
+    """
+    Holds the membership of the master list as bitsets, each ticker gets a dense id and each index type and
+    GICS entry a Python int with the bit of every member set. Screens combine them with the int operators,
+    e.g. universe.index(IndexType.SP500) & ~universe.index(IndexType.SP100), and tickers converts the result
+    back. GICS bitsets are only kept when the index is built with a GicsIndex
+    """
+    __slots__ = ('_tickers', '_ids', '_indexes', '_gics', '_gics_index', '_all')
+
+    def __init__(self, gics: GicsIndex | None = None) -> None:
+        self._tickers: list[str] = list()
+        self._ids: dict[str, int] = dict()
+        self._indexes: dict[IndexType, int] = {index_type: 0 for index_type in IndexType}
+        self._gics: dict[int, int] = dict()
+        self._gics_index = gics
+        self._all = 0
+
+    @classmethod
+    def from_masters(cls, records: Iterable[Master], gics: GicsIndex | None = None) -> UniverseIndex:
+        universe = cls(gics)
+        for record in records:
+            universe.add(record)
+
+        return universe
+
+    def __len__(self) -> int:
+        return len(self._tickers)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._ids
+
+    def add(self, record: Master) -> int:
+        return self.add_member(record.ticker, record.indexes, record.sub_industry)
+
+    def add_member(self, ticker: str, indexes: Iterable[IndexType | str], sub_industry: str | None = None) -> int:
+        """
+        This function adds the ticker to the universe and returns its id, a ticker added again keeps its id
+        and has its memberships replaced
+        """
+        ticker_id = self._ids.get(ticker)
+        if ticker_id is None:
+            ticker_id = self._ids[ticker] = len(self._tickers)
+            self._tickers.append(ticker)
+        else:
+            self._remove_bit(ticker_id)
+
+        bit = 1 << ticker_id
+        self._all |= bit
+
+        for index_type in indexes:
+            self._indexes[IndexType.parse(index_type)] |= bit
+
+        if self._gics_index is not None and sub_industry:
+            node = self._gics_index.find(sub_industry, GicsLevel.SubIndustry)
+            if node is not None:
+                for entry in self._gics_index.ancestry(node.id):
+                    self._gics[entry.id] = self._gics.get(entry.id, 0) | bit
+
+        return ticker_id
+
+    def _remove_bit(self, ticker_id: int) -> None:
+        keep = ~(1 << ticker_id)
+        for index_type, bits in self._indexes.items():
+            self._indexes[index_type] = bits & keep
+
+        for gics_id, bits in self._gics.items():
+            self._gics[gics_id] = bits & keep
+
+    def id_of(self, ticker: str) -> int:
+        return self._ids[ticker]
+
+    def ticker_of(self, ticker_id: int) -> str:
+        return self._tickers[ticker_id]
+
+    def all(self) -> int:
+        return self._all
+
+    def index(self, index_type: IndexType) -> int:
+        return self._indexes[IndexType.parse(index_type)]
+
+    def gics(self, gics_id: int) -> int:
+        """
+        This function returns the members classified under the GICS entry, at any level
+        """
+        return self._gics.get(gics_id, 0)
+
+    def bits_of(self, tickers: Iterable[str]) -> int:
+        """
+        This function returns the bitset of the tickers, e.g. to intersect a screen with a watch list. Tickers
+        not in the universe are ignored
+        """
+        bits = 0
+        for ticker in tickers:
+            ticker_id = self._ids.get(ticker)
+            if ticker_id is not None:
+                bits |= 1 << ticker_id
+
+        return bits
+
+    def tickers(self, bits: int) -> list[str]:
+        """
+        This function returns the tickers of the members in the bitset in id order, bits outside the universe,
+        such as those set by a complement, are ignored
+        """
+        bits &= self._all
+        tickers = list()
+        while bits:
+            low = bits & -bits
+            tickers.append(self._tickers[low.bit_length() - 1])
+            bits ^= low
+
+        return tickers
+
+    def count(self, bits: int) -> int:
+        return (bits & self._all).bit_count()
+
+    def has(self, bits: int, ticker: str) -> bool:
+        ticker_id = self._ids.get(ticker)
+        return ticker_id is not None and bool(bits >> ticker_id & 1)
@@ -16,9 +16,23 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['SpEntry', 'get_sp600', 'get_sp400', 'get_sp500', 'get_sp100_tickers', 'get_sec_map', 'get_openfigi_codes',
-           'FigiCode', 'parse_financial_statements', 'parse_company', 'parse_earnings_file', 'get_earnings_estimates']
+           'FigiCode', 'parse_financial_statements', 'parse_company', 'parse_earnings_file', 'get_earnings_estimates',
+           'HttpTransport', 'get_transport', 'set_transport', 'HttpResponse', 'AsyncHttpTransport', 'get_async_transport',
+           'close_async_transport', 'parse_sp600', 'parse_sp400', 'parse_sp500', 'parse_sp100_tickers', 'parse_sec_map',
+           'parse_openfigi_codes', 'get_sp600_async', 'get_sp400_async', 'get_sp500_async', 'get_sp100_tickers_async',
+           'get_sec_map_async', 'get_openfigi_codes_async', 'get_company_data_async', 'get_earnings_estimates_async',
+           'RateGovernor', 'get_rate_governor', 'set_rate_governor', 'ApiKeyPool',
+           'SingleFlight', 'ArchiveEntry', 'ResponseArchive', 'get_archive', 'set_archive',
+           'get_sec_index', 'parse_financial_matrix', 'parse_earnings_lines', 'stream_earnings_estimates',
+           'get_company_payloads', 'get_wikipedia_page', 'get_sec_payload', 'ParsePool', 'parse_statement_columns',
+           'build_financial_statements', 'build_company_data', 'sec_map_from_rows', 'COMPANY_FUNCTIONS',
+           'ANNUAL_PERIODS', 'QUARTER_PERIODS']
 
+from ._transport import *
+from ._coalesce import *
+from ._archive import *
 from ._wikipedia import *
 from ._sec import *
 from ._openfigi import *
 from ._alphavantage import *
+from ._parallel import *
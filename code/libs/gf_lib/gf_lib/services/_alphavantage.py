@@ -16,29 +16,421 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 __all__ = ['get_company_data', 'parse_financial_statements', 'parse_company',
-           'parse_earnings_file', 'get_earnings_estimates']
-
+           'parse_earnings_file', 'get_earnings_estimates', 'get_company_data_async', 'get_earnings_estimates_async',
+           'RateGovernor', 'get_rate_governor', 'set_rate_governor', 'ApiKeyPool', 'parse_financial_matrix',
+           'parse_earnings_lines', 'stream_earnings_estimates', 'get_company_payloads', 'parse_statement_columns',
+           'build_financial_statements', 'build_company_data', 'COMPANY_FUNCTIONS', 'ANNUAL_PERIODS', 'QUARTER_PERIODS']
+
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timezone, date
 from io import StringIO
+from pathlib import Path
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator
+import asyncio
 import csv
-import requests
+import hashlib
+import math
+import os
+import re
+import threading
+import time
+import attrs
 import orjson
 import gf_lib.model as model
-from gf_lib.errors import RequestFailedError, ApiFailedError
+from gf_lib.errors import RequestFailedError, ApiFailedError, ApiThrottledError
+from gf_lib.utils import intern_text
+from ._transport import get_transport, get_async_transport
+from ._coalesce import SingleFlight
+from ._archive import fetch_archived, fetch_archived_async, get_archive
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_MESSAGE_TAGS: tuple[str, ...] = ('Note', 'Information', 'Error Message')
+_RATE_LIMIT_PHRASES: tuple[str, ...] = ('per minute', 'per day', 'call frequency')
+_THROTTLE_PAYLOAD_MAX: int = 4_096
+_THROTTLE_RETRIES: int = 3
+ANNUAL_PERIODS: int = 5
+QUARTER_PERIODS: int = 3
+_EARNINGS_CHUNK_SIZE: int = 5_000
+_STREAM_CHUNK_SIZE: int = 65_536
+_EARNINGS_QUERY: str = 'function=EARNINGS_CALENDAR&horizon=3month'
+_SYMBOL_PATTERN = re.compile(rb'^\s*\{\s*"symbol"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_SEPARATOR_PATTERN = re.compile(rb'\s*,?\s*')
+
+_inflight: SingleFlight = SingleFlight()
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+@attrs.define
+class _KeyBudget:
+    tokens: float
+    updated: float
+    day: date
+    day_used: int = 0
+    blocked_until: float = 0.0
+
+
+class RateGovernor:
+    """
+    Paces Alpha Vantage calls per API key with a token bucket for the per minute limit and
+    a counter for the per day limit, both reset on the provider's schedule
+    """
+    _calls_per_minute: int
+    _calls_per_day: int
+    _budgets: dict[str, _KeyBudget]
+    _lock: threading.Lock
+    _clock: Callable[[], float]
+    _today: Callable[[], date]
+
+    def __init__(self, calls_per_minute: int = 5, calls_per_day: int = 500,
+                 clock: Callable[[], float] = time.monotonic, today: Callable[[], date] = _utc_today) -> None:
+        self._calls_per_minute = calls_per_minute
+        self._calls_per_day = calls_per_day
+        self._budgets = dict()
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._today = today
+
+    @property
+    def calls_per_minute(self) -> int:
+        return self._calls_per_minute
+
+    @property
+    def calls_per_day(self) -> int:
+        return self._calls_per_day
+
+    def _get_budget(self, key: str, now: float) -> _KeyBudget:
+        budget = self._budgets.get(key)
+        if budget is None:
+            budget = _KeyBudget(float(self._calls_per_minute), now, self._today())
+            self._budgets[key] = budget
+            return budget
+
+        rate = self._calls_per_minute / 60.0
+        budget.tokens = min(float(self._calls_per_minute), budget.tokens + (now - budget.updated) * rate)
+        budget.updated = now
+
+        today = self._today()
+        if budget.day != today:
+            budget.day = today
+            budget.day_used = 0
+
+        return budget
+
+    def reserve(self, key: str) -> float:
+        """
+        This function takes a call from the key's budget and returns zero, or returns the number of seconds
+        to wait before trying again. It raises ApiThrottledError when the daily budget is spent
+        """
+        with self._lock:
+            now = self._clock()
+            budget = self._get_budget(key, now)
+
+            if budget.day_used >= self._calls_per_day:
+                raise ApiThrottledError(f"Daily call limit reached for Alpha Vantage key: {key[:4]}...")
+
+            if budget.blocked_until > now:
+                return budget.blocked_until - now
+
+            if budget.tokens < 1.0:
+                return (1.0 - budget.tokens) * 60.0 / self._calls_per_minute
+
+            budget.tokens -= 1.0
+            budget.day_used += 1
+            return 0.0
+
+    def acquire(self, key: str) -> None:
+        """
+        This function blocks until a call can be made with the key
+        """
+        while (wait := self.reserve(key)) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, key: str) -> None:
+        """
+        This function waits, without blocking the event loop, until a call can be made with the key
+        """
+        while (wait := self.reserve(key)) > 0:
+            await asyncio.sleep(wait)
+
+    def throttled(self, key: str, message: str) -> None:
+        """
+        This function records a throttle response for the key, so no further calls are made until the
+        minute window has passed, or until tomorrow if the daily limit was hit
+        """
+        with self._lock:
+            now = self._clock()
+            budget = self._get_budget(key, now)
+            budget.tokens = 0.0
+
+            if 'per minute' not in message and 'per day' in message:
+                budget.day_used = self._calls_per_day
+            else:
+                budget.blocked_until = now + 60.0
+
+    def set_used(self, key: str, count: int) -> None:
+        """
+        This function sets the number of calls made today with the key, e.g. from counters shared
+        with other processes
+        """
+        with self._lock:
+            budget = self._get_budget(key, self._clock())
+            budget.day_used = max(budget.day_used, count)
+
+    def remaining(self, key: str) -> int:
+        """
+        This function returns the number of calls left in today's budget for the key
+        """
+        with self._lock:
+            budget = self._get_budget(key, self._clock())
+            return max(self._calls_per_day - budget.day_used, 0)
+
+
+_rate_governor: RateGovernor = RateGovernor()
+
+
+def get_rate_governor() -> RateGovernor:
+    return _rate_governor
+
+
+def set_rate_governor(value: RateGovernor) -> None:
+    """
+    This function replaces the governor used by the Alpha Vantage calls, e.g. to match a premium plan
+    """
+    global _rate_governor
+    _rate_governor = value
+
+
+class ApiKeyPool:
+    """
+    Hands out the Alpha Vantage key with the most budget left, so several licensed keys add up. When a
+    state file is given the daily usage is shared with other processes through it
+    """
+    _keys: list[str]
+    _state_file: Path | None
+    _governor: RateGovernor | None
+    _lock: threading.Lock
+
+    def __init__(self, keys: list[str], state_file: Path | str | None = None,
+                 governor: RateGovernor | None = None) -> None:
+        if not keys:
+            raise ValueError('At least one API key is required')
+
+        self._keys = list(keys)
+        self._state_file = Path(state_file) if state_file else None
+        self._governor = governor
+        self._lock = threading.Lock()
+
+        self._load_usage()
+
+    @property
+    def keys(self) -> list[str]:
+        return list(self._keys)
+
+    @property
+    def governor(self) -> RateGovernor:
+        return self._governor if self._governor else get_rate_governor()
+
+    @staticmethod
+    def _key_id(key: str) -> str:
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[dict]:
+        """
+        This function yields the persisted usage, holding an exclusive lock on the state file until the
+        caller is done, changes made to the dict are written back
+        """
+        self._state_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._lock, open(self._state_file, 'a+b') as file:
+            if fcntl:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                content = file.read()
+                state = orjson.loads(content) if content else dict()
+
+                today = _utc_today().isoformat()
+                if state.get('date') != today:
+                    state = {'date': today, 'usage': dict()}
+
+                yield state
+
+                file.seek(0)
+                file.truncate()
+                file.write(orjson.dumps(state))
+                file.flush()
+                os.fsync(file.fileno())
+            finally:
+                if fcntl:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+    def _apply_usage(self, usage: dict[str, int]) -> None:
+        governor = self.governor
+        for key in self._keys:
+            governor.set_used(key, usage.get(self._key_id(key), 0))
+
+    def _load_usage(self) -> None:
+        if self._state_file is None:
+            return
+
+        with self._locked_state() as state:
+            self._apply_usage(state['usage'])
+
+    def _record_usage(self, key: str) -> None:
+        if self._state_file is None:
+            return
+
+        with self._locked_state() as state:
+            usage = state['usage']
+            key_id = self._key_id(key)
+            usage[key_id] = usage.get(key_id, 0) + 1
+            self._apply_usage(usage)
+
+    def remaining(self) -> dict[str, int]:
+        """
+        This function returns the calls left today for each key
+        """
+        governor = self.governor
+        return {key: governor.remaining(key) for key in self._keys}
+
+    def _reserve(self) -> tuple[str | None, float]:
+        """
+        This function reserves a call on the key with the most budget left that can be used now. It returns
+        the key, or None and the shortest wait before a key becomes available
+        """
+        if self._state_file is not None:
+            self._load_usage()
+
+        governor = self.governor
+        candidates = sorted(self._keys, key=governor.remaining, reverse=True)
+
+        shortest_wait: float | None = None
+        for key in candidates:
+            try:
+                wait = governor.reserve(key)
+            except ApiThrottledError:
+                continue
+
+            if wait <= 0:
+                self._record_usage(key)
+                return key, 0.0
+
+            shortest_wait = wait if shortest_wait is None else min(shortest_wait, wait)
+
+        if shortest_wait is None:
+            raise ApiThrottledError('Daily call limit reached for all Alpha Vantage keys')
+
+        return None, shortest_wait
+
+    def acquire(self) -> str:
+        """
+        This function blocks until one of the keys can be used and returns it
+        """
+        while True:
+            key, wait = self._reserve()
+            if key:
+                return key
+            time.sleep(wait)
+
+    async def acquire_async(self) -> str:
+        """
+        This function waits, without blocking the event loop, until one of the keys can be used and returns it.
+        With a state file the reservation locks, reads and syncs the file, so it runs in a worker thread
+        """
+        while True:
+            key, wait = await asyncio.to_thread(self._reserve) if self._state_file is not None else self._reserve()
+            if key:
+                return key
+            await asyncio.sleep(wait)
+
+    def throttled(self, key: str, message: str) -> None:
+        self.governor.throttled(key, message)
+
+
+def _api_message(data) -> str | None:
+    """
+    This function returns the message of a payload sent instead of data, Alpha Vantage returns these with
+    status 200
+    """
+    if not isinstance(data, dict):
+        return None
+
+    for tag in _MESSAGE_TAGS:
+        if tag in data:
+            return str(data[tag])
+
+    return None
+
+
+def _is_rate_limit(message: str) -> bool:
+    message = message.lower()
+    return any(phrase in message for phrase in _RATE_LIMIT_PHRASES)
+
+
+def _throttle_message(data) -> str | None:
+    """
+    This function returns the message of a throttle payload, other messages, e.g. for the demo key or a
+    premium endpoint, are not throttles
+    """
+    message = _api_message(data)
+    return message if message and _is_rate_limit(message) else None
+
+
+def _find_throttle(content: bytes) -> str | None:
+    """
+    This function returns the message of a throttle payload and raises ApiFailedError for any other
+    message, which retrying would not change
+    """
+    if len(content) > _THROTTLE_PAYLOAD_MAX or not content.lstrip().startswith(b'{'):
+        return None
+
+    try:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return None
+
+    if 'Symbol' in data or 'symbol' in data:
+        return None
+
+    message = _api_message(data)
+    if message and not _is_rate_limit(message):
+        raise ApiFailedError(message)
+
+    return message
 
 
-def parse_company(value: str) -> model.CompanyAlphavantage:
+def _raise_for_response(data: dict) -> None:
+    message = _api_message(data)
+    if message and _is_rate_limit(message):
+        raise ApiThrottledError(message)
+
+    raise ApiFailedError(message or 'API calls exceeded')
+
+
+def parse_company(value: str | bytes) -> model.CompanyAlphavantage:
     data = orjson.loads(value)
 
     try:
         ticker = data['Symbol']
     except KeyError:
-        raise ApiFailedError('API calls exceeded')
+        _raise_for_response(data)
 
     name = data['Name']
     description = data['Description']
-    exchange = data['Exchange']
-    currency = data['Currency']
-    country = data['Country']
+    exchange = intern_text(data['Exchange'])
+    currency = intern_text(data['Currency'])
+    country = intern_text(data['Country'])
     address = data['Address']
     fiscal_year_end = data['FiscalYearEnd']
     last_quarter = data['LatestQuarter']
@@ -49,93 +441,335 @@ def parse_company(value: str) -> model.CompanyAlphavantage:
     return company
 
 
-def parse_financial_statements(value: str,
-        annual_tag: str = 'annualReports', quarter_tag: str = 'quarterlyReports') -> (model.FinancialItemAlphavantage,
-                                                                                      model.FinancialItemAlphavantage):
+@lru_cache(maxsize=16)
+def _array_pattern(tag: str) -> re.Pattern:
+    return re.compile(b'"' + re.escape(tag.encode('utf-8')) + rb'"\s*:\s*\[')
+
+
+def _take_reports(value: bytes, tag: str, count: int) -> list[dict] | None:
+    """
+    This function returns the first count reports of the tagged array without decoding the rest of the
+    document. The reports are flat objects, so each one ends at the first closing brace outside a string.
+    None is returned if the payload does not have the expected shape
+    """
+    match = _array_pattern(tag).search(value)
+    if match is None:
+        return None
+
+    start = match.end() - 1
+    position = match.end()
+    taken = 0
+
+    while taken < count:
+        position = _SEPARATOR_PATTERN.match(value, position).end()
+        if position >= len(value):
+            return None
+        if value[position] == 0x5D:
+            break
+        if value[position] != 0x7B:
+            return None
+
+        end = value.find(b'}', position)
+        while end != -1 and (value.count(b'"', position, end) - value.count(b'\\"', position, end)) % 2:
+            end = value.find(b'}', end + 1)
+
+        if end == -1 or value.find(b'{', position + 1, end) != -1:
+            return None
+
+        taken += 1
+        position = end + 1
+
+    try:
+        return orjson.loads(value[start:position] + b']')
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _load_reports(value: str | bytes, annual_tag: str, quarter_tag: str, annual_count: int | None,
+                  quarter_count: int | None) -> (str, list[dict], list[dict]):
+    """
+    This function returns the ticker and the leading annual and quarterly reports of a statement payload,
+    stopping once the requested number of periods has been read. A count of None returns every period
+    """
+    if isinstance(value, str):
+        value = value.encode('utf-8')
+
+    symbol = _SYMBOL_PATTERN.match(value) if annual_count is not None and quarter_count is not None else None
+    if symbol:
+        annuals = _take_reports(value, annual_tag, annual_count)
+        quarters = _take_reports(value, quarter_tag, quarter_count)
+
+        if annuals is not None and quarters is not None:
+            return orjson.loads(b'"' + symbol.group(1) + b'"'), annuals, quarters
+
     data = orjson.loads(value)
 
     try:
         ticker = data['symbol']
     except KeyError:
-        raise ApiFailedError('API calls exceeded')
+        _raise_for_response(data)
 
-    annual_statements = model.FinancialStatementsAlphavantage(ticker)
-    quarter_statements = model.FinancialStatementsAlphavantage(ticker)
+    return ticker, data[annual_tag][:annual_count], data[quarter_tag][:quarter_count]
 
-    annuals = data[annual_tag]
-    quarters = data[quarter_tag]
 
-    for index, statement in enumerate(annuals):
-        if index > 4:
-            break
+def _report_columns(reports: list[dict]) -> dict[str, list[str | None]]:
+    """
+    This function pivots the report objects, newest first, to a list of values per tag
+    """
+    columns = dict()
+    periods = len(reports)
 
+    for index, statement in enumerate(reports):
         for key, value in statement.items():
-            if key not in annual_statements.items:
-                annual_statements.items[key] = model.FinancialItemAlphavantage(key)
-
-            match index:
-                case 0:
-                    annual_statements.items[key].column_1 = value
-                case 1:
-                    annual_statements.items[key].column_2 = value
-                case 2:
-                    annual_statements.items[key].column_3 = value
-                case 3:
-                    annual_statements.items[key].column_4 = value
-                case 4:
-                    annual_statements.items[key].column_5 = value
-
-    for index, statement in enumerate(quarters):
-        if index > 2:
-            break
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * periods
 
-        for key, value in statement.items():
-            if key not in quarter_statements.items:
-                quarter_statements.items[key] = model.FinancialItemAlphavantage(key)
+            column[index] = value
+
+    return columns
+
+
+def _build_statements(ticker: str, columns: dict[str, list[str | None]]) -> model.FinancialStatementsAlphavantage:
+    statements = model.FinancialStatementsAlphavantage(ticker)
+    items = statements.items
+
+    for key, column in columns.items():
+        key = model.intern_tag(key)
+        items[key] = model.FinancialItemAlphavantage(key, column)
+
+    return statements
+
+
+def parse_statement_columns(value: str | bytes, annual_tag: str = 'annualReports',
+                            quarter_tag: str = 'quarterlyReports', annual_periods: int | None = ANNUAL_PERIODS,
+                            quarter_periods: int | None = QUARTER_PERIODS) -> (str, dict[str, list[str | None]],
+                                                                               dict[str, list[str | None]]):
+    """
+    This function parses a statement payload to the ticker and the values per tag of the annual and quarterly
+    periods, plain lists that can be passed between processes before build_financial_statements
+    """
+    ticker, annuals, quarters = _load_reports(value, annual_tag, quarter_tag, annual_periods, quarter_periods)
+
+    return ticker, _report_columns(annuals), _report_columns(quarters)
+
+
+def build_financial_statements(ticker: str, annual_columns: dict[str, list[str | None]],
+                               quarter_columns: dict[str, list[str | None]]) -> (
+        model.FinancialStatementsAlphavantage, model.FinancialStatementsAlphavantage):
+    return _build_statements(ticker, annual_columns), _build_statements(ticker, quarter_columns)
+
+
+def parse_financial_statements(value: str | bytes, annual_tag: str = 'annualReports',
+                               quarter_tag: str = 'quarterlyReports', annual_periods: int | None = ANNUAL_PERIODS,
+                               quarter_periods: int | None = QUARTER_PERIODS) -> (
+        model.FinancialStatementsAlphavantage, model.FinancialStatementsAlphavantage):
+    """
+    This function parses a statement payload, keeping the given number of annual and quarterly periods,
+    None keeps the full history
+    """
+    return build_financial_statements(*parse_statement_columns(value, annual_tag, quarter_tag, annual_periods,
+                                                               quarter_periods))
+
+
+def parse_financial_matrix(value: str | bytes, annual_tag: str = 'annualReports', quarter_tag: str = 'quarterlyReports',
+                           annual_periods: int | None = ANNUAL_PERIODS,
+                           quarter_periods: int | None = QUARTER_PERIODS) -> (model.StatementMatrix,
+                                                                               model.StatementMatrix):
+    """
+    This function parses a statement payload into numeric matrices, the compact alternative to
+    parse_financial_statements
+    """
+    ticker, annuals, quarters = _load_reports(value, annual_tag, quarter_tag, annual_periods, quarter_periods)
+
+    return model.StatementMatrix.from_reports(ticker, annuals), model.StatementMatrix.from_reports(ticker, quarters)
 
-            match index:
-                case 0:
-                    quarter_statements.items[key].column_1 = value
-                case 1:
-                    quarter_statements.items[key].column_2 = value
-                case 2:
-                    quarter_statements.items[key].column_3 = value
 
-    return annual_statements, quarter_statements
+def _acquire_key(key: str | ApiKeyPool) -> str:
+    if isinstance(key, ApiKeyPool):
+        return key.acquire()
 
+    get_rate_governor().acquire(key)
+    return key
 
-def _get_alphavantage_data(function: str, ticker: str, key: str) -> str:
-    url = f"https://www.alphavantage.co/query?function={function}&symbol={ticker}&apikey={key}"
 
-    response = requests.get(url)
+async def _acquire_key_async(key: str | ApiKeyPool) -> str:
+    if isinstance(key, ApiKeyPool):
+        return await key.acquire_async()
 
-    if response.status_code != 200:
-        raise RequestFailedError(url, response.status_code)
+    await get_rate_governor().acquire_async(key)
+    return key
 
-    return response.text
 
+def _report_throttle(key: str | ApiKeyPool, api_key: str, message: str) -> None:
+    if isinstance(key, ApiKeyPool):
+        key.throttled(api_key, message)
+    else:
+        get_rate_governor().throttled(api_key, message)
 
-def get_company_data(ticker: str, key: str) -> model.AlphavantageData:
-    data = _get_alphavantage_data('OVERVIEW', ticker, key)
-    cpy = parse_company(data)
 
-    data = _get_alphavantage_data('INCOME_STATEMENT', ticker, key)
-    inc_stmts_a, inc_stmts_q = parse_financial_statements(data)
+def _fetch(query: str, key: str | ApiKeyPool) -> bytes:
+    """
+    This function makes a paced call to the API, retrying after a throttle payload
+    """
+    for _ in range(_THROTTLE_RETRIES):
+        api_key = _acquire_key(key)
+        url = f"https://www.alphavantage.co/query?{query}&apikey={api_key}"
+        response = get_transport().get(url)
 
-    data = _get_alphavantage_data('BALANCE_SHEET', ticker, key)
-    bs_stmts_a, bs_stmts_b = parse_financial_statements(data)
+        if response.status_code != 200:
+            raise RequestFailedError(url, response.status_code)
 
-    data = _get_alphavantage_data('CASH_FLOW', ticker, key)
-    cf_stmts_a, cf_stmts_q = parse_financial_statements(data)
+        message = _find_throttle(response.content)
+        if message is None:
+            return response.content
 
-    data = _get_alphavantage_data('EARNINGS', ticker, key)
-    earnings_a, earnings_b = parse_financial_statements(data, annual_tag='annualEarnings',
-                                                        quarter_tag='quarterlyEarnings')
+        _report_throttle(key, api_key, message)
 
-    return model.AlphavantageData(cpy, inc_stmts_a, inc_stmts_q, bs_stmts_a, bs_stmts_b, cf_stmts_a,
+    raise ApiThrottledError(message)
+
+
+async def _fetch_async(query: str, key: str | ApiKeyPool) -> bytes:
+    """
+    This function makes a paced call to the API without blocking the event loop, retrying after a
+    throttle payload
+    """
+    for _ in range(_THROTTLE_RETRIES):
+        api_key = await _acquire_key_async(key)
+        url = f"https://www.alphavantage.co/query?{query}&apikey={api_key}"
+        response = await get_async_transport().get(url)
+
+        if response.status_code != 200:
+            raise RequestFailedError(url, response.status_code)
+
+        message = _find_throttle(response.content)
+        if message is None:
+            return response.content
+
+        _report_throttle(key, api_key, message)
+
+    raise ApiThrottledError(message)
+
+
+def _get_alphavantage_data(function: str, ticker: str, key: str | ApiKeyPool) -> bytes:
+    params = {'function': function, 'symbol': ticker}
+    return _inflight.do((function, ticker), fetch_archived, 'alphavantage', params, _fetch,
+                        f"function={function}&symbol={ticker}", key)
+
+
+async def _get_alphavantage_data_async(function: str, ticker: str, key: str | ApiKeyPool) -> bytes:
+    params = {'function': function, 'symbol': ticker}
+    return await _inflight.do_async((function, ticker), fetch_archived_async, 'alphavantage', params, _fetch_async,
+                                    f"function={function}&symbol={ticker}", key)
+
+
+COMPANY_FUNCTIONS: tuple[str, ...] = ('OVERVIEW', 'INCOME_STATEMENT', 'BALANCE_SHEET', 'CASH_FLOW', 'EARNINGS')
+
+
+def _parse_function_data(function: str, data: bytes, annual_periods: int | None, quarter_periods: int | None):
+    """
+    This function parses the payload returned by one of the company functions
+    """
+    match function:
+        case 'OVERVIEW':
+            return parse_company(data)
+        case 'EARNINGS':
+            return parse_financial_statements(data, 'annualEarnings', 'quarterlyEarnings', annual_periods,
+                                              quarter_periods)
+        case _:
+            return parse_financial_statements(data, annual_periods=annual_periods, quarter_periods=quarter_periods)
+
+
+def build_company_data(results: dict) -> model.AlphavantageData:
+    inc_stmts_a, inc_stmts_q = results['INCOME_STATEMENT']
+    bs_stmts_a, bs_stmts_b = results['BALANCE_SHEET']
+    cf_stmts_a, cf_stmts_q = results['CASH_FLOW']
+    earnings_a, earnings_b = results['EARNINGS']
+
+    return model.AlphavantageData(results['OVERVIEW'], inc_stmts_a, inc_stmts_q, bs_stmts_a, bs_stmts_b, cf_stmts_a,
                                   cf_stmts_q, earnings_a, earnings_b)
 
 
+def get_company_data(ticker: str, key: str | ApiKeyPool, max_concurrency: int = 1,
+                     annual_periods: int | None = ANNUAL_PERIODS,
+                     quarter_periods: int | None = QUARTER_PERIODS) -> model.AlphavantageData:
+    """
+    This function downloads and parses the company overview and statements for the ticker. With a
+    max_concurrency above one the five calls are issued in parallel and parsed as they arrive
+    """
+    if max_concurrency <= 1:
+        results = {function: _parse_function_data(function, _get_alphavantage_data(function, ticker, key),
+                                                   annual_periods, quarter_periods)
+                   for function in COMPANY_FUNCTIONS}
+        return build_company_data(results)
+
+    results = dict()
+    executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(COMPANY_FUNCTIONS)))
+    futures = {executor.submit(_get_alphavantage_data, function, ticker, key): function
+               for function in COMPANY_FUNCTIONS}
+    try:
+        for future in as_completed(futures):
+            function = futures[future]
+            results[function] = _parse_function_data(function, future.result(), annual_periods, quarter_periods)
+    except BaseException:
+        # The calls still in flight may be paced for up to a minute, so they are not waited for
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+
+    executor.shutdown()
+    return build_company_data(results)
+
+
+def get_company_payloads(ticker: str, key: str | ApiKeyPool, max_concurrency: int = 1) -> dict[str, bytes]:
+    """
+    This function downloads the raw payloads of the company functions for the ticker, e.g. to parse them
+    in a ParsePool
+    """
+    if max_concurrency <= 1:
+        return {function: _get_alphavantage_data(function, ticker, key) for function in COMPANY_FUNCTIONS}
+
+    executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(COMPANY_FUNCTIONS)))
+    futures = {executor.submit(_get_alphavantage_data, function, ticker, key): function
+               for function in COMPANY_FUNCTIONS}
+    try:
+        payloads = {futures[future]: future.result() for future in as_completed(futures)}
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+
+    executor.shutdown()
+    return {function: payloads[function] for function in COMPANY_FUNCTIONS}
+
+
+async def get_company_data_async(ticker: str, key: str | ApiKeyPool, limiter: asyncio.Semaphore | None = None,
+                                 annual_periods: int | None = ANNUAL_PERIODS,
+                                 quarter_periods: int | None = QUARTER_PERIODS) -> model.AlphavantageData:
+    """
+    This function downloads the company overview and statements for the ticker, all five calls are
+    issued at once and parsed as they arrive. Pass a limiter shared across tickers to bound the number of
+    calls in flight
+    """
+    async def fetch(function: str) -> tuple[str, bytes]:
+        if limiter is None:
+            return function, await _get_alphavantage_data_async(function, ticker, key)
+
+        async with limiter:
+            return function, await _get_alphavantage_data_async(function, ticker, key)
+
+    tasks = [asyncio.ensure_future(fetch(function)) for function in COMPANY_FUNCTIONS]
+
+    results = dict()
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            function, data = await next_done
+            results[function] = _parse_function_data(function, data, annual_periods, quarter_periods)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    return build_company_data(results)
+
+
 def parse_earnings_file(data: str) -> list[model.EarningsAlphavantage]:
     source = StringIO(data)
     reader = csv.reader(source, delimiter=',')
@@ -144,7 +778,7 @@ def parse_earnings_file(data: str) -> list[model.EarningsAlphavantage]:
     earnings: list[model.EarningsAlphavantage] = list()
 
     for row in reader:
-        earnings.append(model.EarningsAlphavantage(row[0], row[1], row[2], row[3], row[4], row[5]))
+        earnings.append(model.EarningsAlphavantage(row[0], row[1], row[2], row[3], row[4], intern_text(row[5])))
 
     if not earnings:
         ApiFailedError('API calls exceeded')
@@ -152,11 +786,133 @@ def parse_earnings_file(data: str) -> list[model.EarningsAlphavantage]:
     return earnings
 
 
-def get_earnings_estimates(key: str) -> list[model.EarningsAlphavantage]:
-    url = f"https://www.alphavantage.co/query?function=EARNINGS_CALENDAR&horizon=3month&apikey={key}"
-    response = requests.get(url)
+def get_earnings_estimates(key: str | ApiKeyPool) -> list[model.EarningsAlphavantage]:
+    params = {'function': 'EARNINGS_CALENDAR', 'horizon': '3month'}
+    data = _inflight.do(_EARNINGS_QUERY, fetch_archived, 'alphavantage', params, _fetch, _EARNINGS_QUERY, key)
+    return parse_earnings_file(data.decode('utf-8'))
+
+
+async def get_earnings_estimates_async(key: str | ApiKeyPool) -> list[model.EarningsAlphavantage]:
+    params = {'function': 'EARNINGS_CALENDAR', 'horizon': '3month'}
+    data = await _inflight.do_async(_EARNINGS_QUERY, fetch_archived_async, 'alphavantage', params, _fetch_async,
+                                    _EARNINGS_QUERY, key)
+    return parse_earnings_file(data.decode('utf-8'))
+
 
-    if response.status_code != 200:
-        raise RequestFailedError(url, response.status_code)
+def _convert_dates(column: list[str]) -> list[datetime | None]:
+    """
+    This function converts a column of dates, each distinct date is parsed once by the shared date cache
+    """
+    dates = list()
+    for value in column:
+        try:
+            dates.append(model.parse_date_text(value) if value else None)
+        except ValueError:
+            dates.append(None)
 
-    return parse_earnings_file(response.text)
+    return dates
+
+
+def _convert_estimate(value: str) -> float:
+    try:
+        return float(value) if value else math.nan
+    except ValueError:
+        return math.nan
+
+
+def _build_earnings_batch(rows: list[list[str]]) -> model.EarningsBatch:
+    tickers, names, report_dates, fiscal_years, estimates, currencies = (list(column) for column in zip(*rows))
+
+    return model.EarningsBatch(tickers, names, _convert_dates(report_dates),
+                               _convert_dates(fiscal_years), estimates, array('d', map(_convert_estimate, estimates)),
+                               list(map(intern_text, currencies)))
+
+
+def parse_earnings_lines(lines: Iterable[bytes | str],
+                         chunk_size: int = _EARNINGS_CHUNK_SIZE) -> Iterator[model.EarningsBatch]:
+    """
+    This function parses the earnings calendar CSV line by line as it arrives, yielding columnar chunks of
+    up to chunk_size rows so only one chunk is held in memory. The lines must keep their endings, as with a
+    file, so a quoted field with a line break is read the same as by parse_earnings_file
+    """
+    reader = csv.reader(line.decode('utf-8') if isinstance(line, bytes) else line for line in lines)
+    if next(reader, None) is None:
+        return
+
+    rows = list()
+    for row in reader:
+        if len(row) < 6:
+            continue
+
+        rows.append(row[:6])
+        if len(rows) >= chunk_size:
+            yield _build_earnings_batch(rows)
+            rows = list()
+
+    if rows:
+        yield _build_earnings_batch(rows)
+
+
+def _split_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    This function splits the received chunks into lines that keep their endings, unlike iter_lines, which
+    drops them. A line is only yielded once its ending is complete, so a CRLF split across chunks stays whole
+    """
+    pending = b''
+    for chunk in chunks:
+        lines = (pending + chunk).splitlines(keepends=True)
+        pending = lines.pop() if lines and not lines[-1].endswith(b'\n') else b''
+        yield from lines
+
+    if pending:
+        yield pending
+
+
+def _stream_lines(query: str, key: str | ApiKeyPool) -> Iterator[bytes]:
+    """
+    This function makes a paced call to the API and yields the body line by line as it is received,
+    retrying after a throttle payload
+    """
+    for _ in range(_THROTTLE_RETRIES):
+        api_key = _acquire_key(key)
+        url = f"https://www.alphavantage.co/query?{query}&apikey={api_key}"
+        response = get_transport().get(url, stream=True)
+
+        try:
+            if response.status_code != 200:
+                raise RequestFailedError(url, response.status_code)
+
+            lines = _split_lines(response.iter_content(chunk_size=_STREAM_CHUNK_SIZE))
+            first = next(lines, b'')
+            if not first.lstrip().startswith(b'{'):
+                yield first
+                yield from lines
+                return
+
+            content = b''.join([first, *lines])
+        finally:
+            response.close()
+
+        message = _find_throttle(content)
+        if message is None:
+            raise ApiFailedError('API calls exceeded')
+
+        _report_throttle(key, api_key, message)
+
+    raise ApiThrottledError(message)
+
+
+def stream_earnings_estimates(key: str | ApiKeyPool,
+                              chunk_size: int = _EARNINGS_CHUNK_SIZE) -> Iterator[model.EarningsBatch]:
+    """
+    This function downloads the earnings calendar and yields it in columnar chunks while it is being
+    received, e.g. to insert each chunk with EarningsFileDatastore.insert_batch. When an archive is set the
+    payload is read in full so it can be archived or replayed
+    """
+    if get_archive() is not None:
+        params = {'function': 'EARNINGS_CALENDAR', 'horizon': '3month'}
+        data = fetch_archived('alphavantage', params, _fetch, _EARNINGS_QUERY, key)
+        yield from parse_earnings_lines(data.splitlines(keepends=True), chunk_size)
+        return
+
+    yield from parse_earnings_lines(_stream_lines(_EARNINGS_QUERY, key), chunk_size)
@@ -0,0 +1,219 @@
+# *******************************************************************************************
+#  File:  _archive.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['ArchiveEntry', 'ResponseArchive', 'get_archive', 'set_archive']
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Iterator, NamedTuple
+import gzip
+import hashlib
+import os
+import threading
+import orjson
+from gf_lib.errors import ArchiveMissError
+
+
+class ArchiveEntry(NamedTuple):
+    """
+    Holds the index record of an archived payload
+    """
+    source: str
+    params: dict
+    fetched_at: str
+    digest: str
+    size: int
+
+
+class ResponseArchive:
+    """
+    Stores raw service payloads on disk, compressed and addressed by their SHA-256 digest, with an index per
+    source keyed by the request parameters and the fetch time. In replay mode the fetchers read from the
+    archive instead of the network
+    """
+    _root: Path
+    _replay: bool
+    _lock: threading.Lock
+    _latest: dict[str, dict[bytes, ArchiveEntry]]
+
+    def __init__(self, root: Path | str, replay: bool = False) -> None:
+        self._root = Path(root)
+        self._replay = replay
+        self._lock = threading.Lock()
+        self._latest = dict()
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def replay(self) -> bool:
+        return self._replay
+
+    @staticmethod
+    def _params_key(params: dict) -> bytes:
+        return orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+
+    def _object_path(self, digest: str) -> Path:
+        return self._root.joinpath('objects', digest[:2], f"{digest}.gz")
+
+    def _index_path(self, source: str) -> Path:
+        return self._root.joinpath('index', f"{source}.jsonl")
+
+    @staticmethod
+    def _record(latest: dict[bytes, ArchiveEntry], key: bytes, entry: ArchiveEntry) -> None:
+        """
+        This function keeps the entry as the latest for its parameters unless a later fetch is already held
+        """
+        current = latest.get(key)
+        if current is None or current.fetched_at <= entry.fetched_at:
+            latest[key] = entry
+
+    def _load_index(self, source: str) -> dict[bytes, ArchiveEntry]:
+        """
+        This function returns the latest entry for each set of parameters of the source, reading the index
+        file on first use
+        """
+        latest = self._latest.get(source)
+        if latest is not None:
+            return latest
+
+        latest = dict()
+        index_file = self._index_path(source)
+        if index_file.exists():
+            with open(index_file, 'rb') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    entry = ArchiveEntry(**orjson.loads(line))
+                    self._record(latest, self._params_key(entry.params), entry)
+
+        self._latest[source] = latest
+        return latest
+
+    def store(self, source: str, params: dict, content: bytes, fetched_at: datetime | None = None) -> ArchiveEntry:
+        """
+        This function archives the payload and records it in the source index, identical payloads are
+        only stored once
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        fetched_at = (fetched_at or datetime.now(timezone.utc)).isoformat()
+        entry = ArchiveEntry(source, params, fetched_at, digest, len(content))
+
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = object_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_path.write_bytes(gzip.compress(content, compresslevel=6))
+            os.replace(temp_path, object_path)
+
+        with self._lock:
+            index_file = self._index_path(source)
+            index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(index_file, 'ab') as file:
+                file.write(orjson.dumps(entry._asdict()) + b'\n')
+
+            self._record(self._load_index(source), self._params_key(params), entry)
+
+        return entry
+
+    def load(self, digest: str) -> bytes:
+        """
+        This function returns the payload with the given digest
+        """
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            raise ArchiveMissError(f"Archived payload not found: {digest}")
+
+        return gzip.decompress(object_path.read_bytes())
+
+    def find(self, source: str, params: dict) -> ArchiveEntry | None:
+        with self._lock:
+            return self._load_index(source).get(self._params_key(params))
+
+    def latest(self, source: str, params: dict) -> bytes | None:
+        """
+        This function returns the most recently fetched payload for the source and parameters
+        """
+        entry = self.find(source, params)
+        if entry:
+            return self.load(entry.digest)
+
+    def entries(self, source: str) -> Iterator[ArchiveEntry]:
+        """
+        This function yields the latest entry for each set of parameters archived for the source
+        """
+        with self._lock:
+            entries = list(self._load_index(source).values())
+
+        yield from entries
+
+
+_archive: ResponseArchive | None = None
+
+
+def get_archive() -> ResponseArchive | None:
+    return _archive
+
+
+def set_archive(value: ResponseArchive | None) -> None:
+    """
+    This function sets the archive used by the fetchers, pass None to stop archiving
+    """
+    global _archive
+    _archive = value
+
+
+def fetch_archived(source: str, params: dict, function: Callable[..., bytes], *args) -> bytes:
+    """
+    This function calls the fetch function and archives its payload, or in replay mode returns the
+    archived payload without calling it
+    """
+    archive = _archive
+    if archive is None:
+        return function(*args)
+
+    if archive.replay:
+        content = archive.latest(source, params)
+        if content is None:
+            raise ArchiveMissError(f"No archived {source} payload for: {params}")
+        return content
+
+    content = function(*args)
+    archive.store(source, params, content)
+    return content
+
+
+async def fetch_archived_async(source: str, params: dict, function: Callable[..., Awaitable[bytes]],
+                               *args) -> bytes:
+    """
+    This function awaits the fetch function and archives its payload, or in replay mode returns the
+    archived payload without calling it
+    """
+    archive = _archive
+    if archive is None:
+        return await function(*args)
+
+    if archive.replay:
+        content = archive.latest(source, params)
+        if content is None:
+            raise ArchiveMissError(f"No archived {source} payload for: {params}")
+        return content
+
+    content = await function(*args)
+    archive.store(source, params, content)
+    return content
@@ -0,0 +1,85 @@
+# *******************************************************************************************
+#  File:  _coalesce.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['SingleFlight']
+
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable
+import asyncio
+import threading
+import weakref
+
+
+class SingleFlight:
+    """
+    Coalesces identical calls that are in flight at the same time, the first caller makes the call
+    and every other caller with the same key waits for and shares its result
+    """
+    _lock: threading.Lock
+    _calls: dict[Hashable, Future]
+    _tasks: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, asyncio.Task]]
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls = dict()
+        self._tasks = weakref.WeakKeyDictionary()
+
+    def do(self, key: Hashable, function: Callable[..., Any], *args) -> Any:
+        """
+        This function calls function(*args), unless a call with the same key is already running in another
+        thread, in which case it waits for that call's result
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def do_async(self, key: Hashable, function: Callable[..., Awaitable[Any]], *args) -> Any:
+        """
+        This function awaits function(*args), unless a call with the same key is already running on the
+        event loop, in which case it awaits that call's result
+        """
+        tasks = self._tasks.setdefault(asyncio.get_running_loop(), dict())
+
+        task = tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(function(*args))
+            tasks[key] = task
+            task.add_done_callback(lambda _: tasks.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
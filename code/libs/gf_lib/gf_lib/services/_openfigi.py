@@ -15,12 +15,16 @@ __license__ = "MIT"
 __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
-__all__ = ['get_openfigi_codes', 'FigiCode']
+__all__ = ['get_openfigi_codes', 'FigiCode', 'parse_openfigi_codes', 'get_openfigi_codes_async']
 
 from typing import NamedTuple
 import orjson
-import requests
 from gf_lib.errors import RequestFailedError, RequestMaxFailedError, RequestResponseError
+from ._transport import get_transport, get_async_transport
+from ._coalesce import SingleFlight
+from ._archive import fetch_archived, fetch_archived_async
+
+_inflight: SingleFlight = SingleFlight()
 
 
 class FigiCode(NamedTuple):
@@ -31,19 +35,23 @@ class FigiCode(NamedTuple):
     figi: str | None
 
 
-def get_openfigi_codes(url: str, key: str, tickers: list[str]) -> list[FigiCode] | None:
+def _build_request(key: str, tickers: list[str]) -> (bytes, dict[str, str]):
     query = [{'idType': 'TICKER', 'idValue': ticker, 'exchCode': 'US'} for ticker in tickers]
-    headers = {'Content-Type': 'text/json', 'X-OPENFIGI-APIKEY': key}
+    headers = {'Content-Type': 'application/json', 'X-OPENFIGI-APIKEY': key}
+
+    return orjson.dumps(query), headers
+
 
-    response = requests.post(url=url, headers=headers, json=query)
+def _check_status(url: str, status_code: int) -> None:
+    if status_code == 429:
+        raise RequestMaxFailedError(url, status_code)
 
-    if response.status_code == 429:
-        raise RequestMaxFailedError(url, response.status_code)
+    if status_code != 200:
+        raise RequestFailedError(url, status_code)
 
-    if response.status_code != 200:
-        raise RequestFailedError(url, response.status_code)
 
-    content = orjson.loads(response.text)
+def parse_openfigi_codes(value: str | bytes, tickers: list[str]) -> list[FigiCode] | None:
+    content = orjson.loads(value)
 
     if 'error' in content[0]:
         msg: str = content[0]['error']
@@ -65,3 +73,32 @@ def get_openfigi_codes(url: str, key: str, tickers: list[str]) -> list[FigiCode]
         records.append(FigiCode(ticker, figi))
 
     return records
+
+
+def _fetch(url: str, key: str, tickers: list[str]) -> bytes:
+    query, headers = _build_request(key, tickers)
+    response = get_transport().post(url, query, headers=headers)
+    _check_status(url, response.status_code)
+
+    return response.content
+
+
+async def _fetch_async(url: str, key: str, tickers: list[str]) -> bytes:
+    query, headers = _build_request(key, tickers)
+    response = await get_async_transport().post(url, query, headers=headers)
+    _check_status(url, response.status_code)
+
+    return response.content
+
+
+def get_openfigi_codes(url: str, key: str, tickers: list[str]) -> list[FigiCode] | None:
+    params = {'url': url, 'tickers': tickers}
+    content = _inflight.do((url, tuple(tickers)), fetch_archived, 'openfigi', params, _fetch, url, key, tickers)
+    return parse_openfigi_codes(content, tickers)
+
+
+async def get_openfigi_codes_async(url: str, key: str, tickers: list[str]) -> list[FigiCode] | None:
+    params = {'url': url, 'tickers': tickers}
+    content = await _inflight.do_async((url, tuple(tickers)), fetch_archived_async, 'openfigi', params,
+                                       _fetch_async, url, key, tickers)
+    return parse_openfigi_codes(content, tickers)
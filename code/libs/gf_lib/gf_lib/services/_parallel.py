@@ -0,0 +1,195 @@
+# *******************************************************************************************
+#  File:  _parallel.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['ParsePool']
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
+import os
+import threading
+import attrs
+import gf_lib.model as model
+from . import _alphavantage as alphavantage
+from . import _sec as sec
+from . import _wikipedia as wikipedia
+
+
+# The workers run in the pool processes and return plain tuples and lists, which pickle compactly, the
+# records are rebuilt in the calling process without running the validators a second time
+def _rebuild_statements(value: tuple) -> tuple:
+    return alphavantage.build_financial_statements(*value)
+
+
+def _company_worker(payload: bytes) -> tuple:
+    return attrs.astuple(alphavantage.parse_company(payload))
+
+
+def _rebuild_company(value: tuple) -> model.CompanyAlphavantage:
+    return model.build_trusted(model.CompanyAlphavantage, *value)
+
+
+def _sec_map_worker(payload: bytes) -> list[tuple] | None:
+    records = sec.parse_sec_map(payload)
+    if records is not None:
+        return [(record.cik_str, record.ticker, record.title) for record in records]
+
+
+def _rebuild_sec_map(value: list[tuple] | None) -> list[sec.SecMap] | None:
+    if value is not None:
+        return sec.sec_map_from_rows(value)
+
+
+def _sp_tuples(entries: list[wikipedia.SpEntry] | None) -> list[tuple] | None:
+    if entries is not None:
+        return [attrs.astuple(entry) for entry in entries]
+
+
+def _sp600_worker(payload: bytes) -> list[tuple] | None:
+    return _sp_tuples(wikipedia.parse_sp600(payload))
+
+
+def _sp400_worker(payload: bytes) -> list[tuple] | None:
+    return _sp_tuples(wikipedia.parse_sp400(payload))
+
+
+def _sp500_worker(payload: bytes) -> list[tuple] | None:
+    return _sp_tuples(wikipedia.parse_sp500(payload))
+
+
+def _rebuild_sp(value: list[tuple] | None) -> list[wikipedia.SpEntry] | None:
+    if value is not None:
+        return [model.build_trusted(wikipedia.SpEntry, *entry) for entry in value]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+_STAGES: dict[str, tuple[Callable, Callable]] = {
+    'statements': (alphavantage.parse_statement_columns, _rebuild_statements),
+    'company': (_company_worker, _rebuild_company),
+    'sec_map': (_sec_map_worker, _rebuild_sec_map),
+    'sp600': (_sp600_worker, _rebuild_sp),
+    'sp400': (_sp400_worker, _rebuild_sp),
+    'sp500': (_sp500_worker, _rebuild_sp),
+    'sp100': (wikipedia.parse_sp100_tickers, _identity),
+}
+
+
+class ParsePool:
+    """
+    Parses raw payloads from the fetchers in a pool of processes, so the CPU bound work of a universe load
+    uses every core. The kinds are: statements, company, sec_map, sp600, sp400, sp500 and sp100
+    """
+    _max_workers: int
+    _max_pending: int
+    _executor: ProcessPoolExecutor | None
+    _lock: threading.Lock
+
+    def __init__(self, max_workers: int | None = None, max_pending: int | None = None) -> None:
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._max_pending = max_pending or self._max_workers * 4
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'ParsePool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            return self._executor
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def submit(self, kind: str, payload: bytes, *args) -> Future:
+        """
+        This function parses the payload in the pool, the future holds the same result as the matching
+        parse function, e.g. parse_financial_statements for statements
+        """
+        worker, rebuild = _STAGES[kind]
+        result = Future()
+
+        def done(future: Future) -> None:
+            try:
+                result.set_result(rebuild(future.result()))
+            except BaseException as e:
+                result.set_exception(e)
+
+        self._get_executor().submit(worker, payload, *args).add_done_callback(done)
+        return result
+
+    def map(self, kind: str, payloads: Iterable[bytes], *args) -> Iterator:
+        """
+        This function parses the payloads in the pool and yields the results in order, reading ahead at
+        most max_pending payloads
+        """
+        pending: deque[Future] = deque()
+
+        for payload in payloads:
+            pending.append(self.submit(kind, payload, *args))
+            if len(pending) >= self._max_pending:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+    def _submit_function(self, function: str, payload: bytes, annual_periods: int | None,
+                         quarter_periods: int | None) -> Future:
+        match function:
+            case 'OVERVIEW':
+                return self.submit('company', payload)
+            case 'EARNINGS':
+                return self.submit('statements', payload, 'annualEarnings', 'quarterlyEarnings', annual_periods,
+                                   quarter_periods)
+            case _:
+                return self.submit('statements', payload, 'annualReports', 'quarterlyReports', annual_periods,
+                                   quarter_periods)
+
+    def parse_company_data(self, payloads: Iterable[dict[str, bytes]],
+                           annual_periods: int | None = alphavantage.ANNUAL_PERIODS,
+                           quarter_periods: int | None = alphavantage.QUARTER_PERIODS
+                           ) -> Iterator[model.AlphavantageData]:
+        """
+        This function parses the payloads returned by get_company_payloads for many tickers and yields the
+        company data in order, e.g. pool.parse_company_data(get_company_payloads(t, key) for t in tickers)
+        """
+        pending: deque[dict[str, Future]] = deque()
+
+        for results in payloads:
+            pending.append({function: self._submit_function(function, payload, annual_periods, quarter_periods)
+                            for function, payload in results.items()})
+            if len(pending) * len(alphavantage.COMPANY_FUNCTIONS) >= self._max_pending:
+                yield alphavantage.build_company_data({function: future.result()
+                                                       for function, future in pending.popleft().items()})
+
+        while pending:
+            yield alphavantage.build_company_data({function: future.result()
+                                                   for function, future in pending.popleft().items()})
@@ -15,24 +15,56 @@ __license__ = "MIT"
 __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
-__all__ = ['get_sec_map']
+__all__ = ['get_sec_map', 'parse_sec_map', 'get_sec_map_async', 'get_sec_index', 'get_sec_payload', 'sec_map_from_rows']
 
+from pathlib import Path
+from typing import Iterable
+from urllib.parse import urlparse
+import mmap
+import os
 import attrs
 import attrs.validators as validators
 import orjson
-import requests
 from gf_lib.errors import RequestFailedError
+from ._transport import get_transport, get_async_transport
+from ._archive import fetch_archived, fetch_archived_async, get_archive
 
 
-def _get_page(url: str) -> str:
+def _download_page(url: str) -> bytes:
+    response = get_transport().get(url)
+    if response.status_code == 200:
+        return response.content
+
+    raise RequestFailedError(url, response.status_code)
+
+
+async def _download_page_async(url: str) -> bytes:
+    response = await get_async_transport().get(url)
+    if response.status_code == 200:
+        return response.content
+
+    raise RequestFailedError(url, response.status_code)
+
+
+def _get_page(url: str) -> bytes:
     """
     This function downloads the page specified by the URL
     """
-    response = requests.get(url)
-    if response.status_code == 200:
-        return response.text
+    return fetch_archived('sec', {'url': url}, _download_page, url)
 
-    raise RequestFailedError(url, response.status_code)
+
+async def _get_page_async(url: str) -> bytes:
+    """
+    This function downloads the page specified by the URL without blocking the event loop
+    """
+    return await fetch_archived_async('sec', {'url': url}, _download_page_async, url)
+
+
+def get_sec_payload(url: str) -> bytes:
+    """
+    This function returns the raw ticker file, e.g. to parse it in a ParsePool
+    """
+    return _get_page(url)
 
 
 @attrs.frozen
@@ -44,9 +76,7 @@ class SecMap:
     title: str = attrs.field(eq=False, validator=[validators.instance_of(str)])
 
 
-def get_sec_map(url: str) -> list[SecMap] | None:
-    contents = _get_page(url)
-
+def parse_sec_map(contents: str | bytes) -> list[SecMap] | None:
     if contents:
         data = orjson.loads(contents)
 
@@ -56,3 +86,116 @@ def get_sec_map(url: str) -> list[SecMap] | None:
             records.append(SecMap(**row))
 
         return records
+
+
+def _snapshot_paths(url: str, cache_folder: Path) -> (Path, Path, Path):
+    """
+    This function returns the paths of the raw snapshot, its HTTP validators and the parsed index
+    """
+    name = Path(urlparse(url).path).stem or 'sec'
+    return (cache_folder.joinpath(f"{name}.json"), cache_folder.joinpath(f"{name}.meta.json"),
+            cache_folder.joinpath(f"{name}.index.json"))
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    temp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    temp_path.write_bytes(content)
+    os.replace(temp_path, path)
+
+
+def _build_sec_map(cik_str: str, ticker: str, title: str) -> SecMap:
+    record = object.__new__(SecMap)
+    object.__setattr__(record, 'cik_str', cik_str)
+    object.__setattr__(record, 'ticker', ticker)
+    object.__setattr__(record, 'title', title)
+    return record
+
+
+def sec_map_from_rows(rows: Iterable[tuple[str, str, str]]) -> list[SecMap]:
+    """
+    This function builds the records from cik_str, ticker and title rows taken from records that were
+    already validated, e.g. the parsed index, without running the validators again
+    """
+    return [_build_sec_map(cik_str, ticker, title) for cik_str, ticker, title in rows]
+
+
+def _load_index(index_file: Path) -> list[SecMap]:
+    with open(index_file, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+        with memoryview(content) as view:
+            rows = orjson.loads(view)
+
+    return sec_map_from_rows(rows)
+
+
+def _archive_snapshot(url: str, content: bytes) -> None:
+    """
+    This function records the payload in the response archive, if one is set, under the same key as the
+    uncached fetch so it can be replayed
+    """
+    archive = get_archive()
+    if archive is not None:
+        archive.store('sec', {'url': url}, content)
+
+
+def _get_sec_map_cached(url: str, cache_folder: Path) -> list[SecMap] | None:
+    """
+    This function makes a conditional request for the file, when the SEC reports it unchanged the parsed
+    index written after the last download is loaded instead. Either way the payload is archived
+    """
+    cache_folder.mkdir(parents=True, exist_ok=True)
+    snapshot_file, meta_file, index_file = _snapshot_paths(url, cache_folder)
+
+    headers = dict()
+    if meta_file.exists() and index_file.exists():
+        meta = orjson.loads(meta_file.read_bytes())
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+    response = get_transport().get(url, headers=headers)
+
+    if response.status_code == 304:
+        if snapshot_file.exists():
+            _archive_snapshot(url, snapshot_file.read_bytes())
+        return _load_index(index_file)
+
+    if response.status_code != 200:
+        raise RequestFailedError(url, response.status_code)
+
+    _archive_snapshot(url, response.content)
+
+    records = parse_sec_map(response.content)
+    if records is None:
+        return None
+
+    _write_atomic(snapshot_file, response.content)
+    _write_atomic(index_file, orjson.dumps([(row.cik_str, row.ticker, row.title) for row in records]))
+    _write_atomic(meta_file, orjson.dumps({'url': url, 'etag': response.headers.get('ETag'),
+                                           'last_modified': response.headers.get('Last-Modified')}))
+
+    return records
+
+
+def get_sec_map(url: str, cache_folder: Path | str | None = None) -> list[SecMap] | None:
+    """
+    This function returns the SEC ticker to CIK map, with a cache folder the file is only downloaded
+    when it has changed since the last call
+    """
+    archive = get_archive()
+    if cache_folder is None or (archive and archive.replay):
+        return parse_sec_map(_get_page(url))
+
+    return _get_sec_map_cached(url, Path(cache_folder))
+
+
+def get_sec_index(url: str, cache_folder: Path | str | None = None) -> dict[str, SecMap]:
+    """
+    This function returns the SEC map keyed by ticker
+    """
+    records = get_sec_map(url, cache_folder)
+    return {row.ticker: row for row in records} if records else dict()
+
+
+async def get_sec_map_async(url: str) -> list[SecMap] | None:
+    return parse_sec_map(await _get_page_async(url))
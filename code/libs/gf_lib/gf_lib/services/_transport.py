@@ -0,0 +1,187 @@
+# *******************************************************************************************
+#  File:  _transport.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+from __future__ import annotations
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['HttpTransport', 'get_transport', 'set_transport', 'HttpResponse', 'AsyncHttpTransport',
+           'get_async_transport', 'close_async_transport']
+
+from typing import NamedTuple, TYPE_CHECKING
+import asyncio
+import threading
+import weakref
+import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_DEFAULT_TIMEOUT: tuple[float, float] = (10.0, 60.0)
+_DEFAULT_HEADERS: dict[str, str] = {
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'User-Agent': 'Good Fundamentals james@developernotes.org'
+}
+
+
+class HttpTransport:
+    """
+    Holds a single requests session shared by the service modules, so connections are kept alive and
+    pooled per host instead of being opened for every call
+    """
+    _session: requests.Session
+    _timeout: tuple[float, float]
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 20,
+                 timeout: tuple[float, float] = _DEFAULT_TIMEOUT) -> None:
+        self._timeout = timeout
+        self._session = requests.Session()
+        self._session.headers.update(_DEFAULT_HEADERS)
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return self._timeout
+
+    def get(self, url: str, params: dict | None = None, headers: dict | None = None,
+            stream: bool = False) -> requests.Response:
+        """
+        This function issues a GET request over the pooled session, the body is available
+        undecoded in response.content
+        """
+        return self._session.get(url, params=params, headers=headers, timeout=self._timeout, stream=stream)
+
+    def post(self, url: str, content: bytes, headers: dict | None = None) -> requests.Response:
+        """
+        This function issues a POST request with a pre-encoded body over the pooled session
+        """
+        return self._session.post(url, data=content, headers=headers, timeout=self._timeout)
+
+    def close(self) -> None:
+        self._session.close()
+
+
+_transport: HttpTransport | None = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """
+    This function returns the shared transport, creating it on first use
+    """
+    global _transport
+
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HttpTransport()
+
+    return _transport
+
+
+def set_transport(transport: HttpTransport | None) -> None:
+    """
+    This function replaces the shared transport, passing None resets it to the default on next use
+    """
+    global _transport
+
+    with _transport_lock:
+        if _transport is not None and _transport is not transport:
+            _transport.close()
+        _transport = transport
+
+
+class HttpResponse(NamedTuple):
+    """
+    Holds the parts of a response the async fetchers need, the body is read in full as bytes
+    """
+    status_code: int
+    content: bytes
+    headers: dict[str, str]
+
+
+class AsyncHttpTransport:
+    """
+    Holds an aiohttp session bound to one event loop, so many requests can be in flight on a single thread
+    """
+    _session: aiohttp.ClientSession | None
+    _limit: int
+    _limit_per_host: int
+    _timeout: tuple[float, float]
+
+    def __init__(self, limit: int = 200, limit_per_host: int = 20,
+                 timeout: tuple[float, float] = _DEFAULT_TIMEOUT) -> None:
+        self._session = None
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._timeout = timeout
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # aiohttp is only imported once an async call is made, so the sync services do not depend on it
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._limit, limit_per_host=self._limit_per_host)
+            timeout = aiohttp.ClientTimeout(sock_connect=self._timeout[0], sock_read=self._timeout[1])
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout, headers=_DEFAULT_HEADERS,
+                                                  auto_decompress=True)
+        return self._session
+
+    async def get(self, url: str, params: dict | None = None, headers: dict | None = None) -> HttpResponse:
+        async with self._get_session().get(url, params=params, headers=headers) as response:
+            content = await response.read()
+            return HttpResponse(response.status, content, dict(response.headers))
+
+    async def post(self, url: str, content: bytes, headers: dict | None = None) -> HttpResponse:
+        async with self._get_session().post(url, data=content, headers=headers) as response:
+            body = await response.read()
+            return HttpResponse(response.status, body, dict(response.headers))
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+_async_transports: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHttpTransport] = \
+    weakref.WeakKeyDictionary()
+
+
+def get_async_transport() -> AsyncHttpTransport:
+    """
+    This function returns the async transport for the running event loop, creating it on first use
+    """
+    loop = asyncio.get_running_loop()
+
+    transport = _async_transports.get(loop)
+    if transport is None:
+        transport = AsyncHttpTransport()
+        _async_transports[loop] = transport
+
+    return transport
+
+
+async def close_async_transport() -> None:
+    """
+    This function closes the async transport of the running event loop, call it before the loop ends
+    """
+    transport = _async_transports.pop(asyncio.get_running_loop(), None)
+
+    if transport is not None:
+        await transport.close()
@@ -15,13 +15,17 @@ __license__ = "MIT"
 __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
-__all__ = ['SpEntry', 'get_sp600', 'get_sp400', 'get_sp500', 'get_sp100_tickers']
+__all__ = ['SpEntry', 'get_sp600', 'get_sp400', 'get_sp500', 'get_sp100_tickers', 'parse_sp600', 'parse_sp400',
+           'parse_sp500', 'parse_sp100_tickers', 'get_sp600_async', 'get_sp400_async', 'get_sp500_async',
+           'get_sp100_tickers_async', 'get_wikipedia_page']
 
 import attrs
 import attrs.validators as validators
-import requests
 from bs4 import BeautifulSoup
 from gf_lib.errors import RequestFailedError
+from gf_lib.utils import intern_text
+from ._transport import get_transport, get_async_transport
+from ._archive import fetch_archived, fetch_archived_async
 
 
 @attrs.frozen
@@ -33,20 +37,44 @@ class SpEntry:
     sub_industry: str = attrs.field(eq=False, validator=[validators.instance_of(str)])
 
 
-def _get_page(url: str) -> str:
+def _download_page(url: str) -> bytes:
+    response = get_transport().get(url)
+    if response.status_code == 200:
+        return response.content
+
+    raise RequestFailedError(url, response.status_code)
+
+
+async def _download_page_async(url: str) -> bytes:
+    response = await get_async_transport().get(url)
+    if response.status_code == 200:
+        return response.content
+
+    raise RequestFailedError(url, response.status_code)
+
+
+def _get_page(url: str) -> bytes:
     """
     This function downloads the page specified by the URL
     """
-    response = requests.get(url)
-    if response.status_code == 200:
-        return response.text
+    return fetch_archived('wikipedia', {'url': url}, _download_page, url)
 
-    raise RequestFailedError(url, response.status_code)
 
+async def _get_page_async(url: str) -> bytes:
+    """
+    This function downloads the page specified by the URL without blocking the event loop
+    """
+    return await fetch_archived_async('wikipedia', {'url': url}, _download_page_async, url)
 
-def get_sp600(url: str) -> list[SpEntry] | None:
-    contents = _get_page(url)
 
+def get_wikipedia_page(url: str) -> bytes:
+    """
+    This function returns the raw page, e.g. to parse it in a ParsePool
+    """
+    return _get_page(url)
+
+
+def parse_sp600(contents: str | bytes) -> list[SpEntry] | None:
     if contents:
         constituuents: list[SpEntry] = list()
 
@@ -66,13 +94,11 @@ def get_sp600(url: str) -> list[SpEntry] | None:
                         if name == 'Company':
                             continue
 
-                        constituuents.append(SpEntry(ticker, name, cik, sub_industry))
+                        constituuents.append(SpEntry(ticker, name, cik, intern_text(sub_industry)))
         return constituuents
 
 
-def get_sp400(url: str) -> list[SpEntry] | None:
-    contents = _get_page(url)
-
+def parse_sp400(contents: str | bytes) -> list[SpEntry] | None:
     if contents:
         constituuents: list[SpEntry] = list()
 
@@ -91,13 +117,11 @@ def get_sp400(url: str) -> list[SpEntry] | None:
                         if name == 'Security':
                             continue
 
-                        constituuents.append(SpEntry(ticker, name, '0000000000', sub_industry))
+                        constituuents.append(SpEntry(ticker, name, '0000000000', intern_text(sub_industry)))
         return constituuents
 
 
-def get_sp500(url: str) -> list[SpEntry] | None:
-    contents = _get_page(url)
-
+def parse_sp500(contents: str | bytes) -> list[SpEntry] | None:
     if contents:
         constituuents: list[SpEntry] = list()
 
@@ -117,13 +141,11 @@ def get_sp500(url: str) -> list[SpEntry] | None:
                         if name == 'Security':
                             continue
 
-                        constituuents.append(SpEntry(ticker, name, cik, sub_industry))
+                        constituuents.append(SpEntry(ticker, name, cik, intern_text(sub_industry)))
         return constituuents
 
 
-def get_sp100_tickers(url: str) -> list[str] | None:
-    contents = _get_page(url)
-
+def parse_sp100_tickers(contents: str | bytes) -> list[str] | None:
     if contents:
         constituuents: list[str] = list()
 
@@ -143,3 +165,35 @@ def get_sp100_tickers(url: str) -> list[str] | None:
 
                         constituuents.append(ticker)
         return constituuents
+
+
+def get_sp600(url: str) -> list[SpEntry] | None:
+    return parse_sp600(_get_page(url))
+
+
+async def get_sp600_async(url: str) -> list[SpEntry] | None:
+    return parse_sp600(await _get_page_async(url))
+
+
+def get_sp400(url: str) -> list[SpEntry] | None:
+    return parse_sp400(_get_page(url))
+
+
+async def get_sp400_async(url: str) -> list[SpEntry] | None:
+    return parse_sp400(await _get_page_async(url))
+
+
+def get_sp500(url: str) -> list[SpEntry] | None:
+    return parse_sp500(_get_page(url))
+
+
+async def get_sp500_async(url: str) -> list[SpEntry] | None:
+    return parse_sp500(await _get_page_async(url))
+
+
+def get_sp100_tickers(url: str) -> list[str] | None:
+    return parse_sp100_tickers(_get_page(url))
+
+
+async def get_sp100_tickers_async(url: str) -> list[str] | None:
+    return parse_sp100_tickers(await _get_page_async(url))
@@ -0,0 +1,111 @@
+# *******************************************************************************************
+#  File:  _strings.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+__all__ = ['StringPool', 'PoolStats', 'get_string_pool', 'intern_text']
+
+import sys
+import attrs
+
+
+@attrs.frozen
+class PoolStats:
+    """
+    Holds the usage of a string pool, saved_bytes is the size of the duplicate strings that were replaced
+    by the pooled copy and so could be freed, not_pooled counts the new values turned away once it was full
+    """
+    distinct: int
+    lookups: int
+    shared: int
+    saved_bytes: int
+    not_pooled: int
+
+
+class StringPool:
+    """
+    Holds one copy of each distinct string, so the values that repeat across records, e.g. the exchange,
+    currency or sub industry, share a single object. It is meant for fields with few distinct values, the
+    pool stops growing at max_size and returns new values unchanged, so a field with a value per ticker
+    cannot make it grow without limit. Statement tags use the TagRegistry instead, which also gives them
+    ids. The counters are not locked and may be approximate when the pool is used from several threads
+    """
+    __slots__ = ('_values', '_max_size', '_lookups', '_shared', '_saved_bytes', '_not_pooled')
+
+    def __init__(self, max_size: int = 4_096) -> None:
+        self._values: dict[str, str] = dict()
+        self._max_size = max_size
+        self._lookups = 0
+        self._shared = 0
+        self._saved_bytes = 0
+        self._not_pooled = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._values
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def intern(self, value: str | None) -> str | None:
+        """
+        This function returns the pooled copy of the string, adding it to the pool when it is new and the
+        pool is not full. Values that are not strings are returned unchanged
+        """
+        if type(value) is not str:
+            return value
+
+        self._lookups += 1
+        pooled = self._values.get(value)
+
+        if pooled is None:
+            if len(self._values) >= self._max_size:
+                self._not_pooled += 1
+                return value
+
+            pooled = self._values.setdefault(value, value)
+
+        if pooled is not value:
+            self._shared += 1
+            self._saved_bytes += sys.getsizeof(value)
+
+        return pooled
+
+    def stats(self) -> PoolStats:
+        return PoolStats(len(self._values), self._lookups, self._shared, self._saved_bytes, self._not_pooled)
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._lookups = 0
+        self._shared = 0
+        self._saved_bytes = 0
+        self._not_pooled = 0
+
+
+_pool: StringPool = StringPool()
+
+
+def get_string_pool() -> StringPool:
+    return _pool
+
+
+def intern_text(value: str | None) -> str | None:
+    """
+    This function returns the copy of the string held by the library's pool
+    """
+    return _pool.intern(value)
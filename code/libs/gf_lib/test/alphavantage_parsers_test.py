@@ -16,8 +16,16 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 
+import asyncio
+import threading
+import time
+import orjson
+import pytest
+import gf_lib.services._alphavantage as alphavantage
+from gf_lib.errors import ApiFailedError
 from gf_lib.services import parse_financial_statements, parse_company, get_company_data, \
-    get_earnings_estimates, parse_earnings_file
+    get_earnings_estimates, parse_earnings_file, get_company_data_async, parse_earnings_lines, \
+    stream_earnings_estimates, set_transport, HttpTransport, ParsePool, get_company_payloads
 
 
 _company = """
@@ -3633,21 +3641,185 @@ def test_parse_earnings() -> None:
     assert quarter.items["fiscalDateEnding"].column_3 == "2021-09-30"
 
 
+def test_truncated_reports() -> None:
+    data = orjson.loads(_income_statements)
+    ticker, annuals, quarters = alphavantage._load_reports(_income_statements, 'annualReports', 'quarterlyReports', 5, 3)
+
+    assert ticker == 'IBM'
+    assert annuals == data['annualReports'][:5]
+    assert quarters == data['quarterlyReports'][:3]
+
+
+def test_truncated_reports_fallback() -> None:
+    value = b'{"symbol": "IBM", "annualReports": [{"a": "}{", "b": "q\\"}"}, {"a": "1"}], "quarterlyReports": []}'
+    assert alphavantage._take_reports(value, 'annualReports', 5) is None
+
+    annual, quarter = parse_financial_statements(value)
+    assert annual.items['a'].column_1 == '}{'
+    assert annual.items['a'].column_2 == '1'
+    assert not quarter.items
+
+
 def test_parse_company() -> None:
     cpy = parse_company(_company)
     assert cpy
 
 
+def test_parse_company_bytes() -> None:
+    cpy = parse_company(_company.encode('utf-8'))
+    assert cpy.ticker == 'IBM'
+
+
 def test_get_company_data() -> None:
     data = get_company_data('IBM', 'TK7LTJYNCWD69QRH')
     assert data
 
 
+def _fake_payloads() -> dict[str, bytes]:
+    return {'OVERVIEW': _company.encode(), 'INCOME_STATEMENT': _income_statements.encode(),
+            'BALANCE_SHEET': _balance_sheets.encode(), 'CASH_FLOW': _cash_flows.encode(),
+            'EARNINGS': _earnings.encode()}
+
+
+def test_company_data_concurrent(monkeypatch) -> None:
+    payloads = _fake_payloads()
+    monkeypatch.setattr(alphavantage, '_get_alphavantage_data', lambda function, ticker, key: payloads[function])
+
+    sequential = get_company_data('IBM', 'demo')
+    concurrent = get_company_data('IBM', 'demo', max_concurrency=5)
+
+    assert concurrent.company.ticker == 'IBM'
+    assert concurrent.income_annual.items['fiscalDateEnding'].column_1 == '2021-12-31'
+    assert concurrent.earnings_quarter.items['fiscalDateEnding'].column_3 == '2021-09-30'
+    assert concurrent == sequential
+
+
+def test_company_data_failure(monkeypatch) -> None:
+    release = threading.Event()
+
+    def fake_fetch(function: str, ticker: str, key: str) -> bytes:
+        if function == 'OVERVIEW':
+            raise ApiFailedError('Invalid API call.')
+
+        release.wait(30)
+        return b''
+
+    monkeypatch.setattr(alphavantage, '_get_alphavantage_data', fake_fetch)
+
+    started = time.monotonic()
+    try:
+        with pytest.raises(ApiFailedError):
+            get_company_data('IBM', 'demo', max_concurrency=5)
+
+        with pytest.raises(ApiFailedError):
+            get_company_payloads('IBM', 'demo', max_concurrency=5)
+
+        assert time.monotonic() - started < 5
+    finally:
+        release.set()
+
+
+def test_parse_pool(monkeypatch) -> None:
+    payloads = _fake_payloads()
+    monkeypatch.setattr(alphavantage, '_get_alphavantage_data', lambda function, ticker, key: payloads[function])
+    expected = get_company_data('IBM', 'demo')
+
+    with ParsePool(max_workers=2, max_pending=5) as pool:
+        results = list(pool.parse_company_data(get_company_payloads('IBM', 'demo') for _ in range(3)))
+        annual, quarter = pool.submit('statements', payloads['INCOME_STATEMENT']).result()
+
+    assert results == [expected] * 3
+    assert results[0].income_annual.items['totalRevenue'].tag is expected.income_annual.items['totalRevenue'].tag
+    assert (annual, quarter) == parse_financial_statements(_income_statements)
+
+
+def test_company_data_async(monkeypatch) -> None:
+    payloads = _fake_payloads()
+
+    async def fake_fetch(function: str, ticker: str, key: str) -> bytes:
+        await asyncio.sleep(0)
+        return payloads[function]
+
+    monkeypatch.setattr(alphavantage, '_get_alphavantage_data_async', fake_fetch)
+
+    data = asyncio.run(get_company_data_async('IBM', 'demo', limiter=asyncio.Semaphore(2)))
+    assert data.company.ticker == 'IBM'
+    assert data.cashflow_annual.items['fiscalDateEnding'].column_5 == '2017-12-31'
+
+
 def test_parse_earnings_file() -> None:
     data = parse_earnings_file(_earnings_file)
     assert len(data) == 30
 
 
+def test_parse_earnings_lines() -> None:
+    batches = list(parse_earnings_lines(_earnings_file.encode('utf-8').splitlines(), chunk_size=7))
+
+    assert [len(batch) for batch in batches] == [7, 7, 7, 7, 2]
+    assert [row for batch in batches for row in batch.rows()] == parse_earnings_file(_earnings_file)
+    assert batches[0].report_dates[0].year >= 2022
+
+
+_quoted_earnings = 'symbol,name,reportDate,fiscalDateEnding,estimate,currency\r\n' \
+                   'FOO,"Foo\r\nBar Inc",2022-07-18,2022-06-30,2.27,USD\r\n' \
+                   'IBM,IBM Corporation,2022-07-18,2022-06-30,2.27,USD\r\n'
+
+
+def test_parse_earnings_lines_quoted() -> None:
+    batch = next(parse_earnings_lines(_quoted_earnings.encode('utf-8').splitlines(keepends=True)))
+
+    assert batch.names == [row.name for row in parse_earnings_file(_quoted_earnings)]
+    assert batch.names[0] == 'Foo\r\nBar Inc'
+
+
+class _StreamResponse:
+    status_code = 200
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        self.closed = False
+
+    def iter_content(self, chunk_size: int = 1):
+        # Small chunks, so lines and line endings are split across them
+        for start in range(0, len(self.content), 7):
+            yield self.content[start:start + 7]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _StreamTransport(HttpTransport):
+    def __init__(self, content: bytes) -> None:
+        super().__init__()
+        self.response = _StreamResponse(content)
+
+    def get(self, url: str, params: dict | None = None, headers: dict | None = None, stream: bool = False):
+        assert stream
+        return self.response
+
+
+def test_stream_earnings_estimates() -> None:
+    transport = _StreamTransport(_earnings_file.encode('utf-8'))
+    set_transport(transport)
+    try:
+        batches = list(stream_earnings_estimates('STREAM', chunk_size=20))
+    finally:
+        set_transport(None)
+
+    assert [len(batch) for batch in batches] == [20, 10]
+    assert transport.response.closed
+
+
+def test_stream_earnings_quoted() -> None:
+    set_transport(_StreamTransport(_quoted_earnings.encode('utf-8')))
+    try:
+        batches = list(stream_earnings_estimates('STREAM'))
+    finally:
+        set_transport(None)
+
+    assert batches[0].names == ['Foo\r\nBar Inc', 'IBM Corporation']
+
+
 def test_get_earnings_file() -> None:
     data = get_earnings_estimates('TK7LTJYNCWD69QRH')
     assert data
@@ -0,0 +1,83 @@
+# *******************************************************************************************
+#  File:  archive_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+from datetime import datetime, timezone
+import pytest
+import gf_lib.services as svc
+from gf_lib.errors import ArchiveMissError
+
+_overview = b'{"Symbol": "IBM", "Name": "International Business Machines", "Description": "IBM", ' \
+            b'"Exchange": "NYSE", "Currency": "USD", "Country": "USA", "Address": "Armonk", ' \
+            b'"FiscalYearEnd": "December", "LatestQuarter": "2022-03-31"}'
+_statement = b'{"symbol": "IBM", "annualReports": [{"fiscalDateEnding": "2021-12-31", "totalRevenue": "57350000000"}],' \
+             b' "quarterlyReports": [{"fiscalDateEnding": "2022-03-31", "totalRevenue": "14197000000"}]}'
+_earnings = b'{"symbol": "IBM", "annualEarnings": [{"fiscalDateEnding": "2021-12-31", "reportedEPS": "7.93"}],' \
+            b' "quarterlyEarnings": [{"fiscalDateEnding": "2022-03-31", "reportedEPS": "1.4"}]}'
+
+
+@pytest.fixture
+def archive(tmp_path):
+    value = svc.ResponseArchive(tmp_path)
+    yield value
+    svc.set_archive(None)
+
+
+class TestResponseArchive:
+    def test_store_and_load(self, archive) -> None:
+        entry = archive.store('alphavantage', {'function': 'OVERVIEW', 'symbol': 'IBM'}, _overview)
+
+        assert entry.size == len(_overview)
+        assert archive.load(entry.digest) == _overview
+        assert archive.latest('alphavantage', {'symbol': 'IBM', 'function': 'OVERVIEW'}) == _overview
+        assert archive.latest('alphavantage', {'function': 'OVERVIEW', 'symbol': 'AAPL'}) is None
+
+    def test_content_addressed(self, archive) -> None:
+        first = archive.store('alphavantage', {'function': 'OVERVIEW', 'symbol': 'IBM'}, _overview)
+        second = archive.store('alphavantage', {'function': 'OVERVIEW', 'symbol': 'IBM'}, _overview)
+
+        assert first.digest == second.digest
+        assert len(list(archive.root.joinpath('objects').rglob('*.gz'))) == 1
+
+    def test_latest_by_fetch_time(self, archive) -> None:
+        params = {'url': 'https://www.sec.gov/files/company_tickers.json'}
+        archive.store('sec', params, b'{"new": 1}', datetime(2022, 6, 2, tzinfo=timezone.utc))
+        archive.store('sec', params, b'{"old": 1}', datetime(2022, 6, 1, tzinfo=timezone.utc))
+
+        assert archive.latest('sec', params) == b'{"new": 1}'
+
+        reopened = svc.ResponseArchive(archive.root)
+        assert reopened.latest('sec', params) == b'{"new": 1}'
+        assert len(list(reopened.entries('sec'))) == 1
+
+    def test_replay_company_data(self, archive) -> None:
+        for function, payload in (('OVERVIEW', _overview), ('INCOME_STATEMENT', _statement),
+                                  ('BALANCE_SHEET', _statement), ('CASH_FLOW', _statement), ('EARNINGS', _earnings)):
+            archive.store('alphavantage', {'function': function, 'symbol': 'IBM'}, payload)
+
+        svc.set_archive(svc.ResponseArchive(archive.root, replay=True))
+
+        data = svc.get_company_data('IBM', 'unused')
+        assert data.company.name == 'International Business Machines'
+        assert data.income_annual.items['totalRevenue'].column_1 == '57350000000'
+        assert data.earnings_quarter.items['reportedEPS'].column_1 == '1.4'
+
+    def test_replay_miss(self, archive) -> None:
+        svc.set_archive(svc.ResponseArchive(archive.root, replay=True))
+
+        with pytest.raises(ArchiveMissError):
+            svc.get_sp500('https://en.wikipedia.org/wiki/List_of_S%26P_500_companies')
@@ -0,0 +1,83 @@
+# *******************************************************************************************
+#  File:  bulk_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+import pytest
+from pymongo.errors import BulkWriteError
+from gf_lib.datastore import insert_bulk
+from gf_lib.errors import DatastoreError, DuplicateRecordError
+
+
+class _Collection:
+    """
+    Records the batches written and rejects the documents whose key is listed, as the server would
+    """
+    def __init__(self, rejected: dict[str, int], concern_error: str | None = None) -> None:
+        self.rejected = rejected
+        self.concern_error = concern_error
+        self.batches = list()
+
+    def insert_many(self, documents: list[dict], ordered: bool = True) -> None:
+        assert not ordered
+        self.batches.append([document['key'] for document in documents])
+
+        errors = [{'index': index, 'code': self.rejected[document['key']], 'errmsg': f"rejected {document['key']}"}
+                  for index, document in enumerate(documents) if document['key'] in self.rejected]
+        concern_errors = [{'code': 64, 'errmsg': self.concern_error}] if self.concern_error else []
+        if errors or concern_errors:
+            raise BulkWriteError({'writeErrors': errors, 'writeConcernErrors': concern_errors,
+                                  'nInserted': len(documents) - len(errors)})
+
+
+def _insert(collection: _Collection, keys: list[str], batch_size: int):
+    return insert_bulk(collection, keys, lambda value: value, lambda value: {'key': value}, batch_size)
+
+
+class TestInsertBulk:
+    def test_batches(self) -> None:
+        collection = _Collection({})
+        result = _insert(collection, ['A', 'B', 'C', 'D', 'E'], 2)
+
+        assert collection.batches == [['A', 'B'], ['C', 'D'], ['E']]
+        assert result.inserted == ['A', 'B', 'C', 'D', 'E']
+        assert result.ok
+
+    def test_report(self) -> None:
+        collection = _Collection({'B': 11000, 'D': 121})
+        result = _insert(collection, ['A', 'B', 'C', 'D', 'E'], 3)
+
+        assert result.inserted == ['A', 'C', 'E']
+        assert result.duplicates == ['B']
+        assert result.failures == {'D': 'rejected D'}
+        assert not result.ok
+
+        assert type(result.error('B')) is DuplicateRecordError
+        assert type(result.error('D')) is DatastoreError
+        assert result.error('A') is None
+        assert sorted(result.errors()) == ['B', 'D']
+
+    def test_write_concern(self) -> None:
+        result = _insert(_Collection({'B': 11000}, 'waiting for replication timed out'), ['A', 'B', 'C'], 5)
+
+        assert result.inserted == []
+        assert result.duplicates == ['B']
+        assert result.failures == {'A': 'Write concern not satisfied: waiting for replication timed out',
+                                   'C': 'Write concern not satisfied: waiting for replication timed out'}
+
+    def test_batch_size(self) -> None:
+        with pytest.raises(ValueError):
+            _insert(_Collection({}), ['A'], 0)
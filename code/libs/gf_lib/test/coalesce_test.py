@@ -0,0 +1,81 @@
+# *******************************************************************************************
+#  File:  coalesce_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
+import time
+import pytest
+from gf_lib.services import SingleFlight
+
+
+class TestSingleFlight:
+    def test_threads_share_call(self) -> None:
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = list()
+
+        def fetch(ticker: str) -> str:
+            calls.append(ticker)
+            started.set()
+            release.wait(5)
+            return f"data:{ticker}"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(flight.do, ('OVERVIEW', 'IBM'), fetch, 'IBM')
+            started.wait(5)
+            followers = [executor.submit(flight.do, ('OVERVIEW', 'IBM'), fetch, 'IBM') for _ in range(3)]
+            time.sleep(0.2)
+            release.set()
+            results = [future.result() for future in [leader, *followers]]
+
+        assert results == ['data:IBM'] * 4
+        assert calls == ['IBM']
+
+    def test_distinct_keys(self) -> None:
+        flight = SingleFlight()
+        assert flight.do('a', lambda: 1) == 1
+        assert flight.do('b', lambda: 2) == 2
+        assert flight.in_flight() == 0
+
+    def test_error_is_shared(self) -> None:
+        flight = SingleFlight()
+
+        def fail() -> None:
+            raise ValueError('failed')
+
+        with pytest.raises(ValueError):
+            flight.do('a', fail)
+        assert flight.in_flight() == 0
+
+    def test_async_share_call(self) -> None:
+        flight = SingleFlight()
+        calls = list()
+
+        async def fetch(ticker: str) -> str:
+            calls.append(ticker)
+            await asyncio.sleep(0.01)
+            return f"data:{ticker}"
+
+        async def run() -> list[str]:
+            return await asyncio.gather(*[flight.do_async(('OVERVIEW', 'IBM'), fetch, 'IBM') for _ in range(10)])
+
+        results = asyncio.run(run())
+        assert results == ['data:IBM'] * 10
+        assert calls == ['IBM']
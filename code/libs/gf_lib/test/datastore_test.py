@@ -23,6 +23,7 @@ from pymongo.database import Database
 from gf_lib.datastore import MasterDatastore, GicsSectorDatastore, CompanyDatastore, \
     CashFlowDatastore, BalanceSheetDatastore, IncomeDatastore, EarningsDatastore, TaskTrackingDatastore, EarningsFileDatastore
 from gf_lib.errors import DuplicateRecordError
+from gf_lib.services import parse_earnings_lines
 import gf_lib.model as model
 
 
@@ -490,6 +491,20 @@ class TestMasterListDatastore:
         with pytest.raises(DuplicateRecordError):
             store.insert(record)
 
+    def test_insert_many(self, clear_collection, mongodb_connection: MongoClient) -> None:
+        db: Database = mongodb_connection['good_fundamentals_test']
+        store = MasterDatastore(db)
+        records = [model.Master(ticker=ticker, name=ticker, cik='0123456789', figi='012345678912',
+                                sub_industry='Industry') for ticker in ['IBM', 'AAPL', 'MSFT']]
+
+        assert store.insert(records[0])
+        result = store.insert_many(records, batch_size=2)
+
+        assert sorted(result.inserted) == ['AAPL', 'MSFT']
+        assert result.duplicates == ['IBM']
+        assert isinstance(result.error('IBM'), DuplicateRecordError)
+        assert result.error('AAPL') is None
+
     def test_get(self, clear_collection, mongodb_connection: MongoClient) -> None:
         db: Database = mongodb_connection['good_fundamentals_test']
         store = MasterDatastore(db)
@@ -633,3 +648,87 @@ class TestEarnings:
 
         assert record.ticker == result.ticker
         assert record.name == result.name
+
+    def test_insert_batch(self, clear_collection, mongodb_connection: MongoClient) -> None:
+        db: Database = mongodb_connection['good_fundamentals_test']
+        store = EarningsFileDatastore(db)
+
+        lines = ['symbol,name,reportDate,fiscalDateEnding,estimate,currency',
+                 'IBM,IBM Corporation,2022-07-18,2022-06-30,2.27,USD',
+                 'aapl,Apple Inc,2022-07-28,2022-06-30,,USD',
+                 'IBM,IBM Corporation,2022-07-18,2022-06-30,2.27,USD',
+                 'MSFT,Microsoft,,2022-06-30,2.29,USD',
+                 'BRK/A,Berkshire Hathaway,2022-08-06,2022-06-30,,USD']
+        batch = next(parse_earnings_lines(lines))
+        result = store.insert_batch(batch)
+
+        assert sorted(result.inserted) == ['AAPL', 'IBM']
+        assert result.duplicates == ['IBM']
+        assert sorted(result.skipped) == ['BRK/A', 'MSFT']
+        assert store.get('AAPL').name == 'Apple Inc'
+
+
+class TestStatementViews:
+    @pytest.fixture
+    def clear_collection(self, mongodb_connection) -> None:
+        db: Database = mongodb_connection['good_fundamentals_test']
+        store = IncomeDatastore(db)
+        store.clear()
+
+    def test_scan(self, clear_collection, mongodb_connection: MongoClient) -> None:
+        db: Database = mongodb_connection['good_fundamentals_test']
+        store = IncomeDatastore(db)
+
+        for ticker in ['IBM', 'AAPL']:
+            record = model.IncomeStatement(ticker, model.PeriodType.Annual)
+            record.items.append(model.AccountingEntry('totalRevenue', value_1='10000'))
+            assert store.insert(record)
+
+        views = list(store.scan(model.PeriodType.Annual, ['ticker', 'items']))
+        assert sorted(view.ticker for view in views) == ['AAPL', 'IBM']
+        assert views[0].values('totalRevenue')[0] == '10000'
+
+        view = store.get_view('IBM', model.PeriodType.Annual)
+        assert view.to_model().items[0].value_1 == '10000'
+
+
+class TestNumericStorage:
+    @pytest.fixture
+    def clear_collection(self, mongodb_connection) -> None:
+        db: Database = mongodb_connection['good_fundamentals_test']
+        store = IncomeDatastore(db)
+        store.clear()
+
+    def test_aggregate(self, clear_collection, mongodb_connection: MongoClient) -> None:
+        db: Database = mongodb_connection['good_fundamentals_test']
+        store = IncomeDatastore(db, model.ValueStorage.Numeric)
+
+        for ticker, revenue in [('IBM', '10000'), ('AAPL', '365817000000'), ('MSFT', 'None')]:
+            record = model.IncomeStatement(ticker, model.PeriodType.Annual)
+            record.items.append(model.AccountingEntry('totalRevenue', value_1=revenue))
+            record.items.append(model.AccountingEntry('reportedCurrency', value_1='USD'))
+            assert store.insert(record)
+
+        loaded = store.get('IBM', model.PeriodType.Annual)
+        assert loaded.items[0].value_1 == 10_000
+        assert loaded.items[1].value_1 == 'USD'
+
+        summary = store.aggregate('totalRevenue', model.PeriodType.Annual)
+        assert summary['count'] == 2
+        assert summary['total'] == 365_817_010_000
+        assert summary['maximum'] == 365_817_000_000
+        assert type(store.get('AAPL', model.PeriodType.Annual).items[0].value_1) is int
+        assert store.aggregate('reportedCurrency', model.PeriodType.Annual) is None
+
+    def test_convert_to_numeric(self, clear_collection, mongodb_connection: MongoClient) -> None:
+        db: Database = mongodb_connection['good_fundamentals_test']
+        store = IncomeDatastore(db)
+
+        record = model.IncomeStatement('IBM', model.PeriodType.Annual)
+        record.items.append(model.AccountingEntry('totalRevenue', value_1='57350000000'))
+        assert store.insert(record)
+        assert store.aggregate('totalRevenue', model.PeriodType.Annual) is None
+
+        assert store.convert_to_numeric() == 1
+        assert store.convert_to_numeric() == 0
+        assert store.aggregate('totalRevenue', model.PeriodType.Annual)['total'] == 57_350_000_000
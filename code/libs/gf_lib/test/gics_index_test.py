@@ -0,0 +1,93 @@
+# *******************************************************************************************
+#  File:  gics_index_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+import orjson
+import pytest
+import gf_lib.model as model
+
+_DATA = [
+    {'id': 10, 'name': 'Energy', 'items': [
+        {'id': 1010, 'name': 'Energy', 'items': [
+            {'id': 101010, 'name': 'Energy Equipment & Services', 'items': [
+                {'id': 10101010, 'name': 'Oil & Gas Drilling'},
+                {'id': 10101020, 'name': 'Oil & Gas Equipment & Services'}]}]}]},
+    {'id': 45, 'name': 'Information Technology', 'items': [
+        {'id': 4510, 'name': 'Software & Services', 'items': [
+            {'id': 451020, 'name': 'IT Services', 'items': [
+                {'id': 45102010, 'name': 'IT Consulting & Other Services'}]}]}]}
+]
+
+
+def _sectors() -> list[model.GICSSector]:
+    sectors = list()
+    for sector in _DATA:
+        groups = list()
+        for group in sector['items']:
+            industries = [model.GICSIndustry(industry['id'], industry['name'],
+                                             [model.GICSSubIndustry(item['id'], item['name'])
+                                              for item in industry['items']])
+                          for industry in group['items']]
+            groups.append(model.GICSGroupIndustry(group['id'], group['name'], industries))
+        sectors.append(model.GICSSector(sector['id'], sector['name'], groups))
+
+    return sectors
+
+
+class TestGicsIndex:
+    def test_lookup(self) -> None:
+        index = model.GicsIndex.from_data(_DATA)
+
+        assert len(index) == 9
+        assert [node.id for node in index][:3] == [10, 1010, 101010]
+        assert index[10101020].name == 'Oil & Gas Equipment & Services'
+        assert index[10101020].level == model.GicsLevel.SubIndustry
+        assert index.get(99) is None
+        assert [node.id for node in index.children(101010)] == [10101010, 10101020]
+        assert index.parent(451020).id == 4510
+
+    def test_find(self) -> None:
+        index = model.GicsIndex.from_data(_DATA)
+
+        assert index.find('it consulting &  other services').id == 45102010
+        assert index.find('Energy').level == model.GicsLevel.GroupIndustry
+        assert index.find('Energy', model.GicsLevel.Sector).id == 10
+        assert index.find('Unknown') is None
+
+    def test_ancestry(self) -> None:
+        index = model.GicsIndex.from_data(_DATA)
+
+        assert [node.id for node in index.ancestry(10101010)] == [10, 1010, 101010, 10101010]
+        assert [node.id for node in index.ancestry(45)] == [45]
+
+        with pytest.raises(KeyError):
+            index.ancestry(12)
+
+    def test_sources(self, tmp_path) -> None:
+        file = tmp_path.joinpath('gics.json')
+        file.write_bytes(orjson.dumps(_DATA))
+
+        from_data = model.GicsIndex.from_data(_DATA)
+        assert list(model.GicsIndex.from_file(file)) == list(from_data)
+        assert list(model.GicsIndex.from_sectors(_sectors())) == list(from_data)
+
+    def test_resolve(self) -> None:
+        index = model.GicsIndex.from_sectors(_sectors())
+
+        assert index.resolve(['Oil & Gas Drilling', 'IT Consulting & Other Services', 'Gold']) == \
+               [10101010, 45102010, None]
+        assert [node.id for node in index.sectors()] == [10, 45]
@@ -0,0 +1,98 @@
+# *******************************************************************************************
+#  File:  model_alphavantage_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+import math
+import gf_lib.model as model
+from gf_lib.services import parse_financial_matrix, parse_financial_statements
+
+_statements = b'{"symbol": "IBM", "annualReports": [' \
+              b'{"fiscalDateEnding": "2021-12-31", "reportedCurrency": "USD", "totalRevenue": "57350000000", ' \
+              b'"grossProfit": "31486000000", "researchAndDevelopment": "None"}, ' \
+              b'{"fiscalDateEnding": "2020-12-31", "reportedCurrency": "USD", "totalRevenue": "55179000000", ' \
+              b'"grossProfit": "30865000000", "researchAndDevelopment": "6262000000"}], ' \
+              b'"quarterlyReports": [{"fiscalDateEnding": "2022-03-31", "reportedCurrency": "USD", ' \
+              b'"totalRevenue": "14197000000", "grossProfit": "7466000000", "researchAndDevelopment": "None"}]}'
+
+
+class TestStatementMatrix:
+    def test_from_reports(self) -> None:
+        annual, quarter = parse_financial_matrix(_statements)
+
+        assert annual.ticker == 'IBM'
+        assert annual.periods == 2
+        assert annual.tags == ('totalRevenue', 'grossProfit', 'researchAndDevelopment')
+        assert annual.labels['fiscalDateEnding'] == ('2021-12-31', '2020-12-31')
+        assert annual.value('totalRevenue', 1) == 55_179_000_000
+        assert math.isnan(annual.value('researchAndDevelopment', 0))
+        assert list(annual.row('grossProfit')) == [31_486_000_000, 30_865_000_000]
+        assert len(annual.values) == 6
+        assert quarter.periods == 1
+
+    def test_to_statements(self) -> None:
+        annual, quarter = parse_financial_statements(_statements)
+        matrix_annual, matrix_quarter = parse_financial_matrix(_statements)
+
+        assert matrix_annual.to_statements() == annual
+        assert matrix_quarter.to_statements() == quarter
+
+    def test_text_values(self) -> None:
+        matrix = model.StatementMatrix.from_reports('IBM', [{'totalRevenue': '100', 'comment': 'None'},
+                                                            {'totalRevenue': 'None', 'comment': 'restated'}])
+
+        assert matrix.tags == ('totalRevenue',)
+        assert matrix.labels['comment'] == (None, 'restated')
+        assert matrix.has_tag('comment')
+        assert matrix.to_statements().items['totalRevenue'].column_2 == 'None'
+
+
+def _history(years: int) -> bytes:
+    reports = ', '.join(f'{{"fiscalDateEnding": "{2021 - year}-12-31", "totalRevenue": "{1000 + year}"}}'
+                        for year in range(years))
+    return f'{{"symbol": "IBM", "annualReports": [{reports}], "quarterlyReports": [{reports}]}}'.encode('utf-8')
+
+
+class TestStatementDepth:
+    def test_default_depth(self) -> None:
+        annual, quarter = parse_financial_statements(_history(8))
+
+        assert len(annual.items['totalRevenue'].columns) == 5
+        assert len(quarter.items['totalRevenue'].columns) == 3
+
+    def test_full_history(self) -> None:
+        annual, quarter = parse_financial_statements(_history(8), annual_periods=None, quarter_periods=None)
+
+        assert annual.items['totalRevenue'].columns == [str(1000 + year) for year in range(8)]
+        assert annual.items['fiscalDateEnding'].columns[-1] == '2014-12-31'
+        assert len(quarter.items['totalRevenue'].columns) == 8
+
+    def test_chosen_depth(self) -> None:
+        annual, _ = parse_financial_statements(_history(8), annual_periods=7)
+        matrix, _ = parse_financial_matrix(_history(8), annual_periods=7)
+
+        assert len(annual.items['totalRevenue'].columns) == 7
+        assert matrix.to_statements() == annual
+
+    def test_columns(self) -> None:
+        item = model.FinancialItemAlphavantage('totalRevenue', ['1', '2'])
+
+        assert item.column_1 == '1'
+        assert item.column_5 is None
+
+        item.column_4 = '4'
+
+        assert item.columns == ['1', '2', None, '4']
@@ -0,0 +1,82 @@
+# *******************************************************************************************
+#  File:  model_convert_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+import attrs
+import gf_lib.model as model
+
+
+def _statements(ticker: str) -> model.FinancialStatementsAlphavantage:
+    statements = model.FinancialStatementsAlphavantage(ticker)
+    statements.items['fiscalDateEnding'] = model.FinancialItemAlphavantage('fiscalDateEnding',
+                                                                           ['2021-12-31', '2020-12-31'])
+    statements.items['totalRevenue'] = model.FinancialItemAlphavantage('totalRevenue', ['57350000000', None])
+    return statements
+
+
+def _data(ticker: str, currency: str = 'USD') -> model.AlphavantageData:
+    company = model.CompanyAlphavantage(ticker, 'Company', 'Description', 'NYSE', currency, 'USA', 'Address',
+                                        'December', '2022-03-31')
+    return model.AlphavantageData(company, *[_statements(ticker) for _ in range(8)])
+
+
+def _master(ticker: str) -> model.Master:
+    return model.Master(ticker, 'Company', '51143', '000000051143', '10101010')
+
+
+class TestConvertCompanyData:
+    def test_convert(self) -> None:
+        batch = model.convert_company_data([(_master('IBM'), _data('IBM')), (_master('MSFT'), _data('MSFT'))])
+
+        assert [company.ticker for company in batch.companies] == ['IBM', 'MSFT']
+        assert batch.companies[0].cik == '0000051143'
+        assert len(batch.income_statements) == 4
+        assert len(batch.earnings) == 4
+        assert batch.errors == {}
+
+        statement = batch.balance_sheets[1]
+        assert isinstance(statement, model.BalanceSheetStatement)
+        assert statement.ticker == 'IBM'
+        assert statement.period_type == model.PeriodType.Quarter
+        assert statement.items[1] == model.AccountingEntry('totalRevenue', value_1='57350000000')
+        assert statement.items[0].value_2 == '2020-12-31'
+        assert statement.metadata.lock_version == 1
+
+    def test_matches_validated(self) -> None:
+        batch = model.convert_company_data([(_master('IBM'), _data('IBM'))])
+
+        statement = batch.cash_flows[0]
+        expected = model.CashFlowStatement('IBM', 'annual', statement.items)
+        assert statement == expected
+        assert attrs.asdict(statement)['items'][1]['value_1'] == '57350000000'
+
+    def test_errors(self) -> None:
+        batch = model.convert_company_data([(_master('IBM'), _data('IBM', currency='US')),
+                                            (_master('MSFT'), _data('MSFT'))])
+
+        assert list(batch.errors) == ['IBM']
+        assert [company.ticker for company in batch.companies] == ['MSFT']
+        assert [statement.ticker for statement in batch.income_statements] == ['IBM', 'IBM', 'MSFT', 'MSFT']
+
+    def test_real_figi(self) -> None:
+        master = model.Master('IBM', 'Company', '51143', 'BBG000BLNNH6', '10101010')
+        batch = model.convert_company_data([(master, _data('IBM'))])
+
+        assert 'figi' in batch.errors['IBM']
+        assert batch.companies == []
+        assert len(batch.cash_flows) == 2
+        assert batch.cash_flows[0].items[1].value_1 == '57350000000'
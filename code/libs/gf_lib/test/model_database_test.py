@@ -16,7 +16,11 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
 import time
+import attrs
 import pytest
 import gf_lib.model as model
 
@@ -339,3 +343,118 @@ class TestCompany:
                                  'Test-Sub-Industry', 'Main Street', model.Months.December, '2022-03-31')
 
         assert record_1 != record_2
+
+
+def _document(value) -> dict:
+    return attrs.asdict(value, value_serializer=lambda _, __, item: item.value if isinstance(item, Enum) else item)
+
+
+class TestFromDocument:
+    def test_master(self) -> None:
+        record = model.Master('IBM', 'IBM Corporation', '51143', 'BBG000BLNNH6', 'IT Consulting',
+                              [model.IndexType.SP500])
+        loaded = model.Master.from_document(_document(record))
+
+        assert loaded == record
+        assert loaded.cik == '0000051143'
+        assert loaded.indexes == [model.IndexType.SP500]
+        assert loaded.metadata == record.metadata
+
+    def test_company(self) -> None:
+        record = model.Company('IBM', 'IBM Corporation', 'Test Description', '0123456789', '012345678912', 'NYSE',
+                               'USD', 'USA', 'Test-Sub-Industry', 'Main Street', 'December', '2022-03-31')
+        loaded = model.Company.from_document(_document(record))
+
+        assert attrs.asdict(loaded) == attrs.asdict(record)
+        assert loaded.fiscal_year_end is model.Months.December
+
+    def test_statement(self) -> None:
+        record = model.CashFlowStatement('IBM', 'quarter', [model.AccountingEntry('Revenue', value_1='10000')])
+        loaded = model.CashFlowStatement.from_document(_document(record))
+
+        assert loaded == record
+        assert loaded.period_type is model.PeriodType.Quarter
+        assert isinstance(loaded.items[0], model.AccountingEntry)
+
+    def test_gics_sector(self) -> None:
+        industry = model.GICSIndustry(101_010, 'Energy Equipment', [model.GICSSubIndustry(10_101_010, 'Drilling')])
+        record = model.GICSSector(10, 'Energy', [model.GICSGroupIndustry(1_010, 'Energy', [industry])])
+        loaded = model.GICSSector.from_document(_document(record))
+
+        assert loaded == record
+        assert loaded.group_industries[0].industries[0].sub_industries[0].name == 'Drilling'
+
+    def test_earnings(self) -> None:
+        record = model.Earnings('IBM', 'IBM Corporation', estimate='2.27')
+        loaded = model.Earnings.from_document(_document(record))
+
+        assert attrs.asdict(loaded) == attrs.asdict(record)
+
+    def test_frozen(self) -> None:
+        loaded = model.Master.from_document(_document(model.Master('IBM', 'IBM', '1', '1', 'IT')))
+
+        with pytest.raises(attrs.exceptions.FrozenInstanceError):
+            loaded.name = 'Changed'
+
+
+class TestDates:
+    def test_iso(self) -> None:
+        assert model.parse_alphavantage_date('2022-03-31') == datetime(2022, 3, 31)
+        assert model.parse_alphavantage_date('2022-03-31') is model.parse_alphavantage_date('2022-03-31')
+
+    def test_fallback(self) -> None:
+        assert model.parse_alphavantage_date('31 March 2022') == datetime(2022, 3, 31)
+        assert model.parse_alphavantage_date('2022-03-31T10:00:00+02:00') == datetime(2022, 3, 31, 8)
+
+    def test_values(self) -> None:
+        assert model.parse_alphavantage_date(date(2022, 3, 31)) == datetime(2022, 3, 31)
+        with pytest.raises(ValueError):
+            model.parse_alphavantage_date('P1D')
+
+    def test_fields(self) -> None:
+        record = model.Earnings('IBM', report_date='2022-07-18', fiscal_year='2022-06-30')
+        metadata = model.DocumentMetadata(created_at='2022-01-01', updated_at=datetime(2022, 1, 2))
+
+        assert record.report_date == datetime(2022, 7, 18)
+        assert record.fiscal_year == datetime(2022, 6, 30)
+        assert metadata.created_at == datetime(2022, 1, 1)
+        assert type(model.Earnings('IBM', report_date=date(2022, 7, 18)).report_date) is date
+
+
+class TestAmounts:
+    def test_parse(self) -> None:
+        assert model.parse_amount('10000') == 10_000
+        assert type(model.parse_amount('10000')) is int
+        assert model.parse_amount('-2.27') == Decimal('-2.27')
+        assert model.parse_amount('None') is None
+        assert model.parse_amount(' ') is None
+        assert model.parse_amount(str(2 ** 70)) == Decimal(2 ** 70)
+
+        with pytest.raises(ValueError):
+            model.parse_amount('USD')
+
+    def test_numeric(self) -> None:
+        entry = model.AccountingEntry('totalRevenue', '10000', '1.5', 'None', '', '-20').numeric()
+        assert (entry.value_1, entry.value_2, entry.value_3, entry.value_4, entry.value_5) == \
+               (10_000, Decimal('1.5'), None, None, -20)
+
+        label = model.AccountingEntry('reportedCurrency', 'USD', 'USD')
+        assert label.numeric() is label
+
+    def test_from_document(self) -> None:
+        entry = model.AccountingEntry.from_document({'tag': 'totalRevenue', 'value_1': 10_000,
+                                                     'value_2': Decimal('1.5'), 'value_3': None,
+                                                     'value_4': '', 'value_5': '7'})
+
+        assert entry.value_1 == 10_000
+        assert entry.value_2 == Decimal('1.5')
+        assert entry.value_3 is None
+        assert entry.value_5 == '7'
+
+    def test_block(self) -> None:
+        entry = model.AccountingEntry('eps', '1.25', '2', 'None', '', '3').numeric()
+        block = model.NumericBlock.from_entries([entry])
+
+        assert list(block.row('eps')) == [1, 2, 0, 0, 3]
+        assert list(block.row_mask('eps')) == [1, 1, 0, 0, 1]
+        assert model.NumericBlock.from_entries([entry], scale=2).value('eps', 0) == 125
@@ -0,0 +1,91 @@
+# *******************************************************************************************
+#  File:  model_numeric_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+import math
+import pytest
+import gf_lib.model as model
+
+
+def test_convert_values_integers() -> None:
+    values, mask = model.convert_values(['57350000000', '-12', '0'])
+
+    assert list(values) == [57_350_000_000, -12, 0]
+    assert mask == bytearray(b'\x01\x01\x01')
+
+
+def test_convert_values_missing() -> None:
+    values, mask = model.convert_values(['100', 'None', None, '', 'text'])
+
+    assert list(values) == [100, 0, 0, 0, 0]
+    assert list(mask) == [1, 0, 0, 0, 0]
+
+
+def test_convert_values_scaled() -> None:
+    values, mask = model.convert_values(['1.4', '-0.05', '2', '0.125', '1e2'], scale=2)
+
+    assert list(values) == [140, -5, 200, 12, 10000]
+    assert all(mask)
+
+
+def test_convert_values_overflow() -> None:
+    with pytest.raises(OverflowError):
+        model.convert_values(['99999999999999999999'])
+
+    with pytest.raises(OverflowError):
+        model.convert_values(['3700000000000'], scale=7)
+
+    values, mask = model.convert_values(['3700000000000'], scale=6)
+    assert list(values) == [3_700_000_000_000_000_000]
+
+
+def test_from_statements() -> None:
+    statements = model.FinancialStatementsAlphavantage('IBM')
+    statements.items['fiscalDateEnding'] = model.FinancialItemAlphavantage('fiscalDateEnding', ['2021-12-31'])
+    statements.items['totalRevenue'] = model.FinancialItemAlphavantage('totalRevenue', ['57350000000', 'None'])
+    statements.items['grossProfit'] = model.FinancialItemAlphavantage('grossProfit', ['31486000000'])
+
+    block = model.NumericBlock.from_statements(statements)
+
+    assert block.keys == ('totalRevenue', 'grossProfit')
+    assert block.periods == 2
+    assert block.value('totalRevenue', 0) == 57_350_000_000
+    assert block.value('totalRevenue', 1) is None
+    assert block.value('grossProfit', 1) is None
+    assert list(block.row_mask('totalRevenue')) == [1, 0]
+    assert math.isnan(block.to_floats()[1])
+
+
+def test_from_entries() -> None:
+    block = model.NumericBlock.from_entries([model.AccountingEntry('Revenue', value_1='10000', value_2='9000')])
+
+    assert block.periods == 5
+    assert list(block.row('Revenue')) == [10000, 9000, 0, 0, 0]
+    assert list(block.row_mask('Revenue')) == [1, 1, 0, 0, 0]
+
+
+def test_from_universe() -> None:
+    first = model.FinancialStatementsAlphavantage('IBM')
+    first.items['reportedEPS'] = model.FinancialItemAlphavantage('reportedEPS', ['1.4', '2.1'])
+    second = model.FinancialStatementsAlphavantage('MSFT')
+
+    block = model.NumericBlock.from_universe([first, second], 'reportedEPS', scale=2)
+
+    assert block.keys == ('IBM', 'MSFT')
+    assert block.value('IBM', 0) == 140
+    assert block.value('MSFT', 0) is None
+    assert list(block.to_floats())[0] == 1.4
@@ -0,0 +1,57 @@
+# *******************************************************************************************
+#  File:  model_tags_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+import gf_lib.model as model
+from gf_lib.services import parse_financial_statements, parse_financial_matrix
+
+_statements = b'{"symbol": "IBM", "annualReports": [{"fiscalDateEnding": "2021-12-31", "totalRevenue": "100"}], ' \
+              b'"quarterlyReports": [{"fiscalDateEnding": "2022-03-31", "totalRevenue": "25"}]}'
+
+
+class TestTagRegistry:
+    def test_ids(self) -> None:
+        registry = model.TagRegistry(['totalRevenue', 'netIncome'])
+
+        assert len(registry) == 2
+        assert registry.id_of('netIncome') == 1
+        assert registry.tag_of(0) == 'totalRevenue'
+        assert registry.id_of('grossProfit') == 2
+        assert 'grossProfit' in registry
+
+    def test_intern(self) -> None:
+        registry = model.TagRegistry()
+        tag = ''.join(['total', 'Revenue'])
+
+        assert registry.intern(tag) is registry.intern('totalRevenue')
+
+    def test_encode(self) -> None:
+        registry = model.TagRegistry()
+        tag_ids = registry.encode(['a', 'b', 'a'])
+
+        assert list(tag_ids) == [0, 1, 0]
+        assert registry.decode(tag_ids) == ['a', 'b', 'a']
+
+    def test_shared_tags(self) -> None:
+        annual, quarter = parse_financial_statements(_statements)
+        matrix, _ = parse_financial_matrix(_statements)
+        entry = model.AccountingEntry(''.join(['total', 'Revenue']))
+
+        assert annual.items['totalRevenue'].tag is quarter.items['totalRevenue'].tag
+        assert matrix.tags[0] is annual.items['totalRevenue'].tag
+        assert entry.tag is annual.items['totalRevenue'].tag
+        assert entry.tag_id == model.get_tag_registry().id_of('totalRevenue')
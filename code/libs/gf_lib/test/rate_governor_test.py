@@ -0,0 +1,220 @@
+# *******************************************************************************************
+#  File:  rate_governor_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+from datetime import date
+import asyncio
+import threading
+import pytest
+import gf_lib.services._alphavantage as alphavantage
+from gf_lib.errors import ApiThrottledError, ApiFailedError
+import gf_lib.services as svc
+from gf_lib.services import RateGovernor, ApiKeyPool, parse_company, parse_financial_statements
+
+_minute_note = b'{"Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 5 calls per ' \
+               b'minute and 500 calls per day."}'
+_daily_note = b'{"Information": "Thank you for using Alpha Vantage! Our standard API rate limit is 25 requests ' \
+              b'per day."}'
+_demo_note = b'{"Information": "The **demo** API key is for demo purposes only. Please claim your free API key at ' \
+             b'(https://www.alphavantage.co/support/#api-key) to explore our full API offerings."}'
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.today = date(2022, 6, 1)
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Response:
+    def __init__(self, content: bytes) -> None:
+        self.status_code = 200
+        self.content = content
+
+
+class _ReplayTransport(svc.HttpTransport):
+    def __init__(self, payloads: list[bytes]) -> None:
+        super().__init__()
+        self.payloads = payloads
+        self.urls = list()
+
+    def get(self, url: str, params: dict | None = None, headers: dict | None = None, stream: bool = False):
+        self.urls.append(url)
+        return _Response(self.payloads.pop(0))
+
+
+@pytest.fixture
+def replay_transport():
+    def install(payloads: list[bytes]) -> _ReplayTransport:
+        transport = _ReplayTransport(payloads)
+        svc.set_transport(transport)
+        return transport
+
+    yield install
+    svc.set_transport(None)
+
+
+class TestRateGovernor:
+    def test_minute_budget(self) -> None:
+        clock = _Clock()
+        governor = RateGovernor(calls_per_minute=5, calls_per_day=500, clock=clock, today=lambda: clock.today)
+
+        for _ in range(5):
+            assert governor.reserve('KEY') == 0.0
+
+        assert governor.reserve('KEY') == pytest.approx(12.0)
+
+        clock.now = 12.0
+        assert governor.reserve('KEY') == 0.0
+        assert governor.remaining('KEY') == 494
+
+    def test_keys_are_independent(self) -> None:
+        clock = _Clock()
+        governor = RateGovernor(calls_per_minute=1, calls_per_day=500, clock=clock, today=lambda: clock.today)
+
+        assert governor.reserve('KEY1') == 0.0
+        assert governor.reserve('KEY1') > 0.0
+        assert governor.reserve('KEY2') == 0.0
+
+    def test_daily_budget(self) -> None:
+        clock = _Clock()
+        governor = RateGovernor(calls_per_minute=60, calls_per_day=2, clock=clock, today=lambda: clock.today)
+
+        assert governor.reserve('KEY') == 0.0
+        assert governor.reserve('KEY') == 0.0
+        with pytest.raises(ApiThrottledError):
+            governor.reserve('KEY')
+
+        clock.today = date(2022, 6, 2)
+        assert governor.reserve('KEY') == 0.0
+
+    def test_throttled_minute(self) -> None:
+        clock = _Clock()
+        governor = RateGovernor(calls_per_minute=5, calls_per_day=500, clock=clock, today=lambda: clock.today)
+
+        governor.throttled('KEY', alphavantage._find_throttle(_minute_note))
+        assert governor.reserve('KEY') == pytest.approx(60.0)
+
+        clock.now = 60.0
+        assert governor.reserve('KEY') == 0.0
+
+    def test_throttled_day(self) -> None:
+        clock = _Clock()
+        governor = RateGovernor(clock=clock, today=lambda: clock.today)
+
+        governor.throttled('KEY', alphavantage._find_throttle(_daily_note))
+        assert governor.remaining('KEY') == 0
+
+
+class TestApiKeyPool:
+    def test_most_remaining(self) -> None:
+        clock = _Clock()
+        governor = RateGovernor(calls_per_minute=60, calls_per_day=10, clock=clock, today=lambda: clock.today)
+        pool = ApiKeyPool(['KEY1', 'KEY2'], governor=governor)
+
+        governor.set_used('KEY1', 5)
+        assert pool.acquire() == 'KEY2'
+        assert pool.remaining() == {'KEY1': 5, 'KEY2': 9}
+
+    def test_all_exhausted(self) -> None:
+        clock = _Clock()
+        governor = RateGovernor(calls_per_minute=60, calls_per_day=1, clock=clock, today=lambda: clock.today)
+        pool = ApiKeyPool(['KEY1', 'KEY2'], governor=governor)
+
+        assert {pool.acquire(), pool.acquire()} == {'KEY1', 'KEY2'}
+        with pytest.raises(ApiThrottledError):
+            pool.acquire()
+
+    def test_shared_usage(self, tmp_path) -> None:
+        state_file = tmp_path.joinpath('alphavantage_usage.json')
+
+        first = ApiKeyPool(['KEY1', 'KEY2'], state_file=state_file, governor=RateGovernor(60, 100))
+        first.acquire()
+        first.acquire()
+        first.acquire()
+
+        second = ApiKeyPool(['KEY1', 'KEY2'], state_file=state_file, governor=RateGovernor(60, 100))
+        assert sum(second.remaining().values()) == 197
+        assert 'KEY1' not in state_file.read_text()
+
+    def test_shared_usage_async(self, tmp_path, monkeypatch) -> None:
+        pool = ApiKeyPool(['KEY1'], state_file=tmp_path.joinpath('alphavantage_usage.json'),
+                          governor=RateGovernor(60, 100))
+        reserve = pool._reserve
+        threads = list()
+
+        def record_thread():
+            threads.append(threading.current_thread())
+            return reserve()
+
+        monkeypatch.setattr(pool, '_reserve', record_thread)
+
+        assert asyncio.run(pool.acquire_async()) == 'KEY1'
+        assert threads and threads[0] is not threading.main_thread()
+        assert pool.remaining() == {'KEY1': 99}
+
+
+class TestThrottlePayload:
+    def test_find_throttle(self) -> None:
+        assert alphavantage._find_throttle(_minute_note)
+        assert alphavantage._find_throttle(b'{"symbol": "IBM", "annualReports": []}') is None
+        assert alphavantage._find_throttle(b'symbol,name,reportDate') is None
+
+        with pytest.raises(ApiFailedError):
+            alphavantage._find_throttle(_demo_note)
+
+    def test_parsers_raise_throttled(self) -> None:
+        with pytest.raises(ApiThrottledError):
+            parse_company(_minute_note)
+
+        with pytest.raises(ApiThrottledError):
+            parse_financial_statements(_daily_note)
+
+        with pytest.raises(ApiFailedError):
+            parse_company(b'{"Error Message": "Invalid API call."}')
+
+        with pytest.raises(ApiFailedError):
+            parse_financial_statements(_demo_note)
+
+
+class TestFetch:
+    def test_demo_key(self, replay_transport) -> None:
+        clock = _Clock()
+        governor = RateGovernor(calls_per_minute=60, calls_per_day=10, clock=clock, today=lambda: clock.today)
+        pool = ApiKeyPool(['KEY1', 'KEY2'], governor=governor)
+        transport = replay_transport([_demo_note, b'{"Symbol": "IBM"}'])
+
+        with pytest.raises(ApiFailedError) as e:
+            alphavantage._get_alphavantage_data('OVERVIEW', 'IBM', pool)
+
+        assert not isinstance(e.value, ApiThrottledError)
+        assert len(transport.urls) == 1
+        assert governor.reserve('KEY1') == 0.0
+
+    def test_retry_after_throttle(self, replay_transport) -> None:
+        clock = _Clock()
+        governor = RateGovernor(calls_per_minute=60, calls_per_day=10, clock=clock, today=lambda: clock.today)
+        pool = ApiKeyPool(['KEY1', 'KEY2'], governor=governor)
+        transport = replay_transport([_minute_note, b'{"Symbol": "IBM"}'])
+
+        data = alphavantage._get_alphavantage_data('OVERVIEW', 'IBM', pool)
+        assert data == b'{"Symbol": "IBM"}'
+        assert len(transport.urls) == 2
+        assert transport.urls[0].endswith('apikey=KEY1')
+        assert transport.urls[1].endswith('apikey=KEY2')
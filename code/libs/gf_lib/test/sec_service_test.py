@@ -16,9 +16,87 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 
+import gf_lib.services as svc
 from gf_lib.services import get_sec_map
 
 
 def test_get_sec_map() -> None:
     data = get_sec_map('https://www.sec.gov/files/company_tickers.json')
     assert len(data) > 12_000
+
+
+class _Response:
+    def __init__(self, status_code: int, content: bytes = b'', headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or dict()
+
+
+class _ConditionalTransport(svc.HttpTransport):
+    def __init__(self, content: bytes, etag: str) -> None:
+        super().__init__()
+        self.content = content
+        self.etag = etag
+        self.requests = list()
+
+    def get(self, url: str, params: dict | None = None, headers: dict | None = None, stream: bool = False):
+        self.requests.append(headers or dict())
+        if headers and headers.get('If-None-Match') == self.etag:
+            return _Response(304)
+        return _Response(200, self.content, {'ETag': self.etag})
+
+
+class TestSecSnapshot:
+    _content = b'{"0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."}, ' \
+               b'"1": {"cik_str": 51143, "ticker": "ibm", "title": "International Business Machines"}}'
+
+    def test_conditional_download(self, tmp_path) -> None:
+        transport = _ConditionalTransport(self._content, '"v1"')
+        svc.set_transport(transport)
+        try:
+            first = svc.get_sec_map('https://www.sec.gov/files/company_tickers.json', tmp_path)
+            second = svc.get_sec_map('https://www.sec.gov/files/company_tickers.json', tmp_path)
+        finally:
+            svc.set_transport(None)
+
+        assert transport.requests[0] == dict()
+        assert transport.requests[1] == {'If-None-Match': '"v1"'}
+        assert [(row.ticker, row.cik_str, row.title) for row in first] == \
+               [(row.ticker, row.cik_str, row.title) for row in second]
+        assert second[1].cik_str == '0000051143'
+        assert second[1].ticker == 'IBM'
+        assert tmp_path.joinpath('company_tickers.json').read_bytes() == self._content
+
+    def test_changed_file(self, tmp_path) -> None:
+        svc.set_transport(_ConditionalTransport(self._content, '"v1"'))
+        try:
+            svc.get_sec_map('https://www.sec.gov/files/company_tickers.json', tmp_path)
+            svc.set_transport(_ConditionalTransport(b'{"0": {"cik_str": 1, "ticker": "X", "title": "X"}}', '"v2"'))
+            index = svc.get_sec_index('https://www.sec.gov/files/company_tickers.json', tmp_path)
+        finally:
+            svc.set_transport(None)
+
+        assert list(index) == ['X']
+
+    def test_archived(self, tmp_path) -> None:
+        url = 'https://www.sec.gov/files/company_tickers.json'
+        archive = svc.ResponseArchive(tmp_path.joinpath('archive'))
+
+        svc.set_transport(_ConditionalTransport(self._content, '"v1"'))
+        svc.set_archive(archive)
+        try:
+            svc.get_sec_map(url, tmp_path.joinpath('cache'))
+            svc.get_sec_map(url, tmp_path.joinpath('cache'))
+        finally:
+            svc.set_transport(None)
+            svc.set_archive(None)
+
+        assert archive.latest('sec', {'url': url}) == self._content
+
+        svc.set_archive(svc.ResponseArchive(archive.root, replay=True))
+        try:
+            index = svc.get_sec_index(url, tmp_path.joinpath('cache'))
+        finally:
+            svc.set_archive(None)
+
+        assert sorted(index) == ['AAPL', 'IBM']
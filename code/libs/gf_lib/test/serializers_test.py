@@ -0,0 +1,110 @@
+# *******************************************************************************************
+#  File:  serializers_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+import attrs
+import bson
+from bson.decimal128 import Decimal128
+import gf_lib.model as model
+from gf_lib.datastore import BsonPolicy, get_serializer, to_document, decode_entry, decode_statement
+
+
+def _asdict(value) -> dict:
+    return attrs.asdict(value, value_serializer=lambda _, __, item: item.value if isinstance(item, Enum) else item)
+
+
+class TestSerializers:
+    def test_statement(self) -> None:
+        record = model.IncomeStatement('IBM', 'quarter', [model.AccountingEntry('Revenue', value_1='10000'),
+                                                          model.AccountingEntry('Cost', value_2='500')])
+        document = to_document(record)
+
+        assert document == _asdict(record)
+        assert document['period_type'] == 'quarter'
+        assert type(document['period_type']) is str
+
+    def test_master(self) -> None:
+        record = model.Master('IBM', 'IBM Corporation', '51143', 'BBG000BLNNH6', 'IT Consulting',
+                              [model.IndexType.SP500, model.IndexType.SP100])
+
+        assert to_document(record) == _asdict(record)
+        assert to_document(record)['indexes'] == ['sp500', 'sp100']
+
+    def test_gics_sector(self) -> None:
+        industry = model.GICSIndustry(101_010, 'Energy Equipment', [model.GICSSubIndustry(10_101_010, 'Drilling')])
+        record = model.GICSSector(10, 'Energy', [model.GICSGroupIndustry(1_010, 'Energy', [industry])])
+
+        assert to_document(record) == _asdict(record)
+
+    def test_company_round_trip(self) -> None:
+        record = model.Company('IBM', 'IBM Corporation', 'Test Description', '0123456789', '012345678912', 'NYSE',
+                               'USD', 'USA', 'Test-Sub-Industry', 'Main Street', 'December', '2022-03-31')
+
+        assert attrs.asdict(model.Company.from_document(to_document(record))) == attrs.asdict(record)
+
+    def test_dates(self) -> None:
+        record = model.Earnings('IBM', report_date=date(2022, 7, 18), fiscal_year=datetime(2022, 6, 30))
+        document = to_document(record)
+
+        assert document['report_date'] == datetime(2022, 7, 18)
+        assert document['fiscal_year'] == datetime(2022, 6, 30)
+
+    def test_policy(self) -> None:
+        policy = BsonPolicy(enum=lambda value: value.name, date=lambda value: value.isoformat())
+        record = model.Earnings('IBM', report_date=date(2022, 7, 18))
+
+        assert to_document(model.IncomeStatement('IBM'), policy)['period_type'] == 'Annual'
+        assert to_document(record, policy)['report_date'] == '2022-07-18'
+        assert get_serializer(model.Earnings, policy) is get_serializer(model.Earnings, policy)
+        assert get_serializer(model.Earnings) is not get_serializer(model.Earnings, policy)
+
+    def test_policy_company(self) -> None:
+        policy = BsonPolicy(enum=lambda value: value.name)
+        record = model.Company('IBM', 'IBM Corporation', 'Test Description', '0123456789', '012345678912', 'NYSE',
+                               'USD', 'USA', 'Test-Sub-Industry', 'Main Street', 'December', '2022-03-31')
+
+        assert to_document(record, policy)['fiscal_year_end'] == 'December'
+        assert to_document(record)['fiscal_year_end'] == 'december'
+
+    def test_decimal(self) -> None:
+        entry = model.AccountingEntry('eps', '1.25', '10000', 'None').numeric()
+        document = to_document(entry)
+
+        assert document['value_1'] == Decimal128('1.25')
+        assert document['value_2'] == 10_000
+        assert document['value_3'] is None
+        assert model.AccountingEntry.from_document(decode_entry(document)) == entry
+
+    def test_int64_round_trip(self) -> None:
+        entry = model.AccountingEntry('totalRevenue', '365817000000', str(2 ** 31)).numeric()
+        loaded = model.AccountingEntry.from_document(decode_entry(bson.decode(bson.encode(to_document(entry)))))
+
+        assert loaded == entry
+        assert type(loaded.value_1) is int
+        assert loaded.value_2 == 2 ** 31
+
+    def test_decode_statement(self) -> None:
+        entry = model.AccountingEntry('totalRevenue', '365817000000', '1.5', 'None').numeric()
+        statement = model.IncomeStatement('IBM', items=[entry])
+        document = decode_statement(bson.decode(bson.encode(to_document(statement))))
+
+        assert type(document['items'][0]['value_1']) is int
+        assert document['items'][0]['value_2'] == Decimal('1.5')
+        assert model.IncomeStatement.from_document(document).items == [entry]
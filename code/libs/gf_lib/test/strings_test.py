@@ -0,0 +1,79 @@
+# *******************************************************************************************
+#  File:  strings_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+import sys
+from datetime import datetime
+import gf_lib.model as model
+from gf_lib.utils import StringPool, get_string_pool
+
+
+def _copy(value: str) -> str:
+    return ''.join(list(value))
+
+
+class TestStringPool:
+    def test_intern(self) -> None:
+        pool = StringPool()
+        first = pool.intern(_copy('New York Stock Exchange'))
+        second = _copy('New York Stock Exchange')
+
+        assert second is not first
+        assert pool.intern(second) is first
+        assert pool.intern(None) is None
+        assert len(pool) == 1
+
+    def test_stats(self) -> None:
+        pool = StringPool()
+        values = [_copy('USD') for _ in range(10)]
+        for value in values:
+            pool.intern(value)
+
+        stats = pool.stats()
+        assert stats.distinct == 1
+        assert stats.lookups == 10
+        assert stats.shared == 9
+        assert stats.saved_bytes == 9 * sys.getsizeof('USD')
+
+        pool.clear()
+        assert pool.stats().lookups == 0
+        assert pool.stats().not_pooled == 0
+        assert 'USD' not in pool
+
+    def test_max_size(self) -> None:
+        pool = StringPool(max_size=2)
+        pool.intern('USD')
+        pool.intern('EUR')
+        value = _copy('GBP')
+
+        assert pool.intern(value) is value
+        assert pool.intern(_copy('USD')) is not value
+        assert len(pool) == 2
+        assert 'GBP' not in pool
+        assert pool.stats().not_pooled == 1
+
+    def test_load(self) -> None:
+        document = {'ticker': 'IBM', 'name': _copy('IBM'), 'report_date': datetime(2022, 7, 18),
+                    'fiscal_year': datetime(2022, 6, 30), 'estimate': '2.27', 'currency': _copy('USD'),
+                    'metadata': {'lock_version': 1, 'created_at': datetime(2022, 1, 1),
+                                 'updated_at': datetime(2022, 1, 1)}}
+        first = model.Earnings.from_document(document)
+        second = model.Earnings.from_document({**document, 'currency': _copy('USD')})
+
+        assert first.currency is second.currency
+        assert 'IBM' not in get_string_pool()
+        assert get_string_pool().intern(_copy('USD')) is first.currency
@@ -0,0 +1,68 @@
+# *******************************************************************************************
+#  File:  transport_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+import subprocess
+import sys
+import gf_lib.services as svc
+
+
+class TestHttpTransport:
+    def test_shared_instance(self) -> None:
+        assert svc.get_transport() is svc.get_transport()
+
+    def test_set_transport(self) -> None:
+        transport = svc.HttpTransport(timeout=(1.0, 2.0))
+        svc.set_transport(transport)
+        try:
+            assert svc.get_transport() is transport
+            assert svc.get_transport().timeout == (1.0, 2.0)
+        finally:
+            svc.set_transport(None)
+
+        assert svc.get_transport() is not transport
+
+    def test_lazy_aiohttp(self) -> None:
+        code = 'import sys, gf_lib.services; print("aiohttp" in sys.modules)'
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+
+        assert output.strip() == 'False'
+
+    def test_session(self) -> None:
+        svc.set_transport(None)
+        transport = svc.get_transport()
+        session = transport._session
+        adapter = session.get_adapter('https://www.alphavantage.co')
+
+        assert svc.get_transport()._session is session
+        assert session.headers['User-Agent'] == 'Good Fundamentals james@developernotes.org'
+        assert transport.timeout == (10.0, 60.0)
+        assert (adapter._pool_connections, adapter._pool_maxsize) == (10, 20)
+        assert session.get_adapter('http://www.sec.gov') is adapter
+
+    def test_set_transport_swaps(self) -> None:
+        first = svc.get_transport()
+        transport = svc.HttpTransport(pool_connections=2, pool_maxsize=4)
+        svc.set_transport(transport)
+        try:
+            adapter = svc.get_transport()._session.get_adapter('https://www.sec.gov')
+
+            assert svc.get_transport() is transport
+            assert svc.get_transport() is not first
+            assert (adapter._pool_connections, adapter._pool_maxsize) == (2, 4)
+        finally:
+            svc.set_transport(None)
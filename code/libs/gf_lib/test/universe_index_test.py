@@ -0,0 +1,78 @@
+# *******************************************************************************************
+#  File:  universe_index_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+import gf_lib.model as model
+from gf_lib.model import IndexType
+
+_GICS = [
+    {'id': 10, 'name': 'Energy', 'items': [
+        {'id': 1010, 'name': 'Energy', 'items': [
+            {'id': 101010, 'name': 'Energy Equipment & Services', 'items': [
+                {'id': 10101010, 'name': 'Oil & Gas Drilling'}]}]}]},
+    {'id': 45, 'name': 'Information Technology', 'items': [
+        {'id': 4510, 'name': 'Software & Services', 'items': [
+            {'id': 451020, 'name': 'IT Services', 'items': [
+                {'id': 45102010, 'name': 'IT Consulting & Other Services'}]}]}]}
+]
+
+
+def _master(ticker: str, sub_industry: str, indexes: list[IndexType]) -> model.Master:
+    return model.Master(ticker, ticker, '0000000001', 'BBG000000001', sub_industry, indexes)
+
+
+def _universe() -> model.UniverseIndex:
+    records = [_master('IBM', 'IT Consulting & Other Services', [IndexType.SP500, IndexType.SP100]),
+               _master('ACN', 'IT Consulting & Other Services', [IndexType.SP500]),
+               _master('HP', 'Oil & Gas Drilling', [IndexType.SP400]),
+               _master('NBR', 'Oil & Gas Drilling', [IndexType.SP600])]
+    return model.UniverseIndex.from_masters(records, model.GicsIndex.from_data(_GICS))
+
+
+class TestUniverseIndex:
+    def test_ids(self) -> None:
+        universe = _universe()
+
+        assert len(universe) == 4
+        assert universe.id_of('HP') == 2
+        assert universe.ticker_of(0) == 'IBM'
+        assert 'NBR' in universe
+
+    def test_indexes(self) -> None:
+        universe = _universe()
+        screen = universe.index(IndexType.SP500) & ~universe.index(IndexType.SP100)
+
+        assert universe.tickers(screen) == ['ACN']
+        assert universe.count(~universe.index(IndexType.SP500)) == 2
+        assert universe.tickers(universe.all() & ~universe.bits_of(['IBM', 'XYZ'])) == ['ACN', 'HP', 'NBR']
+        assert universe.has(universe.index(IndexType.SP100), 'IBM')
+
+    def test_gics(self) -> None:
+        universe = _universe()
+
+        assert universe.tickers(universe.gics(10)) == ['HP', 'NBR']
+        assert universe.tickers(universe.gics(45102010) & universe.index(IndexType.SP100)) == ['IBM']
+        assert universe.gics(15) == 0
+
+    def test_replace(self) -> None:
+        universe = _universe()
+        universe.add(_master('ACN', 'Oil & Gas Drilling', [IndexType.SP100]))
+
+        assert universe.id_of('ACN') == 1
+        assert universe.tickers(universe.index(IndexType.SP100)) == ['IBM', 'ACN']
+        assert universe.tickers(universe.index(IndexType.SP500)) == ['IBM']
+        assert universe.tickers(universe.gics(45)) == ['IBM']
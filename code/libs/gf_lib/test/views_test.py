@@ -0,0 +1,58 @@
+# *******************************************************************************************
+#  File:  views_test.py
+#
+#  Created: 17-10-2026
+#
+#  Copyright (c) 2026 James Dooley <james@dooley.ch>
+#
+#  History:
+#  17-10-2026: Initial version
+#
+# *******************************************************************************************
+
+__author__ = "James Dooley"
+__license__ = "MIT"
+__version__ = "1.0.0"
+__maintainer__ = "James Dooley"
+__status__ = "Production"
+
+import bson
+import pytest
+from bson.raw_bson import RawBSONDocument
+import gf_lib.model as model
+from gf_lib.datastore import DocumentView, StatementView, to_document
+
+
+def _raw(value) -> RawBSONDocument:
+    return RawBSONDocument(bson.encode(to_document(value)))
+
+
+class TestViews:
+    def test_fields(self) -> None:
+        record = model.Master('IBM', 'IBM Corporation', '51143', 'BBG000BLNNH6', 'IT Consulting',
+                              [model.IndexType.SP500])
+        view = DocumentView(_raw(record), model.Master)
+
+        assert view.ticker == 'IBM'
+        assert view['cik'] == '0000051143'
+        assert view.indexes == ['sp500']
+        assert 'figi' in view
+        assert view.get('missing') is None
+        with pytest.raises(AttributeError):
+            _ = view.missing
+
+    def test_to_model(self) -> None:
+        record = model.IncomeStatement('IBM', 'annual', [model.AccountingEntry('totalRevenue', value_1='100')])
+        view = StatementView(_raw(record), model.IncomeStatement)
+
+        assert view.to_model() == record
+        assert view.values('totalRevenue') == ['100', '', '', '', '']
+        assert view.entry('netIncome') is None
+
+    def test_projected(self) -> None:
+        raw = RawBSONDocument(bson.encode({'ticker': 'IBM'}))
+        view = DocumentView(raw, model.Master, complete=False)
+
+        assert view.ticker == 'IBM'
+        with pytest.raises(ValueError):
+            view.to_model()
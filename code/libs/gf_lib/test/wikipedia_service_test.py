@@ -16,8 +16,48 @@ __version__ = "1.0.0"
 __maintainer__ = "James Dooley"
 __status__ = "Production"
 
+import asyncio
 import gf_lib.services as services
 
+_sp500_page = """
+<html><body>
+<table id="constituents">
+<tbody>
+<tr>
+<th>Symbol</th>
+<th>Security</th>
+<th>SEC filings</th>
+<th>GICS Sector</th>
+<th>GICS Sub-Industry</th>
+<th>Headquarters Location</th>
+<th>Date added</th>
+<th>CIK</th>
+</tr>
+<tr>
+<td>MMM</td>
+<td>3M</td>
+<td>reports</td>
+<td>Industrials</td>
+<td>Industrial Conglomerates</td>
+<td>Saint Paul, Minnesota</td>
+<td>1957-03-04</td>
+<td>0000066740</td>
+</tr>
+<tr>
+<td>AOS</td>
+<td>A. O. Smith</td>
+<td>reports</td>
+<td>Industrials</td>
+<td>Building Products</td>
+<td>Milwaukee, Wisconsin</td>
+<td>2017-07-26</td>
+<td>0000091142</td>
+</tr>
+</tbody>
+</table>
+</body></html>
+"""
+
 
 def test_get_sp600() -> None:
     data = services.get_sp600('https://en.wikipedia.org/wiki/List_of_S%26P_600_companies')
@@ -29,6 +69,22 @@ def test_get_sp400() -> None:
     assert len(data) >= 395
 
 
+def test_parse_sp500() -> None:
+    data = services.parse_sp500(_sp500_page.encode('utf-8'))
+    assert len(data) == 2
+    assert data[0].ticker == 'MMM'
+    assert data[0].cik == '0000066740'
+    assert data[1].sub_industry == 'Building Products'
+
+
+def test_parse_sp500_pool() -> None:
+    with services.ParsePool(max_workers=1) as pool:
+        data = list(pool.map('sp500', [_sp500_page.encode('utf-8')] * 2))
+
+    assert data == [services.parse_sp500(_sp500_page.encode('utf-8'))] * 2
+    assert data[0][1].sub_industry == 'Building Products'
+
+
 def test_get_sp500() -> None:
     data = services.get_sp500('https://en.wikipedia.org/wiki/List_of_S%26P_500_companies')
     assert len(data) >= 495
@@ -37,3 +93,14 @@ def test_get_sp500() -> None:
 def test_get_sp100() -> None:
     data = services.get_sp100_tickers('https://en.wikipedia.org/wiki/S%26P_100')
     assert len(data) >= 95
+
+
+def test_get_sp500_async() -> None:
+    async def run() -> list[services.SpEntry]:
+        try:
+            return await services.get_sp500_async('https://en.wikipedia.org/wiki/List_of_S%26P_500_companies')
+        finally:
+            await services.close_async_transport()
+
+    data = asyncio.run(run())
+    assert len(data) >= 495